@@ -11,10 +11,15 @@ if os.path.exists(venv_path):
 import debug_widget_parent
 
 from ignis import utils
+import tracelog
+
+# Startup traces are kept in memory; dump them with `ignis run-command trace-dump`
+tracelog.register_commands()
+log = tracelog.get_logger("config")
 
 def debug_log(msg):
     """Helper to log debug messages."""
-    print(f"[CONFIG] {msg}", file=sys.stderr)
+    log.info("%s", msg)
 from ignis.services.wallpaper import WallpaperService
 from services.wallpaper_slideshow import WallpaperSlideshowService
 from modules import (
@@ -162,7 +167,7 @@ if user_options.dock.enabled:
             Dock(monitor)
             debug_log(f"Dock {monitor} created")
         except Exception as e:
-            debug_log(f"ERROR creating Dock {monitor}: {e}")
+            log.error("Failed to create Dock %s: %s", monitor, e)
             import traceback
             traceback.print_exc()
 else:
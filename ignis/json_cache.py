@@ -0,0 +1,84 @@
+"""
+Directory of JSON files with least recently used pruning.
+
+Used for caches keyed by content or file identity (wallpaper palettes,
+media art colors), whose keys change whenever the source does and would
+otherwise leave stale files behind forever.
+"""
+import os
+import json
+import threading
+from typing import Any, Optional
+
+
+def _mtime(entry: os.DirEntry) -> float:
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return 0.0  # Removed meanwhile
+
+
+class JsonFileCache:
+    """JSON files named ``<key>.json`` in ``directory``.
+
+    At most ``max_files`` files are kept; reading a file marks it as used,
+    and the least recently used ones are pruned after each store. Files are
+    written to a per-thread temp file and moved into place, so several
+    threads can share one directory and readers never see partial files.
+    """
+
+    def __init__(self, directory: str, max_files: int):
+        self._directory = directory
+        self._max_files = max(1, max_files)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Any]:
+        """Get the data stored under a key, or None if missing or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            # Keeps recently used files from being pruned
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return data
+
+    def store(self, key: str, data: Any) -> None:
+        """Write data under a key, then prune old files.
+
+        Failures are ignored: the cache is an optimization and callers keep
+        their in-memory copy.
+        """
+        path = self._path(key)
+        tmp_file = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, path)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            return
+        self.prune()
+
+    def prune(self) -> None:
+        """Delete the least recently used files beyond ``max_files``."""
+        try:
+            files = [entry for entry in os.scandir(self._directory) if entry.name.endswith(".json")]
+        except OSError:
+            return
+        if len(files) <= self._max_files:
+            return
+
+        files.sort(key=_mtime)
+        for entry in files[: len(files) - self._max_files]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass  # Already pruned by another thread
@@ -2,8 +2,10 @@ from ignis import widgets
 from ignis.window_manager import WindowManager
 from ignis.services.applications import ApplicationsService, Application
 from ignis.menu_model import IgnisMenuModel, IgnisMenuItem, IgnisMenuSeparator
+from services.app_index import AppIndexService
 
 applications = ApplicationsService.get_default()
+app_index = AppIndexService.get_default()
 window_manager = WindowManager.get_default()
 
 TERMINAL_FORMAT = "kitty %command%"
@@ -36,16 +38,28 @@ class AppItem(widgets.Button):
 
 class Apps(widgets.Box):
     def __init__(self):
+        # Items are reused across pin changes, keyed by desktop id, and
+        # dropped when the application list changes
+        self._items: dict[str, AppItem] = {}
+        app_index.connect("changed", lambda *args: self._items.clear())
+
+        self._launcher_button = widgets.Button(
+            child=widgets.Icon(image="start-here-symbolic", pixel_size=32),
+            on_click=lambda x: window_manager.toggle_window("ignis_LAUNCHER"),
+            css_classes=["pinned-app", "unset"],
+        )
+
         super().__init__(
             child=applications.bind(
                 "pinned",
-                transform=lambda value: [AppItem(app) for app in value]
-                + [
-                    widgets.Button(
-                        child=widgets.Icon(image="start-here-symbolic", pixel_size=32),
-                        on_click=lambda x: window_manager.toggle_window("ignis_LAUNCHER"),
-                        css_classes=["pinned-app", "unset"],
-                    )
-                ],
+                transform=lambda value: [self.__get_item(app) for app in value]
+                + [self._launcher_button],
             )
         )
+
+    def __get_item(self, app: Application) -> AppItem:
+        item = self._items.get(app.id)
+        if item is None:
+            item = AppItem(app)
+            self._items[app.id] = item
+        return item
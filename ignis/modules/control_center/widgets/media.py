@@ -1,4 +1,8 @@
 import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
 
 import ignis
 import asyncio
@@ -7,6 +11,8 @@ from ignis.services.mpris import MprisService, MprisPlayer
 from ignis import utils
 from jinja2 import Template
 from ignis.css_manager import CssManager, CssInfoString
+from user_options import user_options
+from .media_colors import ArtColorCache
 
 
 # Lazy initialization - don't initialize services at import time
@@ -42,8 +48,59 @@ def get_material_service():
 MEDIA_TEMPLATE = utils.get_current_dir() + "/media.scss"
 MEDIA_SCSS_CACHE_DIR = ignis.CACHE_DIR + "/media"  # type: ignore
 MEDIA_ART_FALLBACK = utils.get_current_dir() + "/../../../misc/media-art-fallback.png"
+MEDIA_COLORS_CACHE_DIR = MEDIA_SCSS_CACHE_DIR + "/colors"
 os.makedirs(MEDIA_SCSS_CACHE_DIR, exist_ok=True)
 
+# Compiled stylesheets kept in memory (e.g. for skipping back a track)
+MEDIA_CSS_MEMORY_SIZE = 16
+
+_media_template = None
+_art_colors = None
+_compiled_css: OrderedDict[str, str] = OrderedDict()
+_compiled_css_lock = threading.Lock()
+
+
+def get_media_template() -> Template:
+    """Lazy load and compile the media stylesheet template once"""
+    global _media_template
+    if _media_template is None:
+        with open(MEDIA_TEMPLATE) as file:
+            _media_template = Template(file.read())
+    return _media_template
+
+
+def get_art_colors() -> ArtColorCache:
+    """Lazy create the art color cache"""
+    global _art_colors
+    if _art_colors is None:
+        _art_colors = ArtColorCache(
+            lambda path: get_material_service().get_colors_from_img(path, True),
+            MEDIA_COLORS_CACHE_DIR,
+        )
+    return _art_colors
+
+
+def build_media_css(art_url: str, desktop_entry: str, scheme_type: str) -> str:
+    """Render and compile the stylesheet of a player (blocking, for worker threads)"""
+    colors = get_art_colors().get(art_url, scheme_type)
+    colors["art_url"] = art_url
+    colors["desktop_entry"] = desktop_entry
+    scss = get_media_template().render(colors)
+
+    key = hashlib.md5(scss.encode()).hexdigest()
+    with _compiled_css_lock:
+        css = _compiled_css.get(key)
+        if css is not None:
+            _compiled_css.move_to_end(key)
+            return css
+
+    css = utils.sass_compile(string=scss)
+    with _compiled_css_lock:
+        _compiled_css[key] = css
+        while len(_compiled_css) > MEDIA_CSS_MEMORY_SIZE:
+            _compiled_css.popitem(last=False)
+    return css
+
 
 PLAYER_ICONS = {
     "spotify": "spotify-symbolic",
@@ -57,6 +114,9 @@ class Player(widgets.Revealer):
     def __init__(self, player: MprisPlayer) -> None:
         self._player = player
         self._colors_path = f"{MEDIA_SCSS_CACHE_DIR}/{self.clean_desktop_entry()}.scss"
+        self._pending_art: Optional[str] = None
+        self._colors_loading = False
+        self._closed = False
         player.connect("closed", lambda x: self.destroy())
         player.connect("notify::art-url", lambda x, y: self.load_colors())
         self.load_colors()
@@ -203,6 +263,8 @@ class Player(widgets.Revealer):
         return PLAYER_ICONS[None]
 
     def destroy(self) -> None:
+        self._closed = True
+        self._pending_art = None
         self.set_reveal_child(False)
         utils.Timeout(self.transition_duration, super().unparent)
 
@@ -210,26 +272,45 @@ class Player(widgets.Revealer):
         return f"{class_name}-{self.clean_desktop_entry()}"
 
     def load_colors(self) -> None:
-        if not self._player.art_url:
-            art_url = MEDIA_ART_FALLBACK
-        else:
-            art_url = self._player.art_url
+        """Recolor the player for its current art without blocking the UI.
 
-        colors = get_material_service().get_colors_from_img(art_url, True)
-        colors["art_url"] = art_url
-        colors["desktop_entry"] = self.clean_desktop_entry()
+        Colors are extracted and the stylesheet compiled on a worker thread.
+        While one track is being processed only the latest art is kept, so
+        skipping through tracks runs matugen at most once more.
+        """
+        self._pending_art = self._player.art_url or MEDIA_ART_FALLBACK
+        if not self._colors_loading:
+            self._colors_loading = True
+            asyncio.create_task(self.__load_colors())
 
-        with open(MEDIA_TEMPLATE) as file:
-            template_rendered = Template(file.read()).render(colors)
+    async def __load_colors(self) -> None:
+        try:
+            while self._pending_art is not None:
+                art_url, self._pending_art = self._pending_art, None
+                try:
+                    css = await asyncio.to_thread(
+                        build_media_css,
+                        art_url,
+                        self.clean_desktop_entry(),
+                        user_options.material.matugen_scheme_type,
+                    )
+                except Exception as e:
+                    print(f"Failed to load media colors for {art_url}: {e}")
+                    continue
+                # A newer track arrived meanwhile; only its colors matter
+                if self._pending_art is None and not self._closed:
+                    self.__apply_css(css)
+        finally:
+            self._colors_loading = False
 
+    def __apply_css(self, css: str) -> None:
         if self._player.desktop_entry in get_css_manager().list_css_info_names():
             get_css_manager().remove_css(self._player.desktop_entry)
 
         get_css_manager().apply_css(
             CssInfoString(
                 name=self._player.desktop_entry,
-                compiler_function=lambda string: utils.sass_compile(string=string),
-                string=template_rendered,
+                string=css,
             )
         )
 
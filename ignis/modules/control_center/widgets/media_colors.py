@@ -0,0 +1,101 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+from json_cache import JsonFileCache
+
+# Art palettes kept in memory
+ART_COLORS_MEMORY_SIZE = 64
+
+# Art palettes kept on disk; the least recently used files are pruned
+ART_COLORS_DISK_SIZE = 256
+
+
+class ArtColorCache:
+    """Colors extracted from media art, keyed by the content of the image.
+
+    Players often hand out a new art URL (or re-download the same cover to
+    a new file) for every track, so colors are stored by the hash of the
+    image content and the ``variant`` they were extracted for (e.g. the
+    matugen scheme type), in memory and as JSON files in ``cache_dir``.
+    The path -> content hash mapping is remembered per file modification
+    time, so a known file is not even read again. At most ``disk_size``
+    files are kept, least recently used pruned first.
+
+    ``get`` may run matugen through ``extract`` and is meant for worker
+    threads.
+    """
+
+    def __init__(
+        self,
+        extract: Callable[[str], dict],
+        cache_dir: str,
+        memory_size: int = ART_COLORS_MEMORY_SIZE,
+        disk_size: int = ART_COLORS_DISK_SIZE,
+    ):
+        self._extract = extract
+        self._files = JsonFileCache(cache_dir, disk_size)
+        self._memory_size = max(1, memory_size)
+        self._lock = threading.Lock()
+        # (path, mtime_ns, size) -> content hash, oldest first
+        self._hashes: OrderedDict[tuple, str] = OrderedDict()
+        # "content hash-variant" -> colors, least recently used first
+        self._colors: OrderedDict[str, dict] = OrderedDict()
+
+    @staticmethod
+    def _file_key(path: str) -> Optional[tuple]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.md5()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _remember(self, key: str, colors: dict) -> None:
+        with self._lock:
+            self._colors[key] = colors
+            self._colors.move_to_end(key)
+            while len(self._colors) > self._memory_size:
+                self._colors.popitem(last=False)
+
+    def get(self, path: str, variant: str = "") -> dict:
+        """Get the colors of an image, extracting them if unknown.
+
+        Raises OSError if the image cannot be read, and whatever ``extract``
+        raises.
+        """
+        file_key = self._file_key(path)
+        if file_key is None:
+            raise OSError(f"Art not found: {path}")
+
+        with self._lock:
+            content_hash = self._hashes.get(file_key)
+        if content_hash is None:
+            content_hash = self._hash_file(path)
+            with self._lock:
+                self._hashes[file_key] = content_hash
+                while len(self._hashes) > self._memory_size * 4:
+                    self._hashes.popitem(last=False)
+
+        key = f"{content_hash}-{variant}"
+        with self._lock:
+            colors = self._colors.get(key)
+            if colors is not None:
+                self._colors.move_to_end(key)
+                return dict(colors)
+
+        colors = self._files.load(key)
+        if not isinstance(colors, dict):
+            colors = self._extract(path)
+            self._files.store(key, colors)
+
+        self._remember(key, colors)
+        return dict(colors)
@@ -1,108 +1,131 @@
 from ignis import widgets
-from ignis.services.notifications import Notification, NotificationService
-from ignis import utils
-from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import Optional
+from services.notification_store import NotificationStoreService, NotificationGroup
 from ...shared_widgets import NotificationWidget
 
 # Lazy initialization - don't initialize services at import time
-_notifications = None
+_notification_store = None
 
 
-def get_notifications():
-    """Lazy load NotificationService"""
-    global _notifications
-    if _notifications is None:
-        _notifications = NotificationService.get_default()
-    return _notifications
+def get_notification_store():
+    """Lazy load NotificationStoreService"""
+    global _notification_store
+    if _notification_store is None:
+        _notification_store = NotificationStoreService.get_default()
+    return _notification_store
 
 
-class Popup(widgets.Revealer):
-    def __init__(self, notification: Notification, **kwargs):
-        widget = NotificationWidget(notification)
-        super().__init__(child=widget, transition_type="slide_down", **kwargs)
+class NotificationGroupRow(widgets.Box):
+    """A recyclable list row showing one notification group.
 
-        notification.connect("closed", lambda x: self.destroy())
+    Collapsed groups show only their latest notification and a button to
+    expand the rest.
+    """
 
-    def destroy(self):
-        self.reveal_child = False
-        utils.Timeout(self.transition_duration, self.unparent)
+    def __init__(self):
+        self._group: Optional[NotificationGroup] = None
+        self._handler_ids: list[int] = []
+        self._toggle_label = widgets.Label()
+        self._toggle = widgets.Button(
+            child=self._toggle_label,
+            halign="start",
+            css_classes=["notification-group-toggle"],
+            on_click=lambda x: self.__toggle(),
+        )
+        super().__init__(vertical=True)
+
+    def bind(self, group: NotificationGroup) -> None:
+        """Build the widgets of a group (main thread only)."""
+        self._group = group
+        self._handler_ids = [
+            group.connect("changed", lambda x: self.__rebuild()),
+            group.connect("notify::expanded", lambda *args: self.__rebuild()),
+        ]
+        self.__rebuild()
+
+    def unbind(self) -> None:
+        if self._group:
+            for handler_id in self._handler_ids:
+                self._group.disconnect(handler_id)
+        self._handler_ids = []
+        self._group = None
+        self.child = []
+
+    def __toggle(self) -> None:
+        if self._group:
+            self._group.expanded = not self._group.expanded
+
+    def __rebuild(self) -> None:
+        group = self._group
+        notifications = group.notifications
+        shown = notifications if group.expanded else notifications[:1]
+        children = [NotificationWidget(notification) for notification in shown]
+
+        if len(notifications) > 1:
+            self._toggle_label.label = (
+                "Show less" if group.expanded else f"{len(notifications) - 1} more from {group.app_name}"
+            )
+            children.append(self._toggle)
+        self.child = children
 
 
 class NotificationList(widgets.Box):
+    """Notification groups backed by the store's list model.
+
+    Only rows scrolled into view get widgets; they are built on the main
+    thread when GTK binds them and recycled while scrolling.
+    """
+
     __gtype_name__ = "NotificationList"
 
     def __init__(self):
-        notifications = get_notifications()
-        loading_notifications_label = widgets.Label(
-            label="Loading notifications...",
-            valign="center",
-            vexpand=True,
-            css_classes=["notification-center-info-label"],
-        )
+        store = get_notification_store()
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self.__on_item_setup)
+        factory.connect("bind", self.__on_item_bind)
+        factory.connect("unbind", self.__on_item_unbind)
 
         super().__init__(
             vertical=True,
-            child=[loading_notifications_label],
             vexpand=True,
-            css_classes=["rec-unset"],
-            setup=lambda self: notifications.connect(
-                "notified",
-                lambda x, notification: self.__on_notified(notification),
-            ),
-        )
-
-        utils.ThreadTask(
-            self.__load_notifications,
-            lambda result: self.__set_notifications(result),
-        ).run()
-
-    def __set_notifications(self, widgets_list):
-        """Set notification widgets from list - runs in main thread."""
-        # Remove all existing children
-        child = self.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.remove(child)
-            child = next_child
-
-        # Add notification widgets
-        for widget in widgets_list:
-            self.append(widget)
-
-    def __on_notified(self, notification: Notification) -> None:
-        notify = Popup(notification)
-        self.prepend(notify)
-        notify.reveal_child = True
-
-    def __load_notifications(self) -> list[widgets.Label | Popup]:
-        """Load notifications in background thread (widget creation is safe)."""
-        notifications = get_notifications()
-        contents: list[widgets.Label | Popup] = []
-
-        # Create notification widgets (safe to create in background, just not modify tree)
-        for notification in notifications.notifications:
-            contents.append(Popup(notification, reveal_child=True))
-
-        # Add "No notifications" label
-        contents.append(
-            widgets.Label(
-                label="No notifications",
-                valign="center",
-                vexpand=True,
-                visible=notifications.bind(
-                    "notifications", lambda value: len(value) == 0
+            child=[
+                # The ListView must be the direct child of the Scroll to virtualize
+                widgets.Scroll(
+                    vexpand=True,
+                    visible=store.bind("count", lambda value: value > 0),
+                    child=Gtk.ListView(
+                        model=Gtk.NoSelection(model=store.model),
+                        factory=factory,
+                        css_classes=["notification-list", "rec-unset"],
+                    ),
                 ),
-                css_classes=["notification-center-info-label"],
-            )
+                widgets.Label(
+                    label="No notifications",
+                    valign="center",
+                    vexpand=True,
+                    visible=store.bind("count", lambda value: value == 0),
+                    css_classes=["notification-center-info-label"],
+                ),
+            ],
         )
-        return contents
+
+    def __on_item_setup(self, factory, list_item: Gtk.ListItem) -> None:
+        list_item.set_child(NotificationGroupRow())
+
+    def __on_item_bind(self, factory, list_item: Gtk.ListItem) -> None:
+        list_item.get_child().bind(list_item.get_item())
+
+    def __on_item_unbind(self, factory, list_item: Gtk.ListItem) -> None:
+        list_item.get_child().unbind()
 
 
 class NotificationCenter(widgets.Box):
     __gtype_name__ = "NotificationCenter"
 
     def __init__(self):
-        notifications = get_notifications()
+        store = get_notification_store()
         super().__init__(
             vertical=True,
             vexpand=True,
@@ -112,9 +135,7 @@ class NotificationCenter(widgets.Box):
                     css_classes=["notification-center-header", "rec-unset"],
                     child=[
                         widgets.Label(
-                            label=notifications.bind(
-                                "notifications", lambda value: str(len(value))
-                            ),
+                            label=store.bind("count", str),
                             css_classes=["notification-count"],
                         ),
                         widgets.Label(
@@ -125,14 +146,11 @@ class NotificationCenter(widgets.Box):
                             child=widgets.Label(label="Clear all"),
                             halign="end",
                             hexpand=True,
-                            on_click=lambda x: notifications.clear_all(),
+                            on_click=lambda x: store.clear_all(),
                             css_classes=["notification-clear-all"],
                         ),
                     ],
                 ),
-                widgets.Scroll(
-                    child=NotificationList(),
-                    vexpand=True,
-                ),
+                NotificationList(),
             ],
         )
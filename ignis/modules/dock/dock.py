@@ -1,46 +1,28 @@
 """
 Dock window - Main dock implementation.
 """
-import sys
-print("[DOCK] Starting dock.py import", file=sys.stderr)
-
 from gi.repository import GLib
-print("[DOCK] Imported GLib", file=sys.stderr)
 
 from ignis import widgets
-print("[DOCK] Imported widgets", file=sys.stderr)
 
 # Defer ApplicationsService import - it's expensive (scans desktop files)
-# Import moved to get_apps_service() function below
-print("[DOCK] Skipping ApplicationsService import (deferred)", file=sys.stderr)
+# The dock model imports it; see get_dock_model()
+from .dock_item import DockItem, get_dock_model
 
-from .dock_item import DockItem
-print("[DOCK] Imported DockItem", file=sys.stderr)
+from .reconcile import diff_keys
 
 from user_options import user_options
-print("[DOCK] Imported user_options", file=sys.stderr)
-
-
-# Lazy initialization - don't import or initialize services at module load time
-_apps_service = None
-
-def get_apps_service():
-    """Lazy load ApplicationsService (deferred import + initialization)"""
-    global _apps_service
-    if _apps_service is None:
-        print("[DOCK] Importing ApplicationsService module...", file=sys.stderr)
-        from ignis.services.applications import ApplicationsService
-        print("[DOCK] ApplicationsService imported, initializing...", file=sys.stderr)
-        _apps_service = ApplicationsService.get_default()
-        print("[DOCK] ApplicationsService initialized", file=sys.stderr)
-    return _apps_service
-
+from tracelog import get_logger
 
-print("[DOCK] Defining Dock class...", file=sys.stderr)
+log = get_logger("dock")
 
 
 class Dock(widgets.Window):
-    """Application dock with pinned and running apps."""
+    """Application dock with pinned and running apps.
+
+    Entries come from the shared DockModelService; each dock (one per
+    monitor) only keeps its own widgets in sync with the model.
+    """
 
     __gtype_name__ = "Dock"
 
@@ -58,7 +40,9 @@ class Dock(widgets.Window):
         css_classes = ["dock", f"position-{position}"]
 
         # Create dock items
+        self._model = get_dock_model()
         self._items = []
+        self._items_by_id = {}
         self._dock_box = widgets.Box(
             orientation="vertical" if vertical else "horizontal",
             css_classes=["dock-container"],
@@ -101,10 +85,11 @@ class Dock(widgets.Window):
         self.monitor = monitor
         self.position = position
 
-        # TODO: Listen to app changes when WindowManager integration is added
-        # ApplicationsService doesn't emit a "changed" signal
-        # Will need to connect to WindowManager signals for running app tracking
-        # apps_service.connect("changed", lambda *_: self._on_apps_changed())
+        # Mirror the shared model; only affected items are touched
+        self._model.connect("changed", lambda *_: self._on_apps_changed())
+        self._model.connect("entry-changed", self._on_entry_changed)
+        self._model.connect("reset", lambda *_: self._on_installed_apps_changed())
+        log.debug("Dock %s created with %d items", monitor, len(self._items))
 
         # Setup auto-hide if enabled
         if self._auto_hide_enabled and enabled:
@@ -120,82 +105,62 @@ class Dock(widgets.Window):
             return ["right", "top", "bottom"]
         return ["bottom", "left", "right"]  # fallback
 
+    def _create_item(self, entry) -> DockItem:
+        item = DockItem(entry.app, pinned=entry.pinned, running=entry.running)
+        self._items_by_id[entry.app_id] = item
+        return item
+
     def _build_dock_items(self) -> list:
-        """Build list of dock items (pinned apps only for now)."""
-        items = []
-        pinned_ids = user_options.dock.pinned_apps
-
-        # Note: ApplicationsService doesn't track running apps
-        # TODO: Integrate with WindowManager service for running app tracking
-
-        # Add pinned apps
-        for app_id in pinned_ids:
-            app = self._find_app(app_id)
-            if app:
-                # For now, treat all pinned apps as not running
-                # TODO: Check actual running state via window manager
-                item = DockItem(app, pinned=True, running=False, dock=self)
-                items.append(item)
-                self._items.append(item)
-
-        return items
-
-    def _find_app(self, app_id: str):
-        """Find an application by ID or name."""
-        apps_svc = get_apps_service()
-        all_apps = apps_svc.apps
-
-        # Try exact desktop file match first
-        for app in all_apps:
-            if app.desktop_file and app.desktop_file == app_id:
-                return app
-
-        # Try case-insensitive name match
-        for app in all_apps:
-            if app.name and app.name.lower() == app_id.lower():
-                return app
-            if app.desktop_file and app.desktop_file.lower() == app_id.lower():
-                return app
-
-        # Try fuzzy search as last resort
-        results = apps_svc.search(apps_svc.apps, app_id)
-        return results[0] if results else None
+        """Build the initial list of dock items."""
+        self._items = [self._create_item(entry) for entry in self._model.entries]
+        return list(self._items)
 
     def _on_apps_changed(self):
-        """Handle application changes (open/close)."""
-        # Rebuild dock items
-        self._items.clear()
-        new_items = self._build_dock_items()
-
-        # Update dock box children - remove all existing children first
-        # Get current children and remove them
-        child = self._dock_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self._dock_box.remove(child)
-            child = next_child
-
-        # Add new items
-        for item in new_items:
-            self._dock_box.append(item)
-
-    def pin_app(self, app_id: str):
-        """Pin an app to the dock."""
-        pinned = list(user_options.dock.pinned_apps)
-        if app_id not in pinned:
-            pinned.append(app_id)
-            user_options.dock.set_pinned_apps(pinned)
-            user_options.save_to_file(user_options._file)
-            self._on_apps_changed()
-
-    def unpin_app(self, app_id: str):
-        """Unpin an app from the dock."""
-        pinned = list(user_options.dock.pinned_apps)
-        if app_id in pinned:
-            pinned.remove(app_id)
-            user_options.dock.set_pinned_apps(pinned)
-            user_options.save_to_file(user_options._file)
-            self._on_apps_changed()
+        """Reconcile dock items with the model's entries.
+
+        Items are keyed by desktop id; only items that appear, disappear or
+        change position are touched, the rest keep their widgets and menus.
+        """
+        entries = self._model.entries
+        operations = diff_keys(
+            [item.app_id for item in self._items], [entry.app_id for entry in entries]
+        )
+
+        for operation in operations:
+            key = operation[1]
+            if operation[0] == "remove":
+                self._dock_box.remove(self._items_by_id.pop(key))
+                continue
+
+            after = self._items_by_id[operation[2]] if operation[2] else None
+            if operation[0] == "insert":
+                item = self._create_item(self._model.get(key))
+                self._dock_box.insert_child_after(item, after)
+            else:
+                self._dock_box.reorder_child_after(self._items_by_id[key], after)
+
+        self._items = [self._items_by_id[entry.app_id] for entry in entries]
+        if operations:
+            log.debug("Dock %s reconciled: %d operations", self.monitor, len(operations))
+        for entry in entries:
+            self._items_by_id[entry.app_id].set_pinned(entry.pinned)
+
+    def _on_installed_apps_changed(self):
+        """Recreate all items; their Application objects were replaced."""
+        for item in self._items:
+            self._dock_box.remove(item)
+        self._items = []
+        self._items_by_id.clear()
+        self._on_apps_changed()
+
+    def _on_entry_changed(self, model, app_id: str):
+        """Update the item whose pin or running state changed."""
+        item = self._items_by_id.get(app_id)
+        entry = model.get(app_id)
+        if item and entry:
+            item.set_pinned(entry.pinned)
+            if item.running != entry.running:
+                item.update_running_state(entry.running)
 
     # Auto-hide functionality (Phase 2, Task 4)
 
@@ -1,34 +1,38 @@
 """
 DockItem widget - Individual app icon in the dock.
 """
-import sys
-print("[DOCK_ITEM] Starting dock_item.py import", file=sys.stderr)
-
 from ignis import widgets
-print("[DOCK_ITEM] Imported widgets", file=sys.stderr)
 
 # Defer Application import - it's from the expensive applications service module
 # We'll use TYPE_CHECKING to get type hints without runtime import
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ignis.services.applications import Application
-print("[DOCK_ITEM] Skipped Application import (using TYPE_CHECKING)", file=sys.stderr)
 
 from ignis.menu_model import IgnisMenuModel, IgnisMenuItem, IgnisMenuSeparator
-print("[DOCK_ITEM] Imported menu models", file=sys.stderr)
 
 from user_options import user_options
-print("[DOCK_ITEM] Imported user_options", file=sys.stderr)
+
+from services.launch_history import LaunchHistoryService
+from tracelog import get_logger
+
+log = get_logger("dock")
+
+
+def get_dock_model():
+    """Lazy load the shared dock model (deferred import + initialization)"""
+    from services.dock_model import DockModelService
+    log.debug("Loading dock model")
+    return DockModelService.get_default()
 
 
 class DockItem(widgets.Button):
     """A single application icon in the dock."""
 
-    def __init__(self, app: "Application", pinned: bool, running: bool, dock):
+    def __init__(self, app: "Application", pinned: bool, running: bool):
         self._app = app
         self._pinned = pinned
         self._running = running
-        self._dock = dock  # Reference to parent dock for pin/unpin
 
         # Icon size based on user preference
         size = int(48 * user_options.dock.size)
@@ -44,6 +48,11 @@ class DockItem(widgets.Button):
         self._menu = widgets.PopoverMenu()
         self._update_menu()
 
+        self._indicator = widgets.Box(
+            css_classes=["active-indicator"],
+            visible=running,
+        )
+
         super().__init__(
             css_classes=css_classes,
             on_click=lambda x: self._on_click(),
@@ -58,22 +67,41 @@ class DockItem(widgets.Button):
                         pixel_size=size,
                     ),
                     # Active indicator dot
-                    widgets.Box(
-                        css_classes=["active-indicator"],
-                        visible=running,
-                    ),
+                    self._indicator,
                 ],
             ),
         )
 
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def app_id(self) -> str:
+        """Desktop id of the app, the item's key in the dock."""
+        return self._app.id
+
+    def set_pinned(self, pinned: bool):
+        """Update the pin state, e.g. after the dock reconciled its items."""
+        if pinned == self._pinned:
+            return
+        self._pinned = pinned
+        if pinned and not self._running:
+            self.add_css_class("inactive")
+        else:
+            self.remove_css_class("inactive")
+        self._update_menu()
+
     def _on_click(self):
         """Launch or focus app."""
-        if self._running:
-            # TODO: Focus app window (requires window management service)
-            # For now, just launch a new instance
-            self._app.launch()
-        else:
-            self._app.launch()
+        if self._running and get_dock_model().focus(self._app.id):
+            return
+        self._launch()
+
+    def _launch(self):
+        """Launch the app and record it in the launch history."""
+        self._app.launch()
+        LaunchHistoryService.get_default().record(self._app.id)
 
     def _update_menu(self):
         """Update the context menu items."""
@@ -85,7 +113,7 @@ class DockItem(widgets.Button):
             IgnisMenuSeparator(),
             IgnisMenuItem(
                 label="Launch",
-                on_activate=lambda x: self._app.launch(),
+                on_activate=lambda x: self._launch(),
             ),
         ]
 
@@ -102,23 +130,15 @@ class DockItem(widgets.Button):
         self._menu.model = IgnisMenuModel(*menu_items)
 
     def _toggle_pin(self):
-        """Toggle pin state of this app."""
-        app_id = self._app.desktop_file if self._app.desktop_file else self._app.name
+        """Toggle pin state of this app; the dock model updates this item."""
         if self._pinned:
-            self._dock.unpin_app(app_id)
-            self._pinned = False
+            get_dock_model().unpin(self._app.id)
         else:
-            self._dock.pin_app(app_id)
-            self._pinned = True
-
-        # Update menu to reflect new pin state
-        self._update_menu()
+            get_dock_model().pin(self._app.id)
 
     def _quit_app(self):
-        """Quit the running application."""
-        # TODO: Implement app quit (requires window management)
-        # For now, this is a placeholder
-        pass
+        """Quit the running application by closing all of its windows."""
+        get_dock_model().quit(self._app.id)
 
     def update_running_state(self, is_running: bool):
         """Update the running state of this item."""
@@ -127,13 +147,13 @@ class DockItem(widgets.Button):
         if is_running:
             self.add_css_class("running")
             self.remove_css_class("inactive")
-        elif self._pinned:
-            self.add_css_class("inactive")
+        else:
             self.remove_css_class("running")
+            if self._pinned:
+                self.add_css_class("inactive")
 
         # Update indicator visibility
-        indicator = self.child.child[1]  # The active-indicator box
-        indicator.set_visible(is_running)
+        self._indicator.set_visible(is_running)
 
         # Update menu to show/hide quit option
         self._update_menu()
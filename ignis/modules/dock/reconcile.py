@@ -0,0 +1,66 @@
+"""
+Keyed reconciliation of dock items.
+"""
+from typing import Optional
+
+
+def _stable_keys(order: list[str], desired: list[str]) -> set[str]:
+    """Keys of the longest run of ``desired`` already in the right relative order."""
+    position = {key: i for i, key in enumerate(order)}
+    keys = [key for key in desired if key in position]
+
+    # Longest increasing subsequence of current positions (patience sorting)
+    tails: list[int] = []
+    tail_keys: list[int] = []
+    parents: list[Optional[int]] = []
+    for i, key in enumerate(keys):
+        pos = position[key]
+        low, high = 0, len(tails)
+        while low < high:
+            mid = (low + high) // 2
+            if tails[mid] < pos:
+                low = mid + 1
+            else:
+                high = mid
+        parents.append(tail_keys[low - 1] if low > 0 else None)
+        if low == len(tails):
+            tails.append(pos)
+            tail_keys.append(i)
+        else:
+            tails[low] = pos
+            tail_keys[low] = i
+
+    stable = set()
+    index = tail_keys[-1] if tail_keys else None
+    while index is not None:
+        stable.add(keys[index])
+        index = parents[index]
+    return stable
+
+
+def diff_keys(current: list[str], desired: list[str]) -> list[tuple]:
+    """Compute the operations turning one ordering of keys into another.
+
+    Returns a list of operations, applied in order:
+        ("remove", key)
+        ("insert", key, after)  - new item placed after ``after`` (None = first)
+        ("move", key, after)    - existing item placed after ``after``
+
+    Items in the longest common ordered run are left in place, so moving a
+    single item produces one "move" and unchanged lists produce nothing.
+    """
+    desired_set = set(desired)
+    operations: list[tuple] = [("remove", key) for key in current if key not in desired_set]
+
+    order = [key for key in current if key in desired_set]
+    stable = _stable_keys(order, desired)
+    existing = set(order)
+
+    after = None
+    for key in desired:
+        if key not in existing:
+            operations.append(("insert", key, after))
+        elif key not in stable:
+            operations.append(("move", key, after))
+        after = key
+    return operations
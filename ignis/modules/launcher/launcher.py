@@ -1,71 +1,140 @@
-import re
+import os
 import asyncio
+from typing import Optional
+from gi.repository import GLib, Gio, Gdk  # type: ignore
 from ignis import widgets
 from ignis.window_manager import WindowManager
-from ignis.services.applications import (
-    ApplicationsService,
-    Application,
-    ApplicationAction,
-)
+from ignis.services.applications import Application, ApplicationAction
 from ignis import utils
 from ignis.menu_model import IgnisMenuModel, IgnisMenuItem, IgnisMenuSeparator
-from gi.repository import Gio, GioUnix  # type: ignore
+from services.app_index import AppIndexService
+from services.launch_history import LaunchHistoryService
+from services.wallpaper_slideshow import WallpaperSlideshowService
+from services.default_browser import DefaultBrowserService
+from .search_index import SearchIndex
+from .providers import (
+    SearchPipeline,
+    SearchProvider,
+    SearchResult,
+    AppsProvider,
+    WebProvider,
+    CalculatorProvider,
+    FilesProvider,
+    WallpapersProvider,
+)
 
 window_manager = WindowManager.get_default()
 
-applications = ApplicationsService.get_default()
+app_index = AppIndexService.get_default()
+
+default_browser = DefaultBrowserService.get_default()
+
+launch_history = LaunchHistoryService.get_default()
 
 TERMINAL_FORMAT = "kitty %command%"
 
+# Number of app results shown
+MAX_RESULTS = 5
+
+# Number of results shown from the other providers (calculator, files, ...)
+MAX_EXTRA_RESULTS = 5
+
+# Order of the non-app providers' results
+EXTRA_PROVIDERS = ("calculator", "wallpapers", "files")
 
-def is_url(url: str) -> bool:
-    regex = re.compile(
-        r"^(?:http|ftp)s?://"  # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"  # domain
-        r"localhost|"  # localhost
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|"  # or ipv4
-        r"\[?[A-F0-9]*:[A-F0-9:]+\]?)"  # or ipv6
-        r"(?::\d+)?"  # optional port
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
+RECENT_FILES = os.path.join(GLib.get_user_data_dir(), "recently-used.xbel")
 
-    return re.match(regex, url) is not None
+
+def wallpaper_thumbnail(wallpaper_path: str) -> Optional[str]:
+    """Get the cached thumbnail of a wallpaper, if it was generated."""
+    thumbnail = WallpaperSlideshowService.get_default()._cache.get_thumbnail_path(wallpaper_path)
+    return thumbnail if os.path.exists(thumbnail) else None
+
+
+def build_search_index(apps: list[Application]) -> SearchIndex:
+    """Index applications by name, generic name, keywords, exec and desktop id."""
+    index = SearchIndex(launch_history.boost)
+    for app in apps:
+        index.add(
+            app.id,
+            app,
+            name=app.name,
+            generic_name=app.app.get_generic_name() or "",
+            keywords=app.keywords,
+            exec=app.exec_string,
+            desktop_id=app.id,
+        )
+    return index
 
 
 class LauncherAppItem(widgets.Button):
-    def __init__(self, application: Application) -> None:
-        self._menu = widgets.PopoverMenu()
+    """A launcher result row.
+
+    Rows are created once and rebound to a different application as the
+    query changes. The context menu is built on right-click, so binding a
+    row allocates no widgets and connects no signals.
+    """
+
+    def __init__(self) -> None:
+        self._application: Application | None = None
+        self._menu: widgets.PopoverMenu | None = None
+
+        self._icon = widgets.Icon(pixel_size=48)
+        self._label = widgets.Label(
+            ellipsize="end",
+            max_width_chars=30,
+            css_classes=["launcher-app-label"],
+        )
+        self._box = widgets.Box(child=[self._icon, self._label])
 
-        self._application = application
         super().__init__(
+            visible=False,
             on_click=lambda x: self.launch(),
-            on_right_click=lambda x: self._menu.popup(),
+            on_right_click=lambda x: self.__popup_menu(),
             css_classes=["launcher-app"],
-            child=widgets.Box(
-                child=[
-                    widgets.Icon(image=application.icon, pixel_size=48),
-                    widgets.Label(
-                        label=application.name,
-                        ellipsize="end",
-                        max_width_chars=30,
-                        css_classes=["launcher-app-label"],
-                    ),
-                ]
-            ),
+            child=self._box,
         )
-        self.__sync_menu()
-        application.connect("notify::is-pinned", lambda x, y: self.__sync_menu())
+
+    @property
+    def application(self) -> Application | None:
+        return self._application
+
+    def bind(self, application: Application) -> None:
+        """Show an application in this row."""
+        if application is not self._application:
+            self._application = application
+            self._icon.image = application.icon
+            self._label.label = application.name
+        self.visible = True
+
+    def unbind(self) -> None:
+        """Hide the row and release its application."""
+        self._application = None
+        self.visible = False
 
     def launch(self) -> None:
+        if not self._application:
+            return
         self._application.launch(terminal_format=TERMINAL_FORMAT)
+        launch_history.record(self._application.id)
         window_manager.close_window("ignis_LAUNCHER")
 
     def launch_action(self, action: ApplicationAction) -> None:
         action.launch()
+        if self._application:
+            launch_history.record(self._application.id)
         window_manager.close_window("ignis_LAUNCHER")
 
-    def __sync_menu(self) -> None:
+    def __popup_menu(self) -> None:
+        if not self._application:
+            return
+
+        if self._menu is None:
+            self._menu = widgets.PopoverMenu()
+            self._box.append(self._menu)
+
+        # Built from the current state, so pinning needs no notify handler
+        application = self._application
         self._menu.model = IgnisMenuModel(
             IgnisMenuItem(label="Launch", on_activate=lambda x: self.launch()),
             IgnisMenuSeparator(),
@@ -74,68 +143,146 @@ class LauncherAppItem(widgets.Button):
                     label=i.name,
                     on_activate=lambda x, action=i: self.launch_action(action),
                 )
-                for i in self._application.actions
+                for i in application.actions
             ),
             IgnisMenuSeparator(),
-            IgnisMenuItem(label="Pin", on_activate=lambda x: self._application.pin())
-            if not self._application.is_pinned
+            IgnisMenuItem(label="Pin", on_activate=lambda x: application.pin())
+            if not application.is_pinned
             else IgnisMenuItem(
-                label="Unpin", on_activate=lambda x: self._application.unpin()
+                label="Unpin", on_activate=lambda x: application.unpin()
             ),
         )
+        self._menu.popup()
 
 
 class SearchWebButton(widgets.Button):
-    def __init__(self, query: str):
-        self._query = query
-        self._url = ""
-
-        browser_desktop_file = utils.exec_sh(
-            "xdg-settings get default-web-browser"
-        ).stdout.replace("\n", "")
-
-        app_info = GioUnix.DesktopAppInfo.new(desktop_id=browser_desktop_file)
-
-        icon_name = "applications-internet-symbolic"
-        if app_info:
-            icon_string = app_info.get_string("Icon")
-            if icon_string:
-                icon_name = icon_string
+    """Result row offering to open a URL or search the web for the query."""
 
-        if not query.startswith(("http://", "https://")) and "." in query:
-            query = "https://" + query
+    def __init__(self):
+        self._url = ""
 
-        if is_url(query):
-            label = f"Visit {query}"
-            self._url = query
-        else:
-            label = "Search in Google"
-            self._url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+        self._label = widgets.Label(css_classes=["launcher-app-label"])
 
         super().__init__(
+            visible=False,
             on_click=lambda x: self.launch(),
             css_classes=["launcher-app"],
             child=widgets.Box(
                 child=[
-                    widgets.Icon(image=icon_name, pixel_size=48),
-                    widgets.Label(
-                        label=label,
-                        css_classes=["launcher-app-label"],
+                    widgets.Icon(
+                        image=default_browser.bind("icon_name"), pixel_size=48
                     ),
+                    self._label,
                 ]
             ),
         )
 
+    def bind(self, result: SearchResult) -> None:
+        """Show a result of the web provider."""
+        self._label.label = result.title
+        self._url = result.payload
+        self.visible = True
+
+    def unbind(self) -> None:
+        self.visible = False
+
     def launch(self) -> None:
         asyncio.create_task(utils.exec_sh_async(f"xdg-open {self._url}"))
         window_manager.close_window("ignis_LAUNCHER")
 
 
+class LauncherResultItem(widgets.Button):
+    """A reusable row for results of the calculator, files and wallpapers providers."""
+
+    def __init__(self, on_activate) -> None:
+        self._result: SearchResult | None = None
+
+        self._icon = widgets.Icon(pixel_size=48)
+        self._title = widgets.Label(
+            ellipsize="end",
+            max_width_chars=30,
+            halign="start",
+            css_classes=["launcher-app-label"],
+        )
+        self._subtitle = widgets.Label(
+            ellipsize="middle",
+            max_width_chars=40,
+            halign="start",
+            css_classes=["launcher-result-subtitle"],
+        )
+
+        super().__init__(
+            visible=False,
+            on_click=lambda x: on_activate(self._result) if self._result else None,
+            css_classes=["launcher-app"],
+            child=widgets.Box(
+                child=[
+                    self._icon,
+                    widgets.Box(
+                        vertical=True,
+                        valign="center",
+                        child=[self._title, self._subtitle],
+                    ),
+                ]
+            ),
+        )
+
+    @property
+    def result(self) -> SearchResult | None:
+        return self._result
+
+    def bind(self, result: SearchResult) -> None:
+        self._result = result
+        self._icon.image = result.icon
+        self._title.label = result.title
+        self._subtitle.label = result.subtitle
+        self._subtitle.visible = bool(result.subtitle)
+        self.visible = True
+
+    def unbind(self) -> None:
+        self._result = None
+        self.visible = False
+
+
 class Launcher(widgets.Window):
     def __init__(self):
+        # Built on first search, rebuilt after the application list changes
+        self._search_index: SearchIndex | None = None
+        app_index.connect("changed", lambda *args: self.__invalidate_index())
+
+        # Fixed pool of result rows, rebound on every search
+        self._rows = [LauncherAppItem() for _ in range(MAX_RESULTS)]
+        self._web_button = SearchWebButton()
+        self._result_rows = [
+            LauncherResultItem(self.__activate_result)
+            for _ in range(MAX_EXTRA_RESULTS)
+        ]
         self._app_list = widgets.Box(
-            vertical=True, visible=False, style="margin-top: 1rem;"
+            vertical=True,
+            visible=False,
+            style="margin-top: 1rem;",
+            child=[*self._rows, *self._result_rows, self._web_button],
+        )
+
+        # Providers answer independently; results are merged as they arrive
+        self._apps_provider = AppsProvider(self.__get_search_index, MAX_RESULTS)
+        self._web_provider = WebProvider()
+        self._pipeline = SearchPipeline(
+            [
+                self._apps_provider,
+                self._web_provider,
+                CalculatorProvider(),
+                WallpapersProvider(
+                    lambda: WallpaperSlideshowService.get_default().get_history(),
+                    wallpaper_thumbnail,
+                ),
+                FilesProvider(RECENT_FILES),
+            ],
+            self.__on_results,
         )
+        # Query whose app results are shown, and the latest results per provider
+        self._shown_query: str | None = None
+        self._results: dict[str, list[SearchResult]] = {}
         self._entry = widgets.Entry(
             hexpand=True,
             placeholder_text="Search",
@@ -194,20 +341,103 @@ class Launcher(widgets.Window):
         self._entry.grab_focus()
 
     def __on_accept(self, *args) -> None:
-        if len(self._app_list.child) > 0:
-            self._app_list.child[0].launch()
+        query = self._entry.text
+        if query == "":
+            return
+
+        # Enter may arrive before the debounced search ran
+        if self._shown_query != query:
+            self._results.clear()
+            self._results["web"] = self._web_provider.search_now(query)
+            self.__show_extra_results()
+            self.__show_apps(query, self._apps_provider.search_now(query))
+
+        if self._rows[0].application:
+            self._rows[0].launch()
+        elif self._result_rows[0].result:
+            self.__activate_result(self._result_rows[0].result)
+        elif self._web_button.visible:
+            self._web_button.launch()
+
+    def __invalidate_index(self) -> None:
+        self._search_index = None
+
+    def __get_search_index(self) -> SearchIndex:
+        if self._search_index is None:
+            self._search_index = build_search_index(app_index.apps)
+        return self._search_index
 
     def __search(self, *args) -> None:
         query = self._entry.text
 
         if query == "":
+            self._pipeline.cancel()
+            self._shown_query = None
+            self._results.clear()
             self._entry.grab_focus()
             self._app_list.visible = False
             return
 
-        apps = applications.search(applications.apps, query)
-        if apps == []:
-            self._app_list.child = [SearchWebButton(query)]
+        self._pipeline.submit(query)
+
+    def __on_results(
+        self, query: str, provider: SearchProvider, results: list[SearchResult]
+    ) -> None:
+        if query != self._entry.text:
+            return
+
+        if provider.name == "apps":
+            self.__show_apps(query, results)
+            return
+
+        self._results[provider.name] = results
+        if provider.name != "web":
+            self.__show_extra_results()
+        self.__sync_web_button()
+        self._app_list.visible = True
+
+    def __show_apps(self, query: str, results: list[SearchResult]) -> None:
+        # Other providers' rows stay until they answer for this query
+        self._shown_query = query
+        for i, row in enumerate(self._rows):
+            if i < len(results):
+                row.bind(results[i].payload)
+            else:
+                row.unbind()
+        self.__sync_web_button()
+        self._app_list.visible = True
+
+    def __show_extra_results(self) -> None:
+        merged = [
+            result
+            for name in EXTRA_PROVIDERS
+            for result in sorted(self._results.get(name, ()), key=lambda r: -r.score)
+        ]
+        for i, row in enumerate(self._result_rows):
+            if i < len(merged):
+                row.bind(merged[i])
+            else:
+                row.unbind()
+
+    def __sync_web_button(self) -> None:
+        # Offered when nothing else matched
+        web = self._results.get("web")
+        if web and not self._rows[0].application and not self._result_rows[0].result:
+            self._web_button.bind(web[0])
         else:
-            self._app_list.visible = True
-            self._app_list.child = [LauncherAppItem(i) for i in apps[:5]]
+            self._web_button.unbind()
+
+    def __activate_result(self, result: SearchResult) -> None:
+        if result.provider == "calculator":
+            clipboard = Gdk.Display.get_default().get_clipboard()
+            clipboard.set_content(Gdk.ContentProvider.new_for_value(result.payload))
+        elif result.provider == "files":
+            try:
+                Gio.AppInfo.launch_default_for_uri(
+                    Gio.File.new_for_path(result.payload).get_uri(), None
+                )
+            except GLib.Error as e:
+                print(f"Failed to open {result.payload}: {e}")
+        elif result.provider == "wallpapers":
+            WallpaperSlideshowService.get_default().set_wallpaper(result.payload)
+        window_manager.close_window("ignis_LAUNCHER")
@@ -0,0 +1,445 @@
+import os
+import re
+import ast
+import math
+import asyncio
+import operator
+from abc import ABC, abstractmethod
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import unquote, urlparse
+
+# Keystrokes arriving within one frame (60 Hz) are searched once
+KEYSTROKE_DEBOUNCE_MS = 16
+
+URL_REGEX = re.compile(
+    r"^(?:http|ftp)s?://"  # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"  # domain
+    r"localhost|"  # localhost
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|"  # or ipv4
+    r"\[?[A-F0-9]*:[A-F0-9:]+\]?)"  # or ipv6
+    r"(?::\d+)?"  # optional port
+    r"(?:/?|[/?]\S+)$",
+    re.IGNORECASE,
+)
+
+
+def is_url(url: str) -> bool:
+    return URL_REGEX.match(url) is not None
+
+
+class SearchResult:
+    """A single launcher result.
+
+    Args:
+        provider: Name of the provider that produced the result
+        title: Main text of the row
+        subtitle: Secondary text, e.g. a path
+        icon: Icon name or image path
+        score: Rank within the provider, higher first
+        payload: Provider-specific value used to activate the result
+    """
+
+    __slots__ = ("provider", "title", "subtitle", "icon", "score", "payload")
+
+    def __init__(
+        self,
+        provider: str,
+        title: str,
+        subtitle: str = "",
+        icon: str = "",
+        score: float = 0.0,
+        payload: Any = None,
+    ):
+        self.provider = provider
+        self.title = title
+        self.subtitle = subtitle
+        self.icon = icon
+        self.score = score
+        self.payload = payload
+
+
+class SearchProvider(ABC):
+    """Source of launcher results.
+
+    Providers run concurrently for every query. A provider that does not
+    answer within ``budget_ms`` is dropped for that query, so slow sources
+    never hold back the others. Subclasses implement ``search``.
+
+    The budget can only interrupt a provider while it awaits: ``search``
+    runs on the main loop, so providers must keep synchronous work bounded
+    and move anything slow to a thread (see FilesProvider).
+    """
+
+    name = ""
+    budget_ms = 50
+
+    @abstractmethod
+    async def search(self, query: str) -> list[SearchResult]:
+        """Get the results for a query."""
+
+
+class AppsProvider(SearchProvider):
+    """Applications from the launcher's search index.
+
+    Args:
+        get_index: Returns the current SearchIndex; payloads are Applications
+        limit: Maximum number of results
+    """
+
+    name = "apps"
+
+    def __init__(self, get_index: Callable[[], Any], limit: int = 5):
+        self._get_index = get_index
+        self._limit = limit
+
+    def search_now(self, query: str) -> list[SearchResult]:
+        """Search synchronously, e.g. when a query is accepted before it was searched."""
+        apps = self._get_index().search(query, limit=self._limit)
+        count = len(apps)
+        return [
+            SearchResult(self.name, app.name, icon=app.icon, score=count - i, payload=app)
+            for i, app in enumerate(apps)
+        ]
+
+    async def search(self, query: str) -> list[SearchResult]:
+        return self.search_now(query)
+
+
+class WebProvider(SearchProvider):
+    """Visiting the query as a URL or searching for it on the web."""
+
+    name = "web"
+
+    def search_now(self, query: str) -> list[SearchResult]:
+        query = query.strip()
+        if not query:
+            return []
+        if not query.startswith(("http://", "https://")) and "." in query:
+            query = "https://" + query
+
+        if is_url(query):
+            return [SearchResult(self.name, f"Visit {query}", payload=query)]
+
+        url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+        return [SearchResult(self.name, "Search in Google", payload=url)]
+
+    async def search(self, query: str) -> list[SearchResult]:
+        return self.search_now(query)
+
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+_FUNCTIONS = {
+    name: getattr(math, name)
+    for name in ("sqrt", "sin", "cos", "tan", "log", "log2", "log10", "exp", "floor", "ceil")
+}
+_FUNCTIONS["abs"] = abs
+_FUNCTIONS["round"] = round
+
+_CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau}
+
+# Results with more digits than this (the float range) are refused before
+# they are computed, so huge integers never block the main loop
+MAX_DIGITS = 308
+
+_EXPRESSION_CHARS = re.compile(r"^[\d\s.+\-*/%()^,a-z]+$")
+
+
+def _digits(value: float) -> float:
+    """Get the number of integer digits of a value (log10 of its magnitude)."""
+    return math.log10(abs(value)) if value else -math.inf
+
+
+def _check_size(op: ast.operator, left: float, right: float) -> None:
+    if isinstance(op, ast.Pow) and abs(left) > 1 and abs(right) * _digits(left) > MAX_DIGITS:
+        raise ValueError("result too large")
+    if isinstance(op, ast.Mult) and _digits(left) + _digits(right) > MAX_DIGITS:
+        raise ValueError("result too large")
+
+
+def _evaluate_node(node: ast.AST) -> float:
+    if isinstance(node, ast.Expression):
+        return _evaluate_node(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in _CONSTANTS:
+        return _CONSTANTS[node.id]
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_evaluate_node(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left = _evaluate_node(node.left)
+        right = _evaluate_node(node.right)
+        _check_size(node.op, left, right)
+        value = _BINARY_OPERATORS[type(node.op)](left, right)
+        # Fractional powers of negative numbers, e.g. (-8)^0.5
+        if isinstance(value, complex):
+            raise ValueError("complex result")
+        return value
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and not node.keywords
+    ):
+        return _FUNCTIONS[node.func.id](*(_evaluate_node(arg) for arg in node.args))
+    raise ValueError("unsupported expression")
+
+
+def evaluate_expression(expression: str) -> Optional[float]:
+    """Evaluate an arithmetic expression without eval().
+
+    Supports + - * / // % ** (or ^), parentheses, pi/e/tau and a few math
+    functions. Returns None if the text is not such an expression.
+    """
+    expression = expression.strip().lower()
+    if not expression or not _EXPRESSION_CHARS.match(expression):
+        return None
+    try:
+        tree = ast.parse(expression.replace("^", "**"), mode="eval")
+        value = _evaluate_node(tree)
+    except (SyntaxError, ValueError, TypeError, ZeroDivisionError, OverflowError):
+        return None
+    if type(value) not in (int, float) or not math.isfinite(value):
+        return None
+    return value
+
+
+def format_number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        value = int(value)
+    if isinstance(value, float):
+        return f"{value:.10g}"
+    return str(value)
+
+
+class CalculatorProvider(SearchProvider):
+    """Result of the query as an arithmetic expression."""
+
+    name = "calculator"
+    budget_ms = 20
+
+    async def search(self, query: str) -> list[SearchResult]:
+        # A bare number is not a calculation
+        if not any(char in query for char in "+-*/%^("):
+            return []
+        value = evaluate_expression(query)
+        if value is None:
+            return []
+        text = format_number(value)
+        return [
+            SearchResult(
+                self.name, f"= {text}", subtitle=query.strip(),
+                icon="accessories-calculator-symbolic", score=1.0, payload=text,
+            )
+        ]
+
+
+_MIME_NS = "{http://www.freedesktop.org/standards/shared-mime-info}"
+
+# Generic icons for the top-level MIME types
+_GENERIC_ICONS = {
+    "image": "image-x-generic",
+    "audio": "audio-x-generic",
+    "video": "video-x-generic",
+    "text": "text-x-generic",
+}
+
+
+def load_recent_files(path: str, limit: int = 500) -> list[tuple[str, str]]:
+    """Read recently used local files from an XBEL file, newest first.
+
+    Returns:
+        (path, mime type) pairs of files that still exist
+    """
+    bookmarks = []
+    for bookmark in ElementTree.parse(path).getroot().iter("bookmark"):
+        uri = urlparse(bookmark.get("href", ""))
+        if uri.scheme != "file":
+            continue
+        mime = bookmark.find(f".//{_MIME_NS}mime-type")
+        bookmarks.append((
+            bookmark.get("modified") or bookmark.get("added") or "",
+            unquote(uri.path),
+            mime.get("type", "") if mime is not None else "",
+        ))
+
+    # ISO 8601 timestamps sort chronologically as strings
+    bookmarks.sort(reverse=True)
+    recent = []
+    for _, file_path, mime_type in bookmarks:
+        if os.path.exists(file_path):
+            recent.append((file_path, mime_type))
+            if len(recent) >= limit:
+                break
+    return recent
+
+
+class FilesProvider(SearchProvider):
+    """Recently used files whose name contains every query term.
+
+    The XBEL list is parsed off the main loop and reused until it changes.
+    """
+
+    name = "files"
+    budget_ms = 100
+
+    def __init__(self, path: str, limit: int = 5):
+        self._path = path
+        self._limit = limit
+        self._mtime: Optional[int] = None
+        self._files: list[tuple[str, str, str]] = []
+
+    def _refresh(self) -> None:
+        try:
+            mtime = os.stat(self._path).st_mtime_ns
+        except OSError:
+            self._mtime = None
+            self._files = []
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            files = load_recent_files(self._path)
+        except (OSError, ElementTree.ParseError) as e:
+            print(f"Failed to read recent files: {e}")
+            files = []
+        self._files = [(os.path.basename(p).lower(), p, mime) for p, mime in files]
+        self._mtime = mtime
+
+    async def search(self, query: str) -> list[SearchResult]:
+        terms = query.lower().split()
+        if not terms or len(query.strip()) < 2:
+            return []
+
+        await asyncio.to_thread(self._refresh)
+
+        results = []
+        for name, file_path, mime_type in self._files:
+            if all(term in name for term in terms):
+                icon = _GENERIC_ICONS.get(mime_type.split("/")[0], "text-x-generic")
+                results.append(SearchResult(
+                    self.name, os.path.basename(file_path),
+                    subtitle=os.path.dirname(file_path), icon=icon,
+                    score=-len(results), payload=file_path,
+                ))
+                if len(results) >= self._limit:
+                    break
+        return results
+
+
+class WallpapersProvider(SearchProvider):
+    """Recently shown wallpapers whose file name contains every query term.
+
+    Args:
+        get_history: Returns wallpaper paths, most recent first
+        get_thumbnail: Returns the thumbnail of a wallpaper, or None if it
+            has none yet; full-size wallpapers are never used as icons
+        limit: Maximum number of results
+    """
+
+    name = "wallpapers"
+    budget_ms = 20
+
+    def __init__(
+        self,
+        get_history: Callable[[], Iterable[str]],
+        get_thumbnail: Callable[[str], Optional[str]],
+        limit: int = 3,
+    ):
+        self._get_history = get_history
+        self._get_thumbnail = get_thumbnail
+        self._limit = limit
+
+    async def search(self, query: str) -> list[SearchResult]:
+        terms = query.lower().split()
+        if not terms or len(query.strip()) < 2:
+            return []
+
+        results = []
+        for path in dict.fromkeys(self._get_history()):
+            name = os.path.basename(path)
+            if all(term in name.lower() for term in terms):
+                results.append(SearchResult(
+                    self.name, name, subtitle="Set as wallpaper",
+                    icon=self._get_thumbnail(path) or "image-x-generic-symbolic",
+                    score=-len(results), payload=path,
+                ))
+                if len(results) >= self._limit:
+                    break
+        return results
+
+
+class SearchPipeline:
+    """Runs providers for the latest query.
+
+    Queries are debounced by ``debounce_ms`` and a new query cancels the
+    one in flight. Providers run concurrently, each within its budget, and
+    ``on_results(query, provider, results)`` is called as each one answers
+    (with an empty list on timeout or error), so fast providers are shown
+    without waiting for slow ones. Results of superseded queries are never
+    delivered.
+    """
+
+    def __init__(
+        self,
+        providers: Iterable[SearchProvider],
+        on_results: Callable[[str, SearchProvider, list[SearchResult]], None],
+        debounce_ms: int = KEYSTROKE_DEBOUNCE_MS,
+    ):
+        self._providers = list(providers)
+        self._on_results = on_results
+        self._debounce_ms = debounce_ms
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def providers(self) -> list[SearchProvider]:
+        return self._providers
+
+    def submit(self, query: str) -> None:
+        """Search for a query, replacing any query not fully answered yet."""
+        self.cancel()
+        self._task = asyncio.create_task(self._run(query))
+
+    def cancel(self) -> None:
+        """Drop the query in flight."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _run(self, query: str) -> None:
+        if self._debounce_ms > 0:
+            await asyncio.sleep(self._debounce_ms / 1000)
+
+        # Cancelling the gather cancels every provider still running
+        await asyncio.gather(
+            *(self._run_provider(provider, query) for provider in self._providers)
+        )
+
+    async def _run_provider(self, provider: SearchProvider, query: str) -> None:
+        try:
+            results = await asyncio.wait_for(
+                provider.search(query), provider.budget_ms / 1000
+            )
+        except asyncio.TimeoutError:
+            results = []
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Launcher provider {provider.name} failed: {e}")
+            results = []
+
+        self._on_results(query, provider, results)
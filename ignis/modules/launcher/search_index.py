@@ -0,0 +1,222 @@
+import re
+from typing import Any, Callable, Iterable, Optional
+
+
+# Relative weight of a word-prefix match in each field
+FIELD_WEIGHTS = {
+    "name": 1.0,
+    "generic_name": 0.7,
+    "keywords": 0.6,
+    "exec": 0.5,
+    "desktop_id": 0.4,
+}
+
+# Scores of the match tiers for a single query term
+SCORE_EXACT = 100.0
+SCORE_NAME_PREFIX = 80.0
+SCORE_WORD_PREFIX = 60.0
+SCORE_SUBSTRING = 20.0
+SCORE_FUZZY = 10.0
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _subsequence_span(term: str, text: str) -> Optional[int]:
+    """Length of the greedy window of ``text`` containing ``term``'s characters in order."""
+    start = text.find(term[0])
+    if start < 0:
+        return None
+    position = start
+    for char in term[1:]:
+        position = text.find(char, position + 1)
+        if position < 0:
+            return None
+    return position - start + 1
+
+
+class _Document:
+    __slots__ = ("key", "payload", "name", "text", "fields")
+
+    def __init__(self, key: str, payload: Any, fields: dict[str, str]):
+        self.key = key
+        self.payload = payload
+        self.name = fields["name"]
+        self.text = " ".join(value for value in fields.values() if value)
+        # (weight, words) per field, for word-prefix matches
+        self.fields = [
+            (FIELD_WEIGHTS[field], _WORD_RE.findall(value))
+            for field, value in fields.items()
+            if value
+        ]
+
+
+class SearchIndex:
+    """Prebuilt fuzzy search index for launcher entries.
+
+    Entries are indexed once over name, generic name, keywords, exec and
+    desktop id. Trigram postings (and character postings for short terms)
+    select candidates with set intersections, which are then scored per
+    term: exact name, name prefix, word prefix, substring and finally a
+    fuzzy in-order match against the name.
+
+    Matching only gets stricter as a query grows, so when a query extends
+    the previous one only the previous matches are rescored. An optional
+    ``boost(key)`` hook (e.g. launch frecency) scales the final scores.
+    """
+
+    def __init__(self, boost: Optional[Callable[[str], float]] = None):
+        self._boost = boost
+        self._documents: list[_Document] = []
+        self._trigrams: dict[str, set[int]] = {}
+        self._chars: dict[str, set[int]] = {}
+        self._name_chars: dict[str, set[int]] = {}
+
+        # Previous query (normalized) and the scores of its matches
+        self._last_query: Optional[str] = None
+        self._last_scores: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def set_boost(self, boost: Optional[Callable[[str], float]]) -> None:
+        """Set the hook returning a non-negative score boost for a key."""
+        self._boost = boost
+
+    def add(
+        self,
+        key: str,
+        payload: Any,
+        name: str,
+        generic_name: str = "",
+        keywords: Iterable[str] = (),
+        exec: str = "",
+        desktop_id: str = "",
+    ) -> None:
+        """Index an entry; ``payload`` is what search() returns for it."""
+        document = _Document(
+            key,
+            payload,
+            {
+                "name": name.lower(),
+                "generic_name": (generic_name or "").lower(),
+                "keywords": " ".join(keywords or ()).lower(),
+                "exec": (exec or "").lower(),
+                "desktop_id": (desktop_id or "").lower().removesuffix(".desktop"),
+            },
+        )
+        doc_id = len(self._documents)
+        self._documents.append(document)
+
+        for trigram in _trigrams(document.text):
+            self._trigrams.setdefault(trigram, set()).add(doc_id)
+        for char in set(document.text):
+            self._chars.setdefault(char, set()).add(doc_id)
+        for char in set(document.name):
+            self._name_chars.setdefault(char, set()).add(doc_id)
+
+        self._last_query = None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._documents.clear()
+        self._trigrams.clear()
+        self._chars.clear()
+        self._name_chars.clear()
+        self._last_query = None
+        self._last_scores = {}
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[Any]:
+        """Get payloads matching all terms of ``query``, best first."""
+        terms = query.lower().split()
+        if not terms:
+            return []
+        normalized = " ".join(terms)
+
+        # A longer query can only match a subset of the previous matches
+        if self._last_query is not None and normalized.startswith(self._last_query):
+            pool: Optional[set[int]] = set(self._last_scores)
+        else:
+            pool = None
+
+        scores: dict[int, float] = {}
+        for doc_id in self._candidates(terms, pool):
+            document = self._documents[doc_id]
+            total = 0.0
+            for term in terms:
+                score = self._score_term(document, term)
+                if not score:
+                    break
+                total += score
+            else:
+                scores[doc_id] = total
+
+        self._last_query = normalized
+        self._last_scores = scores
+
+        ranked = sorted(scores.items(), key=self._rank_key)
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self._documents[doc_id].payload for doc_id, _ in ranked]
+
+    def _rank_key(self, item: tuple[int, float]) -> tuple:
+        doc_id, score = item
+        document = self._documents[doc_id]
+        if self._boost:
+            score *= 1.0 + max(self._boost(document.key), 0.0)
+        return (-score, len(document.name), document.name)
+
+    def _candidates(self, terms: list[str], pool: Optional[set[int]]) -> set[int]:
+        """Documents that may match every term, from posting intersections."""
+        candidates = pool
+        for term in terms:
+            if len(term) >= 3:
+                # Substring matches contain all trigrams of the term, fuzzy
+                # name matches contain all of its characters
+                matches = self._intersect(self._trigrams, _trigrams(term))
+                matches |= self._intersect(self._name_chars, set(term))
+            else:
+                matches = self._intersect(self._chars, set(term))
+
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                break
+        return candidates or set()
+
+    @staticmethod
+    def _intersect(postings: dict[str, set[int]], keys: set[str]) -> set[int]:
+        sets = [postings.get(key) for key in keys]
+        if not sets or any(s is None for s in sets):
+            return set()
+        sets.sort(key=len)
+        return set(sets[0]).intersection(*sets[1:])
+
+    @staticmethod
+    def _score_term(document: _Document, term: str) -> float:
+        if document.name == term:
+            return SCORE_EXACT
+        if document.name.startswith(term):
+            return SCORE_NAME_PREFIX
+
+        best = 0.0
+        for weight, words in document.fields:
+            if weight * SCORE_WORD_PREFIX <= best:
+                continue
+            for word in words:
+                if word.startswith(term):
+                    best = weight * SCORE_WORD_PREFIX
+                    break
+        if best:
+            return best
+
+        if term in document.text:
+            return SCORE_SUBSTRING
+
+        # In-order characters of the name, denser matches score higher
+        span = _subsequence_span(term, document.name)
+        if span is not None:
+            return SCORE_FUZZY * len(term) / span
+        return 0.0
@@ -1,32 +1,114 @@
+from typing import Optional
 from ignis import widgets
 from ignis import utils
-from ignis.services.notifications import Notification, NotificationService
+from services.popup_scheduler import PopupSchedulerService, PopupEntry
 from ..shared_widgets import NotificationWidget
 
 
 
-notifications = NotificationService.get_default()
+scheduler = PopupSchedulerService.get_default()
+
+
+class DigestWidget(widgets.Box):
+    """Summary of the notifications that arrived during a burst.
+
+    Updated in place as the burst goes on, so a storm of notifications
+    does not create a widget per notification.
+    """
+
+    def __init__(self, entry: PopupEntry):
+        self._count_label = widgets.Label(
+            halign="start",
+            css_classes=["notification-summary"],
+        )
+        self._sources_label = widgets.Label(
+            ellipsize="end",
+            halign="start",
+            css_classes=["notification-body"],
+        )
+
+        super().__init__(
+            css_classes=["notification-popup"],
+            child=[
+                widgets.Icon(
+                    image="dialog-information-symbolic",
+                    pixel_size=48,
+                    halign="start",
+                    valign="start",
+                ),
+                widgets.Box(
+                    vertical=True,
+                    style="margin-left: 0.75rem;",
+                    child=[self._count_label, self._sources_label],
+                ),
+                widgets.Button(
+                    child=widgets.Icon(image="window-close-symbolic", pixel_size=20),
+                    halign="end",
+                    valign="start",
+                    hexpand=True,
+                    css_classes=["notification-close"],
+                    on_click=lambda x: scheduler.dismiss(entry),
+                ),
+            ],
+        )
+        self.update(entry)
+
+    def update(self, entry: PopupEntry) -> None:
+        apps = list(dict.fromkeys(notification.app_name for notification in entry.items))
+        sources = ", ".join(apps[:3]) + (f" and {len(apps) - 3} more" if len(apps) > 3 else "")
+        self._count_label.label = f"{entry.count} new notifications"
+        self._sources_label.label = sources
 
 
 class Popup(widgets.Box):
-    def __init__(
-        self, box: "PopupBox", window: "NotificationPopup", notification: Notification
-    ):
-        self._box = box
+    def __init__(self, window: "NotificationPopup", entry: PopupEntry):
         self._window = window
+        self._digest: Optional[DigestWidget] = None
+        # Notification shown for a coalesced entry
+        self._shown = None
+        self._count_label = widgets.Label(
+            halign="end",
+            css_classes=["notification-popup-count"],
+        )
 
-        widget = NotificationWidget(notification)
-        widget.css_classes = ["notification-popup"]
-        self._inner = widgets.Revealer(transition_type="slide_left", child=widget)
+        self._content = widgets.Box(vertical=True)
+        self._inner = widgets.Revealer(transition_type="slide_left", child=self._content)
         self._outer = widgets.Revealer(transition_type="slide_down", child=self._inner)
         super().__init__(child=[self._outer], halign="end")
 
-        notification.connect("dismissed", lambda x: self.destroy())
+        self.update(entry)
+
+    def update(self, entry: PopupEntry) -> None:
+        """Show the current notifications of the entry.
+
+        Widgets are only rebuilt when the notification shown is gone; new
+        arrivals just update the counts.
+        """
+        if entry.digest:
+            if self._digest is None:
+                self._digest = DigestWidget(entry)
+                self._content.child = [self._digest]
+            else:
+                self._digest.update(entry)
+            return
+
+        if self._shown not in entry.items:
+            self._shown = entry.latest
+            widget = NotificationWidget(self._shown)
+            widget.css_classes = ["notification-popup"]
+            self._content.child = [widget, self._count_label]
+
+        self._count_label.label = f"{entry.count} similar notifications"
+        self._count_label.visible = entry.count > 1
+
+    def reveal(self) -> None:
+        self._outer.reveal_child = True
+        utils.Timeout(self._outer.transition_duration, self._inner.set_reveal_child, True)
 
     def destroy(self):
         def box_destroy():
             self.unparent()
-            if len(notifications.popups) == 0:
+            if len(scheduler.visible) == 0:
                 self._window.visible = False
 
         def outer_close():
@@ -39,27 +121,37 @@ class Popup(widgets.Box):
 
 
 class PopupBox(widgets.Box):
+    """Mirrors the shared popup scheduler on one monitor."""
+
     def __init__(self, window: "NotificationPopup", monitor: int):
         self._window = window
         self._monitor = monitor
+        self._popups: dict[PopupEntry, Popup] = {}
 
         super().__init__(
             vertical=True,
             valign="start",
-            setup=lambda self: notifications.connect(
-                "new_popup",
-                lambda x, notification: self.__on_notified(notification),
-            ),
         )
 
-    def __on_notified(self, notification: Notification) -> None:
+        scheduler.connect("popup-shown", lambda x, entry: self.__on_shown(entry))
+        scheduler.connect("popup-updated", lambda x, entry: self.__on_updated(entry))
+        scheduler.connect("popup-hidden", lambda x, entry: self.__on_hidden(entry))
+
+    def __on_shown(self, entry: PopupEntry) -> None:
         self._window.visible = True
-        popup = Popup(box=self, window=self._window, notification=notification)
+        popup = self._popups[entry] = Popup(window=self._window, entry=entry)
         self.prepend(popup)
-        popup._outer.reveal_child = True
-        utils.Timeout(
-            popup._outer.transition_duration, popup._inner.set_reveal_child, True
-        )
+        popup.reveal()
+
+    def __on_updated(self, entry: PopupEntry) -> None:
+        popup = self._popups.get(entry)
+        if popup:
+            popup.update(entry)
+
+    def __on_hidden(self, entry: PopupEntry) -> None:
+        popup = self._popups.pop(entry, None)
+        if popup:
+            popup.destroy()
 
 
 class NotificationPopup(widgets.Window):
@@ -1,4 +1,5 @@
 import os
+from gi.repository import GLib  # type: ignore
 from services.material import MaterialService
 from services.wallpaper_slideshow import WallpaperSlideshowService
 from ..elements import (
@@ -9,6 +10,7 @@ from ..elements import (
     SettingsEntry,
     SpinRow,
     ComboBoxRow,
+    EntryRow,
 )
 from ignis import widgets
 from user_options import user_options
@@ -17,9 +19,20 @@ from ignis.options import options
 material = MaterialService.get_default()
 wallpaper_slideshow_service = WallpaperSlideshowService.get_default()
 
+# Delay before rescanning wallpaper folders after a source option edit (ms)
+RESCAN_DELAY = 800
+
+
+def _split_list(text: str) -> list[str]:
+    """Split a comma-separated entry into a list of stripped values."""
+    return [value.strip() for value in text.split(",") if value.strip()]
+
 
 class AppearanceEntry(SettingsEntry):
     def __init__(self):
+        self._rescan_id: int | None = None
+        self._transition_effects = wallpaper_slideshow_service.get_transition_effects()
+
         page = SettingsPage(
             name="Appearance",
             groups=[
@@ -110,6 +123,45 @@ class AppearanceEntry(SettingsEntry):
                                 ),
                             ),
                         ),
+                        SwitchRow(
+                            label="Include Subfolders",
+                            sublabel="Scan wallpaper folders recursively",
+                            active=user_options.wallpaper_slideshow.bind("recursive"),
+                            on_change=lambda x, state: self._on_sources_changed(
+                                "recursive", state
+                            ),
+                        ),
+                        EntryRow(
+                            label="Extra Folders",
+                            sublabel="Additional folders, separated by commas",
+                            text=", ".join(user_options.wallpaper_slideshow.extra_folders),
+                            on_change=lambda x: self._on_sources_changed(
+                                "extra_folders", _split_list(x.text)
+                            ),
+                            width=200,
+                        ),
+                        EntryRow(
+                            label="Include Patterns",
+                            sublabel="Only use matching files, e.g. *.png, nature/*",
+                            text=", ".join(
+                                user_options.wallpaper_slideshow.include_patterns
+                            ),
+                            on_change=lambda x: self._on_sources_changed(
+                                "include_patterns", _split_list(x.text)
+                            ),
+                            width=200,
+                        ),
+                        EntryRow(
+                            label="Exclude Patterns",
+                            sublabel="Skip matching files and subfolders",
+                            text=", ".join(
+                                user_options.wallpaper_slideshow.exclude_patterns
+                            ),
+                            on_change=lambda x: self._on_sources_changed(
+                                "exclude_patterns", _split_list(x.text)
+                            ),
+                            width=200,
+                        ),
                         SwitchRow(
                             label="Shuffle",
                             sublabel="Randomize wallpaper order",
@@ -137,12 +189,10 @@ class AppearanceEntry(SettingsEntry):
                         ComboBoxRow(
                             label="Transition Effect",
                             sublabel="Visual effect for transitions",
-                            items=["fade", "slide", "zoom", "pixelate", "swirl", "wipe"],
+                            items=[effect.label for effect in self._transition_effects],
                             selected=self._get_shader_index(),
                             on_change=lambda x, index: user_options.wallpaper_slideshow.set_transition_shader(
-                                ["fade", "slide", "zoom", "pixelate", "swirl", "wipe"][
-                                    index
-                                ]
+                                self._transition_effects[index].name
                             ),
                         ),
                     ],
@@ -263,6 +313,24 @@ class AppearanceEntry(SettingsEntry):
                             step=1,
                             width=80,
                         ),
+                        SwitchRow(
+                            label="Order by Usage",
+                            sublabel="Show the most used pinned apps first",
+                            active=user_options.dock.bind("order_by_usage"),
+                            on_change=lambda x, state: user_options.dock.set_order_by_usage(state),
+                        ),
+                        SpinRow(
+                            label="Suggested Apps",
+                            sublabel="Most used unpinned apps shown in the dock",
+                            value=user_options.dock.bind("suggested_apps"),
+                            on_change=lambda x, value: user_options.dock.set_suggested_apps(
+                                int(value)
+                            ),
+                            min=0,
+                            max=10,
+                            step=1,
+                            width=80,
+                        ),
                     ],
                 ),
             ],
@@ -338,7 +406,7 @@ class AppearanceEntry(SettingsEntry):
 
     def _get_shader_index(self) -> int:
         """Get the index for the current shader."""
-        shaders = ["fade", "slide", "zoom", "pixelate", "swirl", "wipe"]
+        shaders = [effect.name for effect in self._transition_effects]
         try:
             return shaders.index(user_options.wallpaper_slideshow.transition_shader)
         except ValueError:
@@ -361,6 +429,28 @@ class AppearanceEntry(SettingsEntry):
                 folder_path, user_options.wallpaper_slideshow.shuffle_enabled
             )
 
+    def _on_sources_changed(self, option: str, value) -> None:
+        """Store a wallpaper source option and schedule a rescan."""
+        if getattr(user_options.wallpaper_slideshow, option) == value:
+            return
+
+        getattr(user_options.wallpaper_slideshow, f"set_{option}")(value)
+
+        # Entry rows fire on every keystroke; rescan once editing settles
+        if self._rescan_id is not None:
+            GLib.source_remove(self._rescan_id)
+        self._rescan_id = GLib.timeout_add(RESCAN_DELAY, self._rescan_sources)
+
+    def _rescan_sources(self) -> bool:
+        """Rescan wallpaper folders with the current source options."""
+        self._rescan_id = None
+        if user_options.wallpaper_slideshow.use_folder:
+            wallpaper_slideshow_service.set_folder(
+                user_options.wallpaper_slideshow.folder_path,
+                user_options.wallpaper_slideshow.shuffle_enabled,
+            )
+        return False
+
     def _on_slideshow_toggled(self, enabled: bool) -> None:
         """Handle slideshow enable/disable."""
         user_options.wallpaper_slideshow.set_slideshow_enabled(enabled)
@@ -17,6 +17,8 @@ service = WallpaperSlideshowService.get_default()
 
 class WallpaperSlideshowEntry(SettingsEntry):
     def __init__(self):
+        self._transition_effects = service.get_transition_effects()
+
         page = SettingsPage(
             name="Wallpaper Slideshow",
             groups=[
@@ -157,12 +159,10 @@ class WallpaperSlideshowEntry(SettingsEntry):
                         ComboBoxRow(
                             label="Transition Effect",
                             sublabel="Visual effect for wallpaper transitions",
-                            items=["fade", "slide", "zoom", "pixelate", "swirl", "wipe"],
+                            items=[effect.label for effect in self._transition_effects],
                             selected=self._get_shader_index(),
                             on_change=lambda x, index: user_options.wallpaper_slideshow.set_transition_shader(
-                                ["fade", "slide", "zoom", "pixelate", "swirl", "wipe"][
-                                    index
-                                ]
+                                self._transition_effects[index].name
                             ),
                         ),
                         widgets.ListBoxRow(
@@ -245,7 +245,7 @@ class WallpaperSlideshowEntry(SettingsEntry):
 
     def _get_shader_index(self) -> int:
         """Get the index for the current shader."""
-        shaders = ["fade", "slide", "zoom", "pixelate", "swirl", "wipe"]
+        shaders = [effect.name for effect in self._transition_effects]
         try:
             return shaders.index(user_options.wallpaper_slideshow.transition_shader)
         except ValueError:
@@ -0,0 +1,132 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+from PIL import Image
+from gi.repository import GLib, Gdk  # type: ignore
+from .image_lru import ImageLRU, scaled_size
+
+# Decoded images kept in memory, in bytes
+IMAGE_CACHE_BUDGET = 32 * 1024 * 1024
+
+# Images are decoded at this multiple of their display size for HiDPI outputs
+DISPLAY_SCALE = 2
+
+
+class NotificationImageCache:
+    """Notification images downscaled to display size, shared by all views.
+
+    Images are decoded and downscaled once on a worker thread, newest
+    request first, and kept as textures in an LRU bounded by
+    IMAGE_CACHE_BUDGET. Popups and the notification center showing the
+    same image at the same size share one texture. Callbacks run on the
+    main thread.
+    """
+
+    def __init__(self, budget: int = IMAGE_CACHE_BUDGET):
+        self._textures = ImageLRU(budget)
+        self._lock = threading.Lock()
+        self._requests: OrderedDict[tuple, list[Callable]] = OrderedDict()
+        self._worker: Optional[threading.Thread] = None
+
+    def request(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        callback: Callable[[Optional[Gdk.Texture]], None],
+        cover: bool = False,
+    ) -> None:
+        """Call ``callback(texture)`` with an image scaled for width x height.
+
+        Runs the callback right away if the image is cached. The texture is
+        None if the image cannot be loaded, so the caller can fall back to
+        showing the file as is.
+        """
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            callback(None)
+            return
+
+        key = (path, mtime, width * DISPLAY_SCALE, height * DISPLAY_SCALE, cover)
+        texture = self._textures.get(key)
+        if texture is not None:
+            callback(texture)
+            return
+
+        with self._lock:
+            self._requests.setdefault(key, []).append(callback)
+            self._requests.move_to_end(key)
+
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._requests:
+                    self._worker = None
+                    return
+                key, callbacks = self._requests.popitem(last=True)
+
+            GLib.idle_add(self._deliver, key, self._decode(*key), callbacks)
+
+    @staticmethod
+    def _decode(path: str, mtime: float, width: int, height: int, cover: bool) -> Optional[tuple]:
+        try:
+            with Image.open(path) as img:
+                size = scaled_size(img.width, img.height, width, height, cover)
+                # Lets JPEG decode at a fraction of the full resolution
+                img.draft("RGB", size)
+                img = img.convert("RGBA")
+                if img.size != size:
+                    img = img.resize(size, Image.Resampling.LANCZOS)
+                return img.width, img.height, img.tobytes()
+        except Exception as e:
+            print(f"Failed to load notification image {path}: {e}")
+            return None
+
+    def _deliver(self, key: tuple, decoded: Optional[tuple], callbacks: list[Callable]) -> bool:
+        if decoded is None:
+            for callback in callbacks:
+                callback(None)
+            return False
+
+        width, height, data = decoded
+        texture = Gdk.MemoryTexture.new(
+            width,
+            height,
+            Gdk.MemoryFormat.R8G8B8A8,
+            GLib.Bytes.new(data),
+            width * 4,
+        )
+        self._textures.put(key, texture, len(data))
+        for callback in callbacks:
+            callback(texture)
+        return False
+
+
+_image_cache: Optional[NotificationImageCache] = None
+
+
+def get_image_cache() -> NotificationImageCache:
+    """Get the image cache shared by notification popups and the center."""
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = NotificationImageCache()
+    return _image_cache
+
+
+def is_raster_image(image: str) -> bool:
+    """Whether a notification icon is an image file Pillow can decode.
+
+    Icon names and vector images (e.g. SVG app icons) are left to GTK.
+    """
+    extension = os.path.splitext(image)[1].lower()
+    return (
+        image.startswith("/")
+        and extension in Image.registered_extensions()
+        and os.path.isfile(image)
+    )
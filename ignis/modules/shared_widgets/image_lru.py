@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ImageLRU:
+    """Least recently used cache bounded by the total size of its values.
+
+    Every value is stored with its cost in bytes. Adding a value evicts the
+    least recently used ones until the total fits ``budget``; a value larger
+    than the whole budget is not stored.
+    """
+
+    def __init__(self, budget: int):
+        self._budget = budget
+        self._size = 0
+        # key -> (value, cost), least recently used first
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def size(self) -> int:
+        """Total cost of the stored values in bytes."""
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, cost: int) -> list:
+        """Store a value; returns the keys evicted to make room."""
+        self.pop(key)
+        if cost > self._budget:
+            return []
+
+        self._entries[key] = (value, cost)
+        self._size += cost
+
+        evicted = []
+        while self._size > self._budget:
+            old_key, (_, old_cost) = self._entries.popitem(last=False)
+            self._size -= old_cost
+            evicted.append(old_key)
+        return evicted
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._size -= entry[1]
+        return entry[0]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+def scaled_size(width: int, height: int, target_width: int, target_height: int, cover: bool = False) -> tuple[int, int]:
+    """Get the size to downscale an image to for display at a target size.
+
+    With ``cover`` the image fills the target (cropping the excess), so the
+    smaller scale factor that still covers it is used; otherwise it fits
+    inside. Images are never upscaled.
+    """
+    scale_x = target_width / width
+    scale_y = target_height / height
+    scale = max(scale_x, scale_y) if cover else min(scale_x, scale_y)
+    if scale >= 1:
+        return width, height
+    return max(1, round(width * scale)), max(1, round(height * scale))
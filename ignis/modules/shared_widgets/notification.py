@@ -2,6 +2,11 @@ import asyncio
 from ignis import widgets
 from ignis.services.notifications import Notification
 from ignis import utils
+from .image_cache import get_image_cache, is_raster_image
+
+SCREENSHOT_WIDTH = 1920 // 7
+SCREENSHOT_HEIGHT = 1080 // 7
+ICON_SIZE = 48
 
 
 class ScreenshotLayout(widgets.Box):
@@ -13,11 +18,19 @@ class ScreenshotLayout(widgets.Box):
                 widgets.Box(
                     child=[
                         widgets.Picture(
-                            image=notification.icon,
                             content_fit="cover",
-                            width=1920 // 7,
-                            height=1080 // 7,
+                            width=SCREENSHOT_WIDTH,
+                            height=SCREENSHOT_HEIGHT,
                             style="border-radius: 1rem; background-color: black;",
+                            setup=lambda self: get_image_cache().request(
+                                notification.icon,
+                                SCREENSHOT_WIDTH,
+                                SCREENSHOT_HEIGHT,
+                                lambda texture: self.set_paintable(texture)
+                                if texture
+                                else self.set_image(notification.icon),
+                                cover=True,
+                            ),
                         ),
                         widgets.Button(
                             child=widgets.Icon(
@@ -58,6 +71,29 @@ class ScreenshotLayout(widgets.Box):
         )
 
 
+class NotificationIcon(widgets.Icon):
+    """Notification icon; raster image files are loaded through the shared cache."""
+
+    def __init__(self, icon: str) -> None:
+        self._icon = icon
+        cached = bool(icon) and is_raster_image(icon)
+        super().__init__(
+            image=icon if icon and not cached else "dialog-information-symbolic",
+            pixel_size=ICON_SIZE,
+            halign="start",
+            valign="start",
+        )
+        if cached:
+            get_image_cache().request(icon, ICON_SIZE, ICON_SIZE, self.__on_texture)
+
+    def __on_texture(self, texture) -> None:
+        if texture:
+            self.set_from_paintable(texture)
+        else:
+            # Let GTK try the file itself
+            self.image = self._icon
+
+
 class NormalLayout(widgets.Box):
     def __init__(self, notification: Notification) -> None:
         super().__init__(
@@ -66,14 +102,7 @@ class NormalLayout(widgets.Box):
             child=[
                 widgets.Box(
                     child=[
-                        widgets.Icon(
-                            image=notification.icon
-                            if notification.icon
-                            else "dialog-information-symbolic",
-                            pixel_size=48,
-                            halign="start",
-                            valign="start",
-                        ),
+                        NotificationIcon(notification.icon),
                         widgets.Box(
                             vertical=True,
                             style="margin-left: 0.75rem;",
@@ -0,0 +1,41 @@
+"""
+Incremental updates of the wallpaper picker grid model.
+"""
+from typing import Optional
+
+
+def model_splices(shown: list[str], queue: list[str]) -> Optional[list[tuple[int, int, list[str]]]]:
+    """Compute the list model splices turning ``shown`` into ``queue``.
+
+    Returns ``(position, n_removals, additions)`` tuples, applied in order,
+    one per run of removed and added paths, so unchanged cells keep their
+    bindings and the grid keeps its scroll position. Returns None if paths
+    present in both lists changed their relative order (e.g. the queue was
+    shuffled); the whole model has to be replaced then.
+    """
+    shown_set = set(shown)
+    queue_set = set(queue)
+    splices = []
+
+    i = j = 0
+    while i < len(shown) or j < len(queue):
+        start = j
+        removals = 0
+        while i < len(shown) and shown[i] not in queue_set:
+            i += 1
+            removals += 1
+        while j < len(queue) and queue[j] not in shown_set:
+            j += 1
+
+        if removals or j > start:
+            # Everything before ``start`` already matches the queue
+            splices.append((start, removals, queue[start:j]))
+
+        if i < len(shown) and j < len(queue):
+            if shown[i] != queue[j]:
+                return None
+            i += 1
+            j += 1
+        elif i < len(shown) or j < len(queue):
+            return None
+    return splices
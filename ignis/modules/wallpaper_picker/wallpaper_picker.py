@@ -1,46 +1,122 @@
 import os
-from gi.repository import GLib
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+from gi.repository import GLib, Gtk  # type: ignore
 from ignis import widgets
 from ignis.window_manager import WindowManager
 from services.wallpaper_slideshow import WallpaperSlideshowService
-from user_options import user_options
+from .model_sync import model_splices
 
 
 window_manager = WindowManager.get_default()
 
+# Grid layout
+GRID_COLUMNS = 4
 
-class WallpaperPickerItem(widgets.Button):
-    """A single wallpaper thumbnail item in the picker grid."""
 
-    def __init__(self, wallpaper_path: str, service: WallpaperSlideshowService):
-        self._wallpaper_path = wallpaper_path
+class ThumbnailLoader:
+    """Generates thumbnails on a single worker thread.
+
+    The most recently requested thumbnail is produced first, and requests
+    for cells that were scrolled away can be discarded before they run.
+    Callbacks are invoked on the main thread.
+    """
+
+    def __init__(self, service: WallpaperSlideshowService):
         self._service = service
+        self._lock = threading.Lock()
+        self._requests: OrderedDict[str, list[Callable]] = OrderedDict()
+        self._worker: Optional[threading.Thread] = None
+
+    def request(self, wallpaper_path: str, callback: Callable[[str, Optional[str]], None]) -> None:
+        """Generate a thumbnail and call ``callback(wallpaper_path, thumbnail)``."""
+        with self._lock:
+            self._requests.setdefault(wallpaper_path, []).append(callback)
+            self._requests.move_to_end(wallpaper_path)
+
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+
+    def discard(self, wallpaper_path: str) -> None:
+        """Forget a request that has not started yet."""
+        with self._lock:
+            self._requests.pop(wallpaper_path, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._requests:
+                    self._worker = None
+                    return
+                wallpaper_path, callbacks = self._requests.popitem(last=True)
+
+            thumbnail = self._service._cache.generate_thumbnail(wallpaper_path)
+            GLib.idle_add(self._deliver, wallpaper_path, thumbnail, callbacks)
+
+    @staticmethod
+    def _deliver(wallpaper_path: str, thumbnail: Optional[str], callbacks: list[Callable]) -> bool:
+        for callback in callbacks:
+            callback(wallpaper_path, thumbnail)
+        return False
 
-        # Get thumbnail
-        thumbnail_path = service._cache.get_thumbnail_path(wallpaper_path)
 
-        # Generate if doesn't exist
-        if not os.path.exists(thumbnail_path):
-            GLib.idle_add(lambda: service._cache.generate_thumbnail(wallpaper_path))
-            thumbnail_path = wallpaper_path  # Use original until thumbnail is ready
+class WallpaperPickerItem(widgets.Button):
+    """A recycled wallpaper thumbnail cell in the picker grid.
+
+    Cells are created once per visible grid slot and rebound to different
+    wallpapers as the grid scrolls.
+    """
+
+    def __init__(self, service: WallpaperSlideshowService, loader: ThumbnailLoader):
+        self._service = service
+        self._loader = loader
+        self._wallpaper_path: Optional[str] = None
+
+        self._picture = widgets.Picture(
+            image="",
+            width=200,
+            height=112,  # 16:9 aspect ratio
+            content_fit="cover",
+            css_classes=["wallpaper-picker-thumbnail"],
+        )
 
         super().__init__(
             css_classes=["wallpaper-picker-item"],
-            child=widgets.Picture(
-                image=thumbnail_path,
-                width=200,
-                height=112,  # 16:9 aspect ratio
-                content_fit="cover",
-                css_classes=["wallpaper-picker-thumbnail"],
-            ),
+            child=self._picture,
             on_click=lambda x: self._on_click(),
-            tooltip_text=os.path.basename(wallpaper_path),
         )
 
+    def bind(self, wallpaper_path: str) -> None:
+        """Show a wallpaper in this cell, requesting its thumbnail if needed."""
+        self._wallpaper_path = wallpaper_path
+        self.set_tooltip_text(os.path.basename(wallpaper_path))
+
+        thumbnail_path = self._service._cache.get_thumbnail_path(wallpaper_path)
+        if os.path.exists(thumbnail_path):
+            self._picture.set_image(thumbnail_path)
+        else:
+            self._picture.set_image("")
+            self._loader.request(wallpaper_path, self._on_thumbnail_ready)
+
+    def unbind(self) -> None:
+        """Release the wallpaper shown in this cell."""
+        if self._wallpaper_path:
+            self._loader.discard(self._wallpaper_path)
+        self._wallpaper_path = None
+        self._picture.set_image("")
+
+    def _on_thumbnail_ready(self, wallpaper_path: str, thumbnail: Optional[str]) -> None:
+        # The cell may have been recycled for another wallpaper meanwhile
+        if wallpaper_path == self._wallpaper_path and thumbnail:
+            self._picture.set_image(thumbnail)
+
     def _on_click(self) -> None:
         """Handle wallpaper selection."""
-        self._service.set_wallpaper(self._wallpaper_path)
-        window_manager.close_window("ignis_WALLPAPER_PICKER")
+        if self._wallpaper_path:
+            self._service.set_wallpaper(self._wallpaper_path)
+            window_manager.close_window("ignis_WALLPAPER_PICKER")
 
 
 class WallpaperPicker(widgets.Window):
@@ -48,21 +124,41 @@ class WallpaperPicker(widgets.Window):
 
     def __init__(self):
         self._service = WallpaperSlideshowService.get_default()
-        self._grid = widgets.Grid(
-            column_spacing=12,
-            row_spacing=12,
+        self._loader = ThumbnailLoader(self._service)
+
+        # Virtualized grid: only visible cells are materialized and recycled
+        self._model = Gtk.StringList()
+        self._model_dirty = True
+        # Paths in the model, to apply queue updates as splices
+        self._shown: list[str] = []
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_item_setup)
+        factory.connect("bind", self._on_item_bind)
+        factory.connect("unbind", self._on_item_unbind)
+
+        self._grid = Gtk.GridView(
+            model=Gtk.NoSelection(model=self._model),
+            factory=factory,
+            min_columns=GRID_COLUMNS,
+            max_columns=GRID_COLUMNS,
             css_classes=["wallpaper-picker-grid"],
         )
 
-        # Scrollable container
-        scrolled = widgets.Scroll(
+        # Scrollable container (GridView must be the direct child to virtualize)
+        self._scrolled = widgets.Scroll(
             vexpand=True,
             hexpand=True,
-            child=widgets.Box(
-                vertical=True,
-                css_classes=["wallpaper-picker-container"],
-                child=[self._grid],
-            ),
+            child=self._grid,
+        )
+
+        self._placeholder = widgets.Label(
+            label="No wallpapers found.\nConfigure a folder in Settings.",
+            halign="center",
+            valign="center",
+            vexpand=True,
+            visible=False,
+            css_classes=["wallpaper-picker-placeholder"],
         )
 
         # Header with folder info
@@ -110,38 +206,50 @@ class WallpaperPicker(widgets.Window):
                     widgets.Box(
                         vertical=True,
                         css_classes=["wallpaper-picker-content"],
-                        child=[header, scrolled],
+                        child=[header, self._scrolled, self._placeholder],
                     ),
                 ],
             ),
             setup=lambda self: self.connect("notify::visible", self._on_visibility_changed),
         )
 
+        self._service.connect("queue-updated", lambda x: self._on_queue_updated())
+
     def _on_visibility_changed(self, *args) -> None:
-        """Load wallpapers when window becomes visible."""
+        """Sync the grid model when the window becomes visible."""
+        if self.visible and self._model_dirty:
+            self._sync_model()
+
+    def _on_queue_updated(self) -> None:
+        """Mark the model stale; sync right away only if the picker is open."""
+        self._model_dirty = True
         if self.visible:
-            self._load_wallpapers()
+            self._sync_model()
+
+    def _sync_model(self) -> None:
+        """Bring the grid model in line with the service queue.
 
-    def _load_wallpapers(self) -> None:
-        """Load wallpapers from the queue into the grid."""
-        # Get wallpapers from service queue
+        Only added and removed paths are spliced in, so a streamed scan
+        does not rebind every visible cell or reset the scroll position.
+        """
         wallpapers = self._service.get_queue()
+        splices = model_splices(self._shown, wallpapers)
+        if splices is None:
+            splices = [(0, len(self._shown), wallpapers)]
+
+        for position, n_removals, additions in splices:
+            self._model.splice(position, n_removals, additions)
+        self._shown = wallpapers
+        self._model_dirty = False
+
+        self._scrolled.set_visible(bool(wallpapers))
+        self._placeholder.set_visible(not wallpapers)
+
+    def _on_item_setup(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        list_item.set_child(WallpaperPickerItem(self._service, self._loader))
+
+    def _on_item_bind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        list_item.get_child().bind(list_item.get_item().get_string())
 
-        if not wallpapers:
-            # Show placeholder
-            placeholder = widgets.Label(
-                label="No wallpapers found.\nConfigure a folder in Settings.",
-                halign="center",
-                valign="center",
-                css_classes=["wallpaper-picker-placeholder"],
-            )
-            self._grid.attach(placeholder, 0, 0, 3, 1)  # Span 3 columns
-            return
-
-        # Add wallpaper items in a grid (4 columns)
-        columns = 4
-        for i, wallpaper_path in enumerate(wallpapers):
-            item = WallpaperPickerItem(wallpaper_path, self._service)
-            row = i // columns
-            col = i % columns
-            self._grid.attach(item, col, row, 1, 1)
+    def _on_item_unbind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        list_item.get_child().unbind()
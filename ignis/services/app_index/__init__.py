@@ -0,0 +1,3 @@
+from .service import AppIndexService
+
+__all__ = ["AppIndexService"]
@@ -0,0 +1,68 @@
+from typing import Any, Iterable, Optional
+
+
+def _stem(app_id: str) -> str:
+    return app_id.lower().removesuffix(".desktop")
+
+
+class AppIndex:
+    """Lookup tables for applications.
+
+    Applications are keyed by desktop id, lowercase desktop id without the
+    ``.desktop`` suffix, lowercase name and lowercase StartupWMClass, so
+    resolving a pinned id or a window class is a few dict lookups instead
+    of scans over every installed application. When keys collide, the
+    application added first wins.
+    """
+
+    def __init__(self):
+        self._apps: list[Any] = []
+        self._by_id: dict[str, Any] = {}
+        self._by_stem: dict[str, Any] = {}
+        self._by_name: dict[str, Any] = {}
+        self._by_wm_class: dict[str, Any] = {}
+        # Last reverse-DNS component, e.g. "nautilus" for org.gnome.Nautilus
+        self._by_short_id: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._apps)
+
+    @property
+    def apps(self) -> list[Any]:
+        """Applications in the order they were added."""
+        return self._apps
+
+    def add(self, app: Any, app_id: str, name: str = "", wm_class: str = "") -> None:
+        """Index an application under its desktop id, name and window class."""
+        self._apps.append(app)
+        stem = _stem(app_id)
+        self._by_id.setdefault(app_id, app)
+        self._by_stem.setdefault(stem, app)
+        self._by_short_id.setdefault(stem.rsplit(".", 1)[-1], app)
+        if name:
+            self._by_name.setdefault(name.lower(), app)
+        if wm_class:
+            self._by_wm_class.setdefault(wm_class.lower(), app)
+
+    def get(self, app_id: str) -> Optional[Any]:
+        """Get an application by exact desktop id."""
+        return self._by_id.get(app_id)
+
+    def find(self, query: str) -> Optional[Any]:
+        """Find an application by desktop id (with or without ``.desktop``) or name."""
+        app = self._by_id.get(query)
+        if app is not None:
+            return app
+        return self._by_stem.get(_stem(query)) or self._by_name.get(query.lower())
+
+    def find_by_wm_class(self, wm_class: str) -> Optional[Any]:
+        """Find the application owning windows of a class (or Wayland app id)."""
+        if not wm_class:
+            return None
+        key = wm_class.lower()
+        return (
+            self._by_wm_class.get(key)
+            or self._by_stem.get(_stem(key))
+            or self._by_name.get(key)
+            or self._by_short_id.get(key.rsplit(".", 1)[-1])
+        )
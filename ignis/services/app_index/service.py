@@ -0,0 +1,69 @@
+from typing import Optional
+from gi.repository import GObject  # type: ignore
+from ignis.base_service import BaseService
+from ignis.services.applications import ApplicationsService, Application
+from .index import AppIndex
+
+
+class AppIndexService(BaseService):
+    """Shared application lookup for the dock, launcher and bar.
+
+    The index is built on first use and dropped when the application list
+    changes; ``changed`` is emitted then so users can refresh their items.
+    Fuzzy-search fallbacks are memoized until the next change.
+    """
+
+    __gsignals__ = {
+        "changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
+    }
+
+    def __init__(self):
+        super().__init__()
+
+        self._applications = ApplicationsService.get_default()
+        self._index: Optional[AppIndex] = None
+        self._fuzzy: dict[str, Optional[Application]] = {}
+        self._applications.connect("notify::apps", lambda *args: self._invalidate())
+
+    @GObject.Property
+    def apps(self) -> list[Application]:
+        """All applications."""
+        return self._applications.apps
+
+    def _invalidate(self) -> None:
+        self._index = None
+        self._fuzzy.clear()
+        self.emit("changed")
+        self.notify("apps")
+
+    def _get_index(self) -> AppIndex:
+        if self._index is None:
+            index = AppIndex()
+            for app in self._applications.apps:
+                index.add(app, app.id, app.name, app.app.get_startup_wm_class() or "")
+            self._index = index
+        return self._index
+
+    def get(self, app_id: str) -> Optional[Application]:
+        """Get an application by exact desktop id."""
+        return self._get_index().get(app_id)
+
+    def find(self, query: str, fuzzy: bool = True) -> Optional[Application]:
+        """Find an application by desktop id or name.
+
+        Args:
+            query: Desktop id (with or without ``.desktop``) or name
+            fuzzy: Fall back to the applications service search
+        """
+        app = self._get_index().find(query)
+        if app is not None or not fuzzy:
+            return app
+
+        if query not in self._fuzzy:
+            results = self._applications.search(self._applications.apps, query)
+            self._fuzzy[query] = results[0] if results else None
+        return self._fuzzy[query]
+
+    def find_by_wm_class(self, wm_class: str) -> Optional[Application]:
+        """Find the application owning windows of a class."""
+        return self._get_index().find_by_wm_class(wm_class)
@@ -0,0 +1,3 @@
+from .service import DefaultBrowserService
+
+__all__ = ["DefaultBrowserService"]
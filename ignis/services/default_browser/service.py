@@ -0,0 +1,122 @@
+import os
+import asyncio
+from typing import Optional
+from gi.repository import GLib, Gio, GObject, GioUnix  # type: ignore
+from ignis.base_service import BaseService
+from ignis import utils
+
+# Shown until the browser is known, or if it has no icon
+FALLBACK_ICON = "applications-internet-symbolic"
+
+# Delay used to coalesce bursts of mimeapps.list events into one lookup (ms)
+MIMEAPPS_EVENT_DEBOUNCE = 300
+
+
+class DefaultBrowserService(BaseService):
+    """Cached identity and icon of the default web browser.
+
+    ``xdg-settings`` is run once, asynchronously, and again only when
+    mimeapps.list changes, so widgets can bind to ``icon-name`` without
+    forking a process whenever they are shown.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self._desktop_id: str = ""
+        self._icon_name: str = FALLBACK_ICON
+        self._refreshing: bool = False
+        self._stale: bool = False
+        self._pending_refresh_id: Optional[int] = None
+
+        path = os.path.join(GLib.get_user_config_dir(), "mimeapps.list")
+        self._monitor: Optional[Gio.FileMonitor] = None
+        try:
+            self._monitor = Gio.File.new_for_path(path).monitor_file(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+            self._monitor.connect("changed", self._on_mimeapps_changed)
+        except GLib.Error as e:
+            print(f"Failed to monitor {path}: {e}")
+
+        # Defer until the event loop is ready
+        GLib.idle_add(self._on_refresh_timeout)
+
+    @GObject.Property
+    def desktop_id(self) -> str:
+        """Desktop file id of the default browser, empty if unknown."""
+        return self._desktop_id
+
+    @GObject.Property
+    def icon_name(self) -> str:
+        """Icon of the default browser."""
+        return self._icon_name
+
+    def refresh(self) -> None:
+        """Look up the default browser again in the background."""
+        if self._refreshing:
+            self._stale = True
+            return
+        self._refreshing = True
+        asyncio.create_task(self._lookup())
+
+    async def _lookup(self) -> None:
+        try:
+            while True:
+                self._stale = False
+                try:
+                    result = await utils.exec_sh_async(
+                        "xdg-settings get default-web-browser"
+                    )
+                    desktop_id = result.stdout.strip()
+                except Exception as e:
+                    print(f"Failed to get default browser: {e}")
+                    desktop_id = ""
+
+                if not self._stale:
+                    self._apply(desktop_id)
+                    return
+        finally:
+            self._refreshing = False
+
+    def _apply(self, desktop_id: str) -> None:
+        icon_name = FALLBACK_ICON
+        if desktop_id:
+            app_info = GioUnix.DesktopAppInfo.new(desktop_id=desktop_id)
+            if app_info:
+                icon_name = app_info.get_string("Icon") or FALLBACK_ICON
+
+        if desktop_id != self._desktop_id:
+            self._desktop_id = desktop_id
+            self.notify("desktop-id")
+        if icon_name != self._icon_name:
+            self._icon_name = icon_name
+            self.notify("icon-name")
+
+    def _on_mimeapps_changed(
+        self,
+        monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other_file: Optional[Gio.File],
+        event_type: Gio.FileMonitorEvent
+    ) -> None:
+        if event_type not in (
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.CREATED,
+            Gio.FileMonitorEvent.DELETED,
+            Gio.FileMonitorEvent.MOVED_IN,
+            Gio.FileMonitorEvent.RENAMED,
+        ):
+            return
+
+        # Debounce: applications rewrite the file in several steps
+        if self._pending_refresh_id is not None:
+            GLib.source_remove(self._pending_refresh_id)
+        self._pending_refresh_id = GLib.timeout_add(
+            MIMEAPPS_EVENT_DEBOUNCE, self._on_refresh_timeout
+        )
+
+    def _on_refresh_timeout(self) -> bool:
+        self._pending_refresh_id = None
+        self.refresh()
+        return False
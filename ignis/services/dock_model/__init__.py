@@ -0,0 +1,3 @@
+from .service import DockModelService, DockEntry
+
+__all__ = ["DockModelService", "DockEntry"]
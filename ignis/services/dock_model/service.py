@@ -0,0 +1,185 @@
+from typing import Optional
+from gi.repository import GLib, GObject  # type: ignore
+from ignis.base_service import BaseService
+from ignis.services.applications import Application
+from user_options import user_options
+from services.app_index import AppIndexService
+from services.launch_history import LaunchHistoryService
+from services.running_apps import RunningAppsService
+
+
+class DockEntry:
+    """An application shown in the dock.
+
+    Args:
+        app: The application
+        pinned: Whether the app is pinned (otherwise it is suggested)
+        running: Whether the app has open windows
+    """
+
+    __slots__ = ("app", "pinned", "running")
+
+    def __init__(self, app: Application, pinned: bool, running: bool):
+        self.app = app
+        self.pinned = pinned
+        self.running = running
+
+    @property
+    def app_id(self) -> str:
+        return self.app.id
+
+
+class DockModelService(BaseService):
+    """Ordered dock entries shared by the docks on every monitor.
+
+    Pinned ids are resolved, ordered and combined with suggested apps once
+    per change here; each dock only mirrors the result. Signals:
+
+    - ``changed``: entries were added, removed or reordered
+    - ``entry-changed(app_id)``: pin or running state of an entry changed
+    - ``reset``: entries refer to new Application objects; recreate items
+    """
+
+    __gsignals__ = {
+        "changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
+        "entry-changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, (str,)),
+        "reset": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
+    }
+
+    def __init__(self):
+        super().__init__()
+
+        self._app_index = AppIndexService.get_default()
+        self._launch_history = LaunchHistoryService.get_default()
+        self._running_apps = RunningAppsService.get_default()
+
+        self._entries: list[DockEntry] = []
+        self._entries_by_id: dict[str, DockEntry] = {}
+        self._usage_refresh_id: Optional[int] = None
+        self._update()
+
+        for option in ("pinned_apps", "order_by_usage", "suggested_apps"):
+            user_options.dock.connect_option(option, self.refresh)
+        self._launch_history.connect("changed", lambda *args: self._on_usage_changed())
+        self._app_index.connect("changed", lambda *args: self._on_installed_apps_changed())
+        self._running_apps.connect("app-changed", self._on_running_changed)
+
+    @property
+    def entries(self) -> list[DockEntry]:
+        """Entries in dock order: pinned apps, then suggested apps."""
+        return self._entries
+
+    def get(self, app_id: str) -> Optional[DockEntry]:
+        return self._entries_by_id.get(app_id)
+
+    def _desired(self) -> list[tuple[Application, bool]]:
+        pinned: dict[str, Application] = {}
+        for app_id in user_options.dock.pinned_apps:
+            app = self._app_index.find(app_id)
+            if app:
+                pinned.setdefault(app.id, app)
+
+        if user_options.dock.order_by_usage:
+            apps = [(pinned[i], True) for i in self._launch_history.rank(pinned)]
+        else:
+            apps = [(app, True) for app in pinned.values()]
+
+        # The most used apps that are not pinned
+        suggested = user_options.dock.suggested_apps
+        if suggested > 0:
+            for app_id in self._launch_history.top(suggested + len(pinned)):
+                app = self._app_index.get(app_id) if app_id not in pinned else None
+                if not app:
+                    continue
+                apps.append((app, False))
+                suggested -= 1
+                if suggested == 0:
+                    break
+
+        return apps
+
+    def _update(self) -> tuple[bool, list[str]]:
+        """Recompute the entries.
+
+        Returns:
+            Whether the order changed, and ids of kept entries whose pin state changed
+        """
+        entries = []
+        entries_by_id = {}
+        repinned = []
+        for app, pinned in self._desired():
+            entry = self._entries_by_id.get(app.id)
+            if entry is None:
+                entry = DockEntry(app, pinned, self._running_apps.is_running(app.id))
+            elif entry.pinned != pinned:
+                entry.pinned = pinned
+                repinned.append(app.id)
+            entries.append(entry)
+            entries_by_id[app.id] = entry
+
+        order_changed = [e.app_id for e in entries] != [e.app_id for e in self._entries]
+        self._entries = entries
+        self._entries_by_id = entries_by_id
+        return order_changed, repinned
+
+    def refresh(self) -> None:
+        """Recompute the entries and notify the docks of what changed."""
+        order_changed, repinned = self._update()
+        if order_changed:
+            self.emit("changed")
+        for app_id in repinned:
+            self.emit("entry-changed", app_id)
+
+    def _on_usage_changed(self) -> None:
+        if not user_options.dock.order_by_usage and user_options.dock.suggested_apps <= 0:
+            return
+        # Deferred, so a dock item is not removed while handling its click
+        if self._usage_refresh_id is None:
+            self._usage_refresh_id = GLib.idle_add(self._on_usage_refresh)
+
+    def _on_usage_refresh(self) -> bool:
+        self._usage_refresh_id = None
+        self.refresh()
+        return False
+
+    def _on_installed_apps_changed(self) -> None:
+        self._entries = []
+        self._entries_by_id = {}
+        self._update()
+        self.emit("reset")
+
+    def _on_running_changed(self, service, app_id: str, running: bool) -> None:
+        entry = self._entries_by_id.get(app_id)
+        if entry and entry.running != running:
+            entry.running = running
+            self.emit("entry-changed", app_id)
+
+    def pin(self, app_id: str) -> None:
+        """Pin an app to the dock."""
+        pinned = list(user_options.dock.pinned_apps)
+        if app_id not in pinned:
+            pinned.append(app_id)
+            user_options.dock.set_pinned_apps(pinned)
+            user_options.save_to_file(user_options._file)
+            self.refresh()
+
+    def unpin(self, app_id: str) -> None:
+        """Unpin an app from the dock, whichever id or name it was pinned by."""
+        pinned = [
+            entry
+            for entry in user_options.dock.pinned_apps
+            if entry != app_id
+            and getattr(self._app_index.find(entry), "id", None) != app_id
+        ]
+        if len(pinned) != len(user_options.dock.pinned_apps):
+            user_options.dock.set_pinned_apps(pinned)
+            user_options.save_to_file(user_options._file)
+            self.refresh()
+
+    def focus(self, app_id: str) -> bool:
+        """Focus a window of an app; False if it has none."""
+        return self._running_apps.focus(app_id)
+
+    def quit(self, app_id: str) -> None:
+        """Close every window of an app."""
+        self._running_apps.quit(app_id)
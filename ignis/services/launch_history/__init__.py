@@ -0,0 +1,3 @@
+from .service import LaunchHistoryService
+
+__all__ = ["LaunchHistoryService"]
@@ -0,0 +1,117 @@
+import math
+import time
+from typing import Iterable, Optional
+
+# A launch loses half of its weight after this many seconds (one week)
+HALF_LIFE = 7 * 24 * 60 * 60
+
+# Entries kept when saving; the least used are dropped first
+MAX_ENTRIES = 200
+
+# How strongly usage reorders search results (see boost())
+BOOST_WEIGHT = 0.1
+
+
+class FrecencyStore:
+    """Launch counts and exponentially decaying usage scores.
+
+    Each entry keeps its total launch count, a score and the time the score
+    was last updated. Every launch adds 1 to the score, and the score halves
+    every ``half_life`` seconds, so recent launches weigh more than old ones
+    while frequently used apps stay on top. Decay is applied lazily, so
+    recording a launch and reading a score are O(1).
+    """
+
+    def __init__(self, half_life: float = HALF_LIFE, max_entries: int = MAX_ENTRIES):
+        self._half_life = half_life
+        self._max_entries = max(1, max_entries)
+        # key -> [count, score, updated]
+        self._entries: dict[str, list] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _decayed(self, entry: list, now: float) -> float:
+        elapsed = max(now - entry[2], 0.0)
+        return entry[1] * 0.5 ** (elapsed / self._half_life)
+
+    def record(self, key: str, now: Optional[float] = None) -> None:
+        """Record a launch."""
+        now = time.time() if now is None else now
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = [1, 1.0, now]
+        else:
+            entry[1] = self._decayed(entry, now) + 1.0
+            entry[0] += 1
+            entry[2] = now
+
+    def forget(self, key: str) -> None:
+        """Remove the history of a key."""
+        self._entries.pop(key, None)
+
+    def count(self, key: str) -> int:
+        """Get how many times a key was launched."""
+        entry = self._entries.get(key)
+        return entry[0] if entry else 0
+
+    def score(self, key: str, now: Optional[float] = None) -> float:
+        """Get the decayed usage score of a key (0 if never launched)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0.0
+        return self._decayed(entry, time.time() if now is None else now)
+
+    def boost(self, key: str, now: Optional[float] = None) -> float:
+        """Get a search ranking boost for a key.
+
+        Logarithmic, so heavy use reorders close matches without letting a
+        popular app outrank a much better textual match.
+        """
+        return BOOST_WEIGHT * math.log1p(self.score(key, now))
+
+    def rank(self, keys: Iterable[str], now: Optional[float] = None) -> list[str]:
+        """Sort keys by score, most used first; ties keep their order."""
+        now = time.time() if now is None else now
+        return sorted(keys, key=lambda key: -self.score(key, now))
+
+    def top(self, limit: int, now: Optional[float] = None) -> list[str]:
+        """Get the most used keys."""
+        return self.rank(self._entries, now)[:limit]
+
+    def to_dict(self, now: Optional[float] = None) -> dict:
+        """Serialize, keeping only the ``max_entries`` highest scores."""
+        keys = self.top(self._max_entries, now)
+        return {
+            "version": 1,
+            "half_life": self._half_life,
+            "entries": {key: self._entries[key] for key in keys},
+        }
+
+    def load(self, data: dict) -> None:
+        """Replace the entries with serialized ones, skipping malformed entries.
+
+        Scores saved with a different half-life were decayed at another rate
+        and cannot be converted, so they are reset; launch counts are kept.
+        """
+        self._entries = {}
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            return
+
+        half_life = data.get("half_life", self._half_life)
+        try:
+            same_rate = math.isclose(float(half_life), self._half_life)
+        except (TypeError, ValueError):
+            same_rate = False
+
+        for key, entry in entries.items():
+            try:
+                count, score, updated = entry
+                score = float(score) if same_rate else 0.0
+                self._entries[str(key)] = [int(count), score, float(updated)]
+            except (TypeError, ValueError):
+                continue
@@ -0,0 +1,96 @@
+import os
+import json
+import atexit
+from typing import Iterable, Optional
+from gi.repository import GLib, GObject  # type: ignore
+from ignis.base_service import BaseService
+import ignis
+from .frecency import FrecencyStore
+
+HISTORY_FILE = os.path.join(ignis.DATA_DIR, "launch_history.json")
+
+# Seconds to batch launches before writing the history file
+FLUSH_DELAY = 30
+
+
+class LaunchHistoryService(BaseService):
+    """Application launch history shared by the launcher and the dock.
+
+    Launches are recorded by desktop id. The store is written atomically in
+    batches (and on exit), so launching an app never waits for disk.
+    """
+
+    __gsignals__ = {
+        "changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
+    }
+
+    def __init__(self):
+        super().__init__()
+
+        self._store = FrecencyStore()
+        self._load()
+
+        self._dirty = False
+        self._flush_id: Optional[int] = None
+        atexit.register(self.flush)
+
+    def _load(self) -> None:
+        if not os.path.exists(HISTORY_FILE):
+            return
+        try:
+            with open(HISTORY_FILE) as f:
+                self._store.load(json.load(f))
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Failed to load launch history: {e}")
+
+    def _save(self) -> None:
+        tmp_file = f"{HISTORY_FILE}.tmp"
+        try:
+            os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(self._store.to_dict(), f, separators=(",", ":"))
+            os.replace(tmp_file, HISTORY_FILE)
+        except IOError as e:
+            print(f"Failed to save launch history: {e}")
+
+    def _on_flush_timeout(self) -> bool:
+        self._flush_id = None
+        self.flush()
+        return False
+
+    def flush(self) -> None:
+        """Write pending launches to disk now."""
+        if self._flush_id is not None:
+            GLib.source_remove(self._flush_id)
+            self._flush_id = None
+
+        if self._dirty:
+            self._dirty = False
+            self._save()
+
+    def record(self, app_id: str) -> None:
+        """Record a launch of an application."""
+        if not app_id:
+            return
+        self._store.record(app_id)
+
+        self._dirty = True
+        if self._flush_id is None:
+            self._flush_id = GLib.timeout_add_seconds(FLUSH_DELAY, self._on_flush_timeout)
+        self.emit("changed")
+
+    def score(self, app_id: str) -> float:
+        """Get the usage score of an application."""
+        return self._store.score(app_id)
+
+    def boost(self, app_id: str) -> float:
+        """Get the search ranking boost of an application."""
+        return self._store.boost(app_id)
+
+    def rank(self, app_ids: Iterable[str]) -> list[str]:
+        """Sort application ids, most used first."""
+        return self._store.rank(app_ids)
+
+    def top(self, limit: int) -> list[str]:
+        """Get the most used application ids."""
+        return self._store.top(limit)
@@ -1,9 +1,13 @@
 #!/usr/bin/python
 import os
 import asyncio
+import hashlib
 import json
 import subprocess
 import shutil
+import threading
+from collections import OrderedDict
+from typing import Optional
 from gi.repository import GLib  # type: ignore
 from jinja2 import Template
 
@@ -12,8 +16,9 @@ from ignis.css_manager import CssManager
 from ignis.base_service import BaseService
 from ignis.options import options
 from user_options import user_options
+from json_cache import JsonFileCache
 
-from .constants import MATERIAL_CACHE_DIR, TEMPLATES, SAMPLE_WALL
+from .constants import MATERIAL_CACHE_DIR, PALETTE_CACHE_DIR, TEMPLATES, SAMPLE_WALL
 
 css_manager = CssManager.get_default()
 
@@ -21,6 +26,10 @@ css_manager = CssManager.get_default()
 DEFAULT_COLORS_FILE = os.path.join(os.path.dirname(__file__), "default_colors.json")
 # Runtime cache file (user-specific wallpaper colors)
 RUNTIME_CACHE_FILE = os.path.join(MATERIAL_CACHE_DIR, "wallpaper_colors.json")
+# Number of per-wallpaper palettes kept in memory
+PALETTE_MEMORY_SIZE = 32
+# Number of per-wallpaper palette files kept on disk (least recently used pruned)
+PALETTE_DISK_SIZE = 128
 
 
 class MaterialService(BaseService):
@@ -29,6 +38,13 @@ class MaterialService(BaseService):
     def __init__(self):
         super().__init__()
 
+        # Per-wallpaper palette cache (light, dark), shared with prefetch threads
+        self._palettes: OrderedDict[str, tuple[dict, dict]] = OrderedDict()
+        self._palettes_lock = threading.Lock()
+        # Keys include mtime, size and scheme type, so edited or removed
+        # wallpapers and scheme switches leave files behind; they are pruned
+        self._palette_files = JsonFileCache(PALETTE_CACHE_DIR, PALETTE_DISK_SIZE)
+
         # Try to load colors from cache (fast path)
         if user_options.material.colors == {}:
             self.__load_colors_from_cache()
@@ -142,11 +158,80 @@ class MaterialService(BaseService):
 
         return flattened
 
+    def _palette_key(self, path: str) -> Optional[str]:
+        """Cache key for a wallpaper palette: file identity plus scheme type"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        identity = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}:{user_options.material.matugen_scheme_type}"
+        return hashlib.md5(identity.encode()).hexdigest()
+
+    def get_cached_palette(self, path: str) -> Optional[tuple[dict, dict]]:
+        """Get cached (light, dark) colors for a wallpaper without running matugen"""
+        key = self._palette_key(path)
+        if key is None:
+            return None
+
+        with self._palettes_lock:
+            if key in self._palettes:
+                self._palettes.move_to_end(key)
+                return self._palettes[key]
+
+        data = self._palette_files.load(key)
+        try:
+            palette = (data["light_mode"], data["dark_mode"])
+        except (TypeError, KeyError):
+            return None
+
+        self.__remember_palette(key, palette)
+        return palette
+
+    def prefetch_colors(self, path: str) -> bool:
+        """Generate and cache both palettes for a wallpaper ahead of time.
+
+        Safe to call from a worker thread; a later generate_colors() for the
+        same file then skips matugen entirely.
+        """
+        if self.get_cached_palette(path) is not None:
+            return True
+
+        try:
+            light_colors = self.get_colors_from_img(path, dark_mode=False)
+            dark_colors = self.get_colors_from_img(path, dark_mode=True)
+        except (RuntimeError, OSError) as e:
+            print(f"Failed to prefetch colors for {path}: {e}")
+            return False
+
+        self.__store_palette(path, light_colors, dark_colors)
+        return True
+
+    def __remember_palette(self, key: str, palette: tuple[dict, dict]) -> None:
+        with self._palettes_lock:
+            self._palettes[key] = palette
+            self._palettes.move_to_end(key)
+            while len(self._palettes) > PALETTE_MEMORY_SIZE:
+                self._palettes.popitem(last=False)
+
+    def __store_palette(self, path: str, light_colors: dict, dark_colors: dict) -> None:
+        key = self._palette_key(path)
+        if key is None:
+            return
+
+        # Copy: callers keep mutating their dicts while rendering templates
+        self.__remember_palette(key, (dict(light_colors), dict(dark_colors)))
+        self._palette_files.store(key, {"light_mode": light_colors, "dark_mode": dark_colors})
+
     def generate_colors(self, path: str) -> None:
         """Generate colors from wallpaper and save to runtime cache"""
-        # Generate both light and dark mode colors
-        light_colors = self.get_colors_from_img(path, dark_mode=False)
-        dark_colors = self.get_colors_from_img(path, dark_mode=True)
+        # Generate both light and dark mode colors, reusing prefetched palettes
+        cached = self.get_cached_palette(path)
+        if cached is not None:
+            light_colors, dark_colors = (dict(colors) for colors in cached)
+        else:
+            light_colors = self.get_colors_from_img(path, dark_mode=False)
+            dark_colors = self.get_colors_from_img(path, dark_mode=True)
+            self.__store_palette(path, light_colors, dark_colors)
 
         # Use appropriate colors for current mode
         colors = dark_colors if user_options.material.dark_mode else light_colors
@@ -0,0 +1,3 @@
+from .service import NotificationStoreService, NotificationGroup
+
+__all__ = ["NotificationStoreService", "NotificationGroup"]
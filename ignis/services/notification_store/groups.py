@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# Notifications kept per application; older ones are evicted first
+MAX_PER_APP = 20
+
+# Notifications kept in total
+MAX_TOTAL = 100
+
+
+class GroupStore:
+    """Notifications grouped by application and thread, with retention caps.
+
+    Items are grouped by ``(app, thread)``. Groups are ordered by their most
+    recent item, so a burst from one chat collapses into a single group at
+    the top. Adding an item beyond the per-app or global cap evicts the
+    oldest item of that app, or the oldest overall. All operations are O(1)
+    apart from removing an item from the middle of its group, which is
+    bounded by ``max_per_app``.
+    """
+
+    def __init__(self, max_per_app: int = MAX_PER_APP, max_total: int = MAX_TOTAL):
+        self._max_per_app = max(1, max_per_app)
+        self._max_total = max(1, max_total)
+        # key -> items, oldest first; groups ordered oldest first
+        self._groups: OrderedDict[tuple, list] = OrderedDict()
+        # item -> key
+        self._keys: dict[Any, tuple] = {}
+        # app -> items of the app, oldest first
+        self._apps: dict[str, OrderedDict] = {}
+        # all items, oldest first
+        self._order: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._keys
+
+    def add(self, item: Hashable, app: str, thread: str) -> list:
+        """Add an item as the newest of its group.
+
+        Returns ``(item, key)`` pairs of the items evicted to respect the
+        caps, oldest first.
+        """
+        if item in self._keys:
+            return []
+
+        key = (app, thread)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = []
+        else:
+            self._groups.move_to_end(key)
+        group.append(item)
+
+        self._keys[item] = key
+        self._apps.setdefault(app, OrderedDict())[item] = None
+        self._order[item] = None
+
+        evicted = []
+        app_items = self._apps[app]
+        while len(app_items) > self._max_per_app:
+            oldest = next(iter(app_items))
+            evicted.append((oldest, self.remove(oldest)))
+        while len(self._order) > self._max_total:
+            oldest = next(iter(self._order))
+            evicted.append((oldest, self.remove(oldest)))
+        return evicted
+
+    def remove(self, item: Hashable) -> Optional[tuple]:
+        """Remove an item; returns its group key, or None if unknown."""
+        key = self._keys.pop(item, None)
+        if key is None:
+            return None
+
+        group = self._groups[key]
+        group.remove(item)
+        if not group:
+            del self._groups[key]
+
+        app_items = self._apps[key[0]]
+        del app_items[item]
+        if not app_items:
+            del self._apps[key[0]]
+        del self._order[item]
+        return key
+
+    def clear(self) -> None:
+        self._groups.clear()
+        self._keys.clear()
+        self._apps.clear()
+        self._order.clear()
+
+    def key_of(self, item: Hashable) -> Optional[tuple]:
+        """Get the group key of an item."""
+        return self._keys.get(item)
+
+    def group(self, key: tuple) -> list:
+        """Get the items of a group, newest first."""
+        return self._groups.get(key, [])[::-1]
+
+    def groups(self) -> list[tuple]:
+        """Get the group keys, most recently active first."""
+        return list(reversed(self._groups))
+
+    def app_count(self, app: str) -> int:
+        """Get how many items an application has."""
+        return len(self._apps.get(app, ()))
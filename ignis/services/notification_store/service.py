@@ -0,0 +1,168 @@
+from gi.repository import Gio, GObject  # type: ignore
+from ignis.base_service import BaseService
+from ignis.services.notifications import Notification, NotificationService
+from .groups import GroupStore
+
+
+def thread_of(notification: Notification) -> str:
+    """Get the thread a notification belongs to within its application.
+
+    Chat and mail clients put the conversation or sender in the summary,
+    so notifications with the same summary form one thread.
+    """
+    return notification.summary
+
+
+class NotificationGroup(GObject.Object):
+    """Notifications of one application thread, newest first.
+
+    Emits ``changed`` when notifications are added or removed.
+    """
+
+    __gsignals__ = {
+        "changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, ()),
+    }
+
+    def __init__(self, key: tuple):
+        super().__init__()
+        self._key = key
+        self._notifications: list[Notification] = []
+        self._expanded = False
+
+    @property
+    def key(self) -> tuple:
+        return self._key
+
+    @GObject.Property
+    def app_name(self) -> str:
+        return self._key[0]
+
+    @GObject.Property
+    def notifications(self) -> list:
+        return self._notifications
+
+    @GObject.Property
+    def latest(self) -> Notification:
+        return self._notifications[0]
+
+    @GObject.Property
+    def expanded(self) -> bool:
+        """Whether all notifications are shown instead of the latest one."""
+        return self._expanded
+
+    @expanded.setter
+    def expanded(self, value: bool) -> None:
+        self._expanded = value
+
+    def _set_notifications(self, notifications: list[Notification]) -> None:
+        self._notifications = notifications
+        self.notify("notifications")
+        self.notify("latest")
+        self.emit("changed")
+
+    def close(self) -> None:
+        """Close every notification of the group."""
+        for notification in list(self._notifications):
+            notification.close()
+
+
+class NotificationStoreService(BaseService):
+    """Notifications grouped by application and thread, for the notification center.
+
+    Groups are kept in a list model, most recently active first, so a burst
+    of chat messages moves one group to the top instead of adding a row per
+    message. Notifications beyond the retention caps of GroupStore are
+    closed, oldest first. ``count`` is maintained incrementally.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self._notifications = NotificationService.get_default()
+        self._store = GroupStore()
+        self._groups: dict[tuple, NotificationGroup] = {}
+        self._model = Gio.ListStore(item_type=NotificationGroup)
+
+        # Oldest first, so the newest group ends up on top
+        evicted = []
+        for notification in reversed(self._notifications.notifications):
+            evicted += self._add(notification)
+
+        groups = []
+        for key in self._store.groups():
+            group = self._groups[key] = NotificationGroup(key)
+            group._set_notifications(self._store.group(key))
+            groups.append(group)
+        self._model.splice(0, 0, groups)
+
+        self._notifications.connect("notified", lambda x, notification: self._on_notified(notification))
+        self._close_evicted(evicted)
+
+    @GObject.Property
+    def model(self) -> Gio.ListStore:
+        """List model of NotificationGroup, most recently active first."""
+        return self._model
+
+    @GObject.Property
+    def count(self) -> int:
+        """Number of stored notifications."""
+        return len(self._store)
+
+    def _add(self, notification: Notification) -> list:
+        notification.connect("closed", self._on_closed)
+        return self._store.add(notification, notification.app_name, thread_of(notification))
+
+    def _on_notified(self, notification: Notification) -> None:
+        evicted = self._add(notification)
+        key = self._store.key_of(notification)
+
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = NotificationGroup(key)
+            self._model.insert(0, group)
+        else:
+            self._move_to_top(group)
+
+        for _, evicted_key in evicted:
+            self._sync_group(evicted_key)
+        self._sync_group(key)
+        self.notify("count")
+        self._close_evicted(evicted)
+
+    def _move_to_top(self, group: NotificationGroup) -> None:
+        found, position = self._model.find(group)
+        if found and position == 0:
+            return
+        if found:
+            self._model.remove(position)
+        self._model.insert(0, group)
+
+    def _on_closed(self, notification: Notification) -> None:
+        key = self._store.remove(notification)
+        if key is None:
+            return
+        self._sync_group(key)
+        self.notify("count")
+
+    def _sync_group(self, key: tuple) -> None:
+        group = self._groups.get(key)
+        if group is None:
+            return
+
+        notifications = self._store.group(key)
+        if notifications:
+            group._set_notifications(notifications)
+            return
+
+        del self._groups[key]
+        found, position = self._model.find(group)
+        if found:
+            self._model.remove(position)
+
+    def _close_evicted(self, evicted: list) -> None:
+        for notification, _ in evicted:
+            notification.close()
+
+    def clear_all(self) -> None:
+        """Close all notifications."""
+        self._notifications.clear_all()
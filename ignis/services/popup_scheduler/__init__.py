@@ -0,0 +1,4 @@
+from .service import PopupSchedulerService
+from .queue import PopupEntry
+
+__all__ = ["PopupSchedulerService", "PopupEntry"]
@@ -0,0 +1,177 @@
+import time
+from collections import deque
+from typing import Any, Hashable, Optional
+
+# Popups shown at once; further ones wait in the queue
+MAX_VISIBLE = 3
+
+# More than BURST_THRESHOLD popups within BURST_WINDOW seconds is a burst
+BURST_THRESHOLD = 5
+BURST_WINDOW = 2.0
+
+
+class PopupEntry:
+    """One popup, showing one or more notifications.
+
+    Notifications with the same key (app and summary) are coalesced into
+    one entry; a digest entry collects everything that arrived during a
+    burst.
+    """
+
+    __slots__ = ("key", "digest", "items")
+
+    def __init__(self, key: Optional[Hashable], digest: bool = False):
+        self.key = key
+        self.digest = digest
+        # Newest last
+        self.items: list = []
+
+    @property
+    def count(self) -> int:
+        return len(self.items)
+
+    @property
+    def latest(self) -> Any:
+        return self.items[-1]
+
+    def __repr__(self) -> str:
+        return f"PopupEntry({self.key!r}, digest={self.digest}, count={self.count})"
+
+
+class PopupQueue:
+    """Decides which notification popups are visible.
+
+    ``push`` and ``dismiss`` return a list of ``(action, entry)`` operations
+    for the views to apply, where action is "show", "update" or "hide".
+
+    At most ``max_visible`` entries are shown; the rest wait in FIFO order
+    and are shown as visible ones are dismissed. A notification whose key
+    matches a visible or queued entry is added to that entry instead of
+    getting its own popup. When more than ``burst_threshold`` notifications
+    arrive within ``burst_window`` seconds, the queue and all further
+    notifications are folded into a single digest entry until it is
+    dismissed.
+    """
+
+    def __init__(
+        self,
+        max_visible: int = MAX_VISIBLE,
+        burst_threshold: int = BURST_THRESHOLD,
+        burst_window: float = BURST_WINDOW,
+    ):
+        self._max_visible = max(1, max_visible)
+        self._burst_threshold = burst_threshold
+        self._burst_window = burst_window
+
+        self._visible: list[PopupEntry] = []
+        self._queued: deque[PopupEntry] = deque()
+        self._by_key: dict[Hashable, PopupEntry] = {}
+        self._entries: dict[Any, PopupEntry] = {}
+        self._digest: Optional[PopupEntry] = None
+        self._arrivals: deque[float] = deque()
+
+    @property
+    def visible(self) -> list[PopupEntry]:
+        return list(self._visible)
+
+    @property
+    def queued(self) -> list[PopupEntry]:
+        return list(self._queued)
+
+    def entry_of(self, item: Any) -> Optional[PopupEntry]:
+        return self._entries.get(item)
+
+    def _is_burst(self, now: float) -> bool:
+        self._arrivals.append(now)
+        while self._arrivals and now - self._arrivals[0] > self._burst_window:
+            self._arrivals.popleft()
+        return len(self._arrivals) > self._burst_threshold
+
+    def _add_item(self, entry: PopupEntry, item: Any) -> list:
+        entry.items.append(item)
+        self._entries[item] = entry
+        return [("update", entry)] if entry in self._visible else []
+
+    def _start_digest(self) -> list:
+        digest = self._digest = PopupEntry(None, digest=True)
+
+        # Queued popups would only show after the burst; fold them in
+        for entry in self._queued:
+            for item in entry.items:
+                digest.items.append(item)
+                self._entries[item] = digest
+            self._by_key.pop(entry.key, None)
+        self._queued.clear()
+
+        if len(self._visible) < self._max_visible:
+            self._visible.append(digest)
+            return [("show", digest)]
+        self._queued.appendleft(digest)
+        return []
+
+    def push(self, item: Hashable, key: Hashable, now: Optional[float] = None) -> list:
+        """Schedule a popup for a notification."""
+        if item in self._entries:
+            return []
+        burst = self._is_burst(time.monotonic() if now is None else now)
+
+        if self._digest is not None:
+            return self._add_item(self._digest, item)
+
+        entry = self._by_key.get(key)
+        if entry is not None:
+            return self._add_item(entry, item)
+
+        if burst:
+            operations = self._start_digest()
+            return operations + self._add_item(self._digest, item)
+
+        entry = self._by_key[key] = PopupEntry(key)
+        entry.items.append(item)
+        self._entries[item] = entry
+        if len(self._visible) < self._max_visible:
+            self._visible.append(entry)
+            return [("show", entry)]
+        self._queued.append(entry)
+        return []
+
+    def discard(self, entry: PopupEntry) -> list:
+        """Remove a whole entry at once, e.g. when the user closes its popup.
+
+        Its notifications are forgotten, so dismissing them afterwards does
+        not produce further operations.
+        """
+        for item in entry.items:
+            self._entries.pop(item, None)
+        entry.items = []
+        return self._remove_entry(entry)
+
+    def dismiss(self, item: Any) -> list:
+        """Remove a notification whose popup timed out or was dismissed."""
+        entry = self._entries.pop(item, None)
+        if entry is None:
+            return []
+
+        entry.items.remove(item)
+        if entry.items:
+            return [("update", entry)] if entry in self._visible else []
+        return self._remove_entry(entry)
+
+    def _remove_entry(self, entry: PopupEntry) -> list:
+        if entry is self._digest:
+            self._digest = None
+        elif self._by_key.get(entry.key) is entry:
+            del self._by_key[entry.key]
+
+        if entry not in self._visible:
+            if entry in self._queued:
+                self._queued.remove(entry)
+            return []
+
+        self._visible.remove(entry)
+        operations = [("hide", entry)]
+        while self._queued and len(self._visible) < self._max_visible:
+            promoted = self._queued.popleft()
+            self._visible.append(promoted)
+            operations.append(("show", promoted))
+        return operations
@@ -0,0 +1,63 @@
+from gi.repository import GObject  # type: ignore
+from ignis.base_service import BaseService
+from ignis.services.notifications import Notification, NotificationService
+from .queue import PopupQueue, PopupEntry
+
+_SIGNALS = {"show": "popup-shown", "update": "popup-updated", "hide": "popup-hidden"}
+
+
+class PopupSchedulerService(BaseService):
+    """Notification popups shared by the popup windows on every monitor.
+
+    Decides once per notification which popups are visible (see
+    PopupQueue); each monitor only mirrors the result. Signals:
+
+    - ``popup-shown(entry)``: a PopupEntry became visible
+    - ``popup-updated(entry)``: notifications were added to or removed from
+      a visible entry
+    - ``popup-hidden(entry)``: a visible entry was dismissed
+    """
+
+    __gsignals__ = {
+        "popup-shown": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, (object,)),
+        "popup-updated": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, (object,)),
+        "popup-hidden": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, (object,)),
+    }
+
+    def __init__(self):
+        super().__init__()
+
+        self._queue = PopupQueue()
+        self._notifications = NotificationService.get_default()
+        self._notifications.connect("new_popup", lambda x, notification: self._on_new_popup(notification))
+
+    @GObject.Property
+    def visible(self) -> list:
+        """Visible PopupEntry objects, oldest first."""
+        return self._queue.visible
+
+    def _on_new_popup(self, notification: Notification) -> None:
+        notification.connect("dismissed", self._on_dismissed)
+        notification.connect("closed", self._on_dismissed)
+        self._apply(self._queue.push(notification, (notification.app_name, notification.summary)))
+
+    def _on_dismissed(self, notification: Notification) -> None:
+        self._apply(self._queue.dismiss(notification))
+
+    def _apply(self, operations: list) -> None:
+        for action, entry in operations:
+            self.emit(_SIGNALS[action], entry)
+        if operations:
+            self.notify("visible")
+
+    def dismiss(self, entry: PopupEntry) -> None:
+        """Dismiss a popup and every notification in it.
+
+        The popup is hidden in one step before its notifications are
+        dismissed, so a digest of many notifications is not updated once
+        per notification on its way out.
+        """
+        notifications = list(entry.items)
+        self._apply(self._queue.discard(entry))
+        for notification in notifications:
+            notification.dismiss()
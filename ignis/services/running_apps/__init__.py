@@ -0,0 +1,3 @@
+from .service import RunningAppsService
+
+__all__ = ["RunningAppsService"]
@@ -0,0 +1,89 @@
+from typing import Optional
+from gi.repository import GObject  # type: ignore
+from ignis.base_service import BaseService
+from ignis.services.hyprland import HyprlandService, HyprlandWindow
+from services.app_index import AppIndexService
+from .tracker import RunningTracker
+
+
+class RunningAppsService(BaseService):
+    """Applications with open windows, fed by Hyprland IPC events.
+
+    Window classes are mapped to desktop entries through the shared app
+    index. ``app-changed`` is emitted with the application id only when an
+    application opens its first window or closes its last one.
+    """
+
+    __gsignals__ = {
+        "app-changed": (GObject.SignalFlags.RUN_FIRST, GObject.TYPE_NONE, (str, bool)),
+    }
+
+    def __init__(self):
+        super().__init__()
+
+        self._hyprland = HyprlandService.get_default()
+        self._app_index = AppIndexService.get_default()
+        self._tracker = RunningTracker(self._resolve)
+
+        if not self._hyprland.is_available:
+            return
+
+        for window in self._hyprland.windows:
+            self._add_window(window)
+
+        self._hyprland.connect("window-added", lambda x, window: self._add_window(window))
+        self._hyprland.connect("notify::active-window", lambda *args: self._on_active_window())
+        self._app_index.connect("changed", lambda *args: self._on_apps_changed())
+
+    def _resolve(self, wm_class: str) -> Optional[str]:
+        app = self._app_index.find_by_wm_class(wm_class)
+        return app.id if app else None
+
+    def _add_window(self, window: HyprlandWindow) -> None:
+        address = window.address
+        window.connect("closed", lambda x: self._remove_window(address))
+        app_id = self._tracker.add_window(address, window.class_name)
+        if app_id:
+            self.emit("app-changed", app_id, True)
+
+    def _remove_window(self, address: str) -> None:
+        app_id = self._tracker.remove_window(address)
+        if app_id:
+            self.emit("app-changed", app_id, False)
+
+    def _on_active_window(self) -> None:
+        self._tracker.focus_window(self._hyprland.active_window.address)
+
+    def _on_apps_changed(self) -> None:
+        for app_id in self._tracker.reresolve():
+            self.emit("app-changed", app_id, self._tracker.is_running(app_id))
+
+    def is_running(self, app_id: str) -> bool:
+        """Whether an application has open windows."""
+        return self._tracker.is_running(app_id)
+
+    def running_apps(self) -> list[str]:
+        """Ids of applications with open windows."""
+        return self._tracker.running_apps()
+
+    def focus(self, app_id: str) -> bool:
+        """Focus a window of an application.
+
+        Focuses the most recently used window; if it is already focused, the
+        least recently used one, so repeated calls cycle through all windows.
+        Returns False if the application has no windows.
+        """
+        windows = self._tracker.windows(app_id)
+        if not windows:
+            return False
+
+        address = windows[0]
+        if len(windows) > 1 and address == self._hyprland.active_window.address:
+            address = windows[-1]
+        self._hyprland.send_command(f"dispatch focuswindow address:{address}")
+        return True
+
+    def quit(self, app_id: str) -> None:
+        """Close every window of an application."""
+        for address in self._tracker.windows(app_id):
+            self._hyprland.send_command(f"dispatch closewindow address:{address}")
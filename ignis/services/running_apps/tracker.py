@@ -0,0 +1,97 @@
+from typing import Callable, Optional
+
+
+class RunningTracker:
+    """Open windows grouped by the application that owns them.
+
+    Windows are added and removed by address as compositor events arrive.
+    Each window class is resolved to an application id once (through
+    ``resolve``) and cached, so an event costs a few dict operations. Per
+    application, windows are kept most recently focused first.
+
+    ``add_window`` and ``remove_window`` return the application id whose
+    running state changed (first window opened or last window closed), so
+    callers only update what an event affected.
+    """
+
+    def __init__(self, resolve: Callable[[str], Optional[str]]):
+        self._resolve = resolve
+        self._class_cache: dict[str, Optional[str]] = {}
+        # address -> app id (None for windows of unknown applications)
+        self._window_apps: dict[str, Optional[str]] = {}
+        self._window_classes: dict[str, str] = {}
+        # app id -> addresses, most recently focused first
+        self._app_windows: dict[str, list[str]] = {}
+
+    def _app_for_class(self, wm_class: str) -> Optional[str]:
+        if wm_class not in self._class_cache:
+            self._class_cache[wm_class] = self._resolve(wm_class)
+        return self._class_cache[wm_class]
+
+    def is_running(self, app_id: str) -> bool:
+        return app_id in self._app_windows
+
+    def running_apps(self) -> list[str]:
+        """Ids of applications with open windows."""
+        return list(self._app_windows)
+
+    def windows(self, app_id: str) -> list[str]:
+        """Window addresses of an application, most recently focused first."""
+        return list(self._app_windows.get(app_id, ()))
+
+    def app_for_window(self, address: str) -> Optional[str]:
+        return self._window_apps.get(address)
+
+    def add_window(self, address: str, wm_class: str) -> Optional[str]:
+        """Track a window. Returns the app id if it just started running."""
+        if address in self._window_apps:
+            return None
+        app_id = self._app_for_class(wm_class)
+        self._window_apps[address] = app_id
+        self._window_classes[address] = wm_class
+        if app_id is None:
+            return None
+
+        windows = self._app_windows.setdefault(app_id, [])
+        windows.append(address)
+        return app_id if len(windows) == 1 else None
+
+    def remove_window(self, address: str) -> Optional[str]:
+        """Forget a window. Returns the app id if it stopped running."""
+        self._window_classes.pop(address, None)
+        app_id = self._window_apps.pop(address, None)
+        if app_id is None:
+            return None
+
+        windows = self._app_windows[app_id]
+        windows.remove(address)
+        if windows:
+            return None
+        del self._app_windows[app_id]
+        return app_id
+
+    def focus_window(self, address: str) -> None:
+        """Move a window to the front of its application's windows."""
+        app_id = self._window_apps.get(address)
+        if app_id is None:
+            return
+        windows = self._app_windows[app_id]
+        if windows[0] != address:
+            windows.remove(address)
+            windows.insert(0, address)
+
+    def reresolve(self) -> set[str]:
+        """Resolve every window again, e.g. after applications changed.
+
+        Returns:
+            Ids of applications whose running state changed
+        """
+        before = set(self._app_windows)
+        windows = list(self._window_classes.items())
+        self._class_cache.clear()
+        self._window_apps.clear()
+        self._window_classes.clear()
+        self._app_windows.clear()
+        for address, wm_class in windows:
+            self.add_window(address, wm_class)
+        return before ^ set(self._app_windows)
@@ -0,0 +1,155 @@
+import asyncio
+import shutil
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional
+
+
+class WallpaperRequest:
+    """A wallpaper change to be applied by a backend.
+
+    Args:
+        path: Wallpaper image
+        transition_type: Backend-specific transition name
+        transition_args: Extra backend-specific transition arguments
+        duration: Transition duration in seconds
+        fps: Transition frame rate
+        outputs: Per-output images (output name -> image), e.g. variants
+            pre-scaled to each monitor; ``path`` is used on all outputs if empty
+    """
+
+    def __init__(
+        self,
+        path: str,
+        transition_type: str = "fade",
+        transition_args: Optional[list[str]] = None,
+        duration: float = 1.0,
+        fps: int = 60,
+        outputs: Optional[dict[str, str]] = None,
+    ):
+        self.path = path
+        self.outputs = outputs or {}
+        self.transition_type = transition_type
+        self.transition_args = transition_args or []
+        self.duration = duration
+        self.fps = fps
+
+
+class WallpaperBackend(ABC):
+    """Applies wallpapers, coalescing bursts of requests.
+
+    While a request is being applied, newer requests replace each other and
+    only the latest one is applied next, so rapidly pressing next/previous
+    never queues up a backlog of transitions. Subclasses implement ``apply``.
+    """
+
+    name = ""
+
+    def __init__(self):
+        self._pending: Optional[tuple[WallpaperRequest, Optional[Callable]]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def busy(self) -> bool:
+        """Whether a request is being applied."""
+        return self._task is not None and not self._task.done()
+
+    def submit(
+        self,
+        request: WallpaperRequest,
+        on_done: Optional[Callable[[WallpaperRequest, bool], None]] = None,
+    ) -> None:
+        """Apply a request, replacing any request still waiting.
+
+        ``on_done(request, success)`` is called once the request was applied
+        or failed; it is never called for requests that were superseded.
+        """
+        self._pending = (request, on_done)
+        if not self.busy:
+            self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            request, on_done = self._pending
+            self._pending = None
+
+            try:
+                success = await self.apply(request)
+            except Exception as e:
+                print(f"Failed to set wallpaper with {self.name}: {e}")
+                success = False
+
+            if on_done:
+                on_done(request, success)
+
+    @abstractmethod
+    async def apply(self, request: WallpaperRequest) -> bool:
+        """Apply a single request. Returns True on success."""
+
+
+class SwwwBackend(WallpaperBackend):
+    """Sets wallpapers through the swww client.
+
+    The client is executed directly (no shell), so paths with spaces or
+    shell metacharacters are passed through untouched.
+    """
+
+    name = "swww"
+
+    def __init__(self, binary: str = "swww"):
+        super().__init__()
+        self._binary = binary
+
+    @staticmethod
+    def is_available(binary: str = "swww") -> bool:
+        """Check whether the swww client is installed."""
+        return shutil.which(binary) is not None
+
+    def build_command(self, request: WallpaperRequest, image: Optional[str] = None, outputs: Iterable[str] = ()) -> list[str]:
+        """Build the ``swww img`` argument vector for a request.
+
+        Args:
+            request: The wallpaper request
+            image: Image to show instead of ``request.path``
+            outputs: Outputs to limit the command to (all outputs if empty)
+        """
+        argv = [
+            self._binary, "img",
+            "--transition-type", request.transition_type,
+            "--transition-duration", str(request.duration),
+            "--transition-fps", str(request.fps),
+            *request.transition_args,
+        ]
+        outputs = list(outputs)
+        if outputs:
+            argv.extend(["--outputs", ",".join(outputs)])
+        argv.extend(["--", image or request.path])
+        return argv
+
+    def build_commands(self, request: WallpaperRequest) -> list[list[str]]:
+        """Build one command per distinct image of a request."""
+        if not request.outputs:
+            return [self.build_command(request)]
+
+        by_image: dict[str, list[str]] = {}
+        for output, image in request.outputs.items():
+            by_image.setdefault(image, []).append(output)
+        return [self.build_command(request, image, outputs) for image, outputs in by_image.items()]
+
+    async def apply(self, request: WallpaperRequest) -> bool:
+        # Outputs showing different variants transition together
+        results = await asyncio.gather(*(self._run(argv) for argv in self.build_commands(request)))
+        return all(results)
+
+    async def _run(self, argv: list[str]) -> bool:
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await process.communicate()
+
+        if process.returncode != 0:
+            message = stderr.decode(errors="replace").strip()
+            print(f"swww exited with {process.returncode}: {message}")
+            return False
+        return True
@@ -1,15 +1,19 @@
 import os
 import json
+import atexit
 import hashlib
+import threading
 from pathlib import Path
 from typing import Optional
 from PIL import Image
 from gi.repository import GLib
 import ignis
+from .history import WallpaperHistory
 
 
 CACHE_DIR = os.path.join(ignis.CACHE_DIR, "wallpaper")
 THUMBNAIL_DIR = os.path.join(CACHE_DIR, "thumbnails")
+VARIANT_DIR = os.path.join(CACHE_DIR, "variants")
 METADATA_FILE = os.path.join(CACHE_DIR, "metadata.json")
 HISTORY_FILE = os.path.join(CACHE_DIR, "history.json")
 CURRENT_WALLPAPER_LINK = os.path.join(CACHE_DIR, "current")
@@ -17,14 +21,27 @@ CURRENT_WALLPAPER_LINK = os.path.join(CACHE_DIR, "current")
 THUMBNAIL_SIZE = (256, 256)
 MAX_HISTORY = 100
 
+# Seconds to batch history changes before writing history.json
+HISTORY_FLUSH_DELAY = 10
+
 
 class WallpaperCache:
     """Manages caching of wallpaper thumbnails, metadata, and history."""
 
-    def __init__(self):
+    def __init__(self, history_size: int = MAX_HISTORY):
         self._ensure_cache_dirs()
         self._metadata = self._load_metadata()
-        self._history = self._load_history()
+        self._history = WallpaperHistory(history_size, self._load_history())
+
+        # History is written in batches; pending changes are flushed on exit
+        self._history_dirty = False
+        self._history_flush_id: Optional[int] = None
+        atexit.register(self.flush_history)
+
+        # Thumbnails are generated from the picker and prefetch threads;
+        # each one is written by a single thread, the others wait for it
+        self._thumbnail_lock = threading.Lock()
+        self._thumbnails_in_flight: dict[str, threading.Event] = {}
 
     def _ensure_cache_dirs(self) -> None:
         """Create cache directories if they don't exist."""
@@ -59,13 +76,38 @@ class WallpaperCache:
         return []
 
     def _save_history(self) -> None:
-        """Save wallpaper history to disk."""
+        """Save wallpaper history to disk atomically."""
+        tmp_file = f"{HISTORY_FILE}.tmp"
         try:
-            with open(HISTORY_FILE, "w") as f:
-                json.dump(self._history, f, indent=2)
+            with open(tmp_file, "w") as f:
+                json.dump(self._history.to_list(), f, indent=2)
+            os.replace(tmp_file, HISTORY_FILE)
         except IOError as e:
             print(f"Failed to save history: {e}")
 
+    def _mark_history_dirty(self) -> None:
+        """Schedule a batched history write."""
+        self._history_dirty = True
+        if self._history_flush_id is None:
+            self._history_flush_id = GLib.timeout_add_seconds(
+                HISTORY_FLUSH_DELAY, self._on_history_flush_timeout
+            )
+
+    def _on_history_flush_timeout(self) -> bool:
+        self._history_flush_id = None
+        self.flush_history()
+        return False  # Don't repeat timer
+
+    def flush_history(self) -> None:
+        """Write pending history changes to disk now."""
+        if self._history_flush_id is not None:
+            GLib.source_remove(self._history_flush_id)
+            self._history_flush_id = None
+
+        if self._history_dirty:
+            self._history_dirty = False
+            self._save_history()
+
     def _get_file_hash(self, filepath: str) -> str:
         """Generate a hash for a file path to use as cache key."""
         return hashlib.md5(filepath.encode()).hexdigest()
@@ -84,12 +126,40 @@ class WallpaperCache:
             return None
 
         thumbnail_path = self.get_thumbnail_path(wallpaper_path)
+        if self._is_thumbnail_fresh(thumbnail_path, wallpaper_path):
+            return thumbnail_path
 
-        # Return cached thumbnail if it exists and is newer than source
-        if os.path.exists(thumbnail_path):
-            if os.path.getmtime(thumbnail_path) >= os.path.getmtime(wallpaper_path):
-                return thumbnail_path
+        with self._thumbnail_lock:
+            in_flight = self._thumbnails_in_flight.get(thumbnail_path)
+            if in_flight is None:
+                done = self._thumbnails_in_flight[thumbnail_path] = threading.Event()
+
+        if in_flight is not None:
+            in_flight.wait()
+            return thumbnail_path if os.path.exists(thumbnail_path) else None
 
+        try:
+            # Checked again, another thread may have just finished it
+            if self._is_thumbnail_fresh(thumbnail_path, wallpaper_path):
+                return thumbnail_path
+            return self._write_thumbnail(wallpaper_path, thumbnail_path)
+        finally:
+            with self._thumbnail_lock:
+                del self._thumbnails_in_flight[thumbnail_path]
+            done.set()
+
+    @staticmethod
+    def _is_thumbnail_fresh(thumbnail_path: str, wallpaper_path: str) -> bool:
+        """Whether a cached thumbnail exists and is newer than its source."""
+        try:
+            return os.path.getmtime(thumbnail_path) >= os.path.getmtime(wallpaper_path)
+        except OSError:
+            return False
+
+    def _write_thumbnail(self, wallpaper_path: str, thumbnail_path: str) -> Optional[str]:
+        # Written next to the thumbnail and moved into place, so a reader
+        # never sees a partially written file
+        tmp_file = f"{thumbnail_path}.{threading.get_ident()}.tmp"
         try:
             # Generate thumbnail
             with Image.open(wallpaper_path) as img:
@@ -101,11 +171,16 @@ class WallpaperCache:
                 img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
 
                 # Save as JPEG for smaller file size
-                img.save(thumbnail_path, "JPEG", quality=85, optimize=True)
+                img.save(tmp_file, "JPEG", quality=85, optimize=True)
 
+            os.replace(tmp_file, thumbnail_path)
             return thumbnail_path
         except Exception as e:
             print(f"Failed to generate thumbnail for {wallpaper_path}: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             return None
 
     def get_metadata(self, wallpaper_path: str) -> dict:
@@ -151,35 +226,30 @@ class WallpaperCache:
             return None
 
     def add_to_history(self, wallpaper_path: str) -> None:
-        """Add a wallpaper to the history, maintaining max size."""
-        # Remove if already in history
-        if wallpaper_path in self._history:
-            self._history.remove(wallpaper_path)
+        """Move a wallpaper to the front of the history."""
+        if self._history.newest == wallpaper_path:
+            return
 
-        # Add to front
-        self._history.insert(0, wallpaper_path)
+        self._history.push(wallpaper_path)
+        self._mark_history_dirty()
 
-        # Trim to max size
-        if len(self._history) > MAX_HISTORY:
-            self._history = self._history[:MAX_HISTORY]
-
-        self._save_history()
+    def set_history_size(self, history_size: int) -> None:
+        """Change how many wallpapers the history keeps."""
+        previous_length = len(self._history)
+        self._history.set_capacity(history_size)
+        if len(self._history) != previous_length:
+            self._mark_history_dirty()
 
     def get_history(self) -> list[str]:
         """Get the wallpaper history list."""
-        return self._history.copy()
+        return self._history.to_list()
 
     def get_previous_wallpaper(self, current_wallpaper: str) -> Optional[str]:
-        """Get the previous wallpaper from history."""
-        try:
-            current_index = self._history.index(current_wallpaper)
-            if current_index < len(self._history) - 1:
-                return self._history[current_index + 1]
-        except (ValueError, IndexError):
-            pass
+        """Get the previous wallpaper from history.
 
-        # If current not in history or is last, return None
-        return None
+        Returns None if current is not in history or is the oldest entry.
+        """
+        return self._history.older(current_wallpaper)
 
     def set_current_wallpaper(self, wallpaper_path: str) -> None:
         """Update the current wallpaper symlink."""
@@ -209,9 +279,10 @@ class WallpaperCache:
 
         # Clear metadata and history
         self._metadata = {}
-        self._history = []
+        self._history.clear()
         self._save_metadata()
-        self._save_history()
+        self._history_dirty = True
+        self.flush_history()
 
         # Clear current wallpaper link
         if os.path.exists(CURRENT_WALLPAPER_LINK) or os.path.islink(CURRENT_WALLPAPER_LINK):
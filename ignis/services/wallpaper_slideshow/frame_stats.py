@@ -0,0 +1,68 @@
+import bisect
+from typing import Optional
+
+
+# Upper bounds of the frame-time histogram buckets, in milliseconds.
+# The last bucket collects everything slower.
+FRAME_TIME_BUCKETS = (8.3, 16.7, 33.3, 50.0, 100.0)
+
+
+class FrameStats:
+    """Frame-time histogram for a single transition.
+
+    Frame times are the intervals between rendered frames. Frames that the
+    animation clock skipped because the main loop fell behind are counted
+    separately as dropped.
+    """
+
+    def __init__(self, effect: str, target_interval: float):
+        self.effect = effect
+        self.target_interval = target_interval
+        self.counts = [0] * (len(FRAME_TIME_BUCKETS) + 1)
+        self.frames = 0
+        self.dropped = 0
+        self.duration = 0.0
+        self.worst = 0.0
+
+    def record(self, frame_time: float) -> None:
+        """Record the time since the previous frame, in milliseconds."""
+        self.counts[bisect.bisect_left(FRAME_TIME_BUCKETS, frame_time)] += 1
+        self.frames += 1
+        self.duration += frame_time
+        self.worst = max(self.worst, frame_time)
+
+        # Frames that would have been shown at the target rate meanwhile
+        missed = int(frame_time / self.target_interval + 0.5) - 1
+        if missed > 0:
+            self.dropped += missed
+
+    @property
+    def average(self) -> Optional[float]:
+        """Average frame time in milliseconds."""
+        if not self.frames:
+            return None
+        return self.duration / self.frames
+
+    @property
+    def fps(self) -> Optional[float]:
+        """Average frames per second."""
+        if not self.duration:
+            return None
+        return self.frames * 1000.0 / self.duration
+
+    def histogram(self) -> dict[str, int]:
+        """Get bucket counts keyed by a readable label, e.g. "<=16.7ms"."""
+        labels = [f"<={bound}ms" for bound in FRAME_TIME_BUCKETS]
+        labels.append(f">{FRAME_TIME_BUCKETS[-1]}ms")
+        return dict(zip(labels, self.counts))
+
+    def summary(self) -> str:
+        """One-line description suitable for logs."""
+        if not self.frames:
+            return f"{self.effect}: no frames"
+        buckets = " ".join(f"{label}:{count}" for label, count in self.histogram().items() if count)
+        return (
+            f"{self.effect}: {self.frames} frames, {self.fps:.1f} fps, "
+            f"avg {self.average:.1f}ms, worst {self.worst:.1f}ms, "
+            f"{self.dropped} dropped [{buckets}]"
+        )
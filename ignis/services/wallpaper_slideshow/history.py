@@ -0,0 +1,109 @@
+from typing import Iterable, Iterator, Optional
+
+
+class WallpaperHistory:
+    """Most-recent-first wallpaper history with a fixed capacity.
+
+    Entries form a doubly linked list keyed by path, so moving a wallpaper
+    to the front, dropping the oldest entry and finding the entry before or
+    after a given wallpaper are all O(1). Paths are unique.
+    """
+
+    def __init__(self, capacity: int, entries: Iterable[str] = ()):
+        self._capacity = max(1, capacity)
+        self._newer: dict[str, Optional[str]] = {}
+        self._older: dict[str, Optional[str]] = {}
+        self._newest: Optional[str] = None
+        self._oldest: Optional[str] = None
+
+        # entries are newest first, so push them oldest first
+        unique = list(dict.fromkeys(entries))[: self._capacity]
+        for path in reversed(unique):
+            self.push(path)
+
+    def __len__(self) -> int:
+        return len(self._older)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._older
+
+    def __iter__(self) -> Iterator[str]:
+        path = self._newest
+        while path is not None:
+            yield path
+            path = self._older[path]
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of entries kept."""
+        return self._capacity
+
+    @property
+    def newest(self) -> Optional[str]:
+        """Most recently pushed wallpaper."""
+        return self._newest
+
+    def push(self, path: str) -> None:
+        """Move a wallpaper to the front, evicting the oldest over capacity."""
+        if path == self._newest:
+            return
+
+        if path in self._older:
+            self._unlink(path)
+
+        self._newer[path] = None
+        self._older[path] = self._newest
+        if self._newest is not None:
+            self._newer[self._newest] = path
+        self._newest = path
+        if self._oldest is None:
+            self._oldest = path
+
+        while len(self._older) > self._capacity:
+            self._unlink(self._oldest)
+
+    def remove(self, path: str) -> bool:
+        """Remove a wallpaper from the history."""
+        if path not in self._older:
+            return False
+        self._unlink(path)
+        return True
+
+    def older(self, path: str) -> Optional[str]:
+        """Get the wallpaper that was shown before ``path``."""
+        return self._older.get(path)
+
+    def newer(self, path: str) -> Optional[str]:
+        """Get the wallpaper that was shown after ``path``."""
+        return self._newer.get(path)
+
+    def set_capacity(self, capacity: int) -> None:
+        """Change the capacity, dropping the oldest entries if needed."""
+        self._capacity = max(1, capacity)
+        while len(self._older) > self._capacity:
+            self._unlink(self._oldest)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._newer.clear()
+        self._older.clear()
+        self._newest = None
+        self._oldest = None
+
+    def to_list(self) -> list[str]:
+        """Get the history as a list, most recent first."""
+        return list(self)
+
+    def _unlink(self, path: str) -> None:
+        newer = self._newer.pop(path)
+        older = self._older.pop(path)
+
+        if newer is None:
+            self._newest = older
+        else:
+            self._older[newer] = older
+
+        if older is None:
+            self._oldest = newer
+        else:
+            self._newer[older] = newer
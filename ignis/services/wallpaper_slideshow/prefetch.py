@@ -0,0 +1,114 @@
+import os
+import threading
+from typing import Callable, Iterable, Optional
+from gi.repository import GLib
+
+
+# Seconds to wait after a wallpaper switch before warming upcoming entries,
+# so prefetching never competes with the transition itself
+PREFETCH_DELAY = 5
+
+
+def warm_page_cache(path: str) -> None:
+    """Ask the kernel to read a file ahead so the next decode hits memory."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+class WallpaperPrefetcher:
+    """Warms caches for upcoming slideshow wallpapers in a background thread.
+
+    Each warmer is a callable taking a wallpaper path (thumbnail generation,
+    palette extraction, ...). Wallpapers are warmed one at a time by a single
+    worker, and a file is only warmed again after it changes on disk.
+    """
+
+    def __init__(self, warmers: Iterable[Callable[[str], object]]):
+        self._warmers = list(warmers)
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._warmed: dict[str, int] = {}
+        self._worker: Optional[threading.Thread] = None
+        self._timer_id: Optional[int] = None
+
+    def add_warmer(self, warmer: Callable[[str], object]) -> None:
+        """Register an additional warm-up step."""
+        self._warmers.append(warmer)
+
+    def is_warm(self, path: str) -> bool:
+        """Check whether a wallpaper was already warmed in its current state."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return False
+        with self._lock:
+            return self._warmed.get(path) == mtime
+
+    def schedule(self, paths: Iterable[str], delay: int = PREFETCH_DELAY) -> None:
+        """Warm the given wallpapers after ``delay`` seconds.
+
+        Replaces any previously scheduled batch that has not started yet.
+        """
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return
+
+        self._timer_id = GLib.timeout_add_seconds(delay, self._start, paths)
+
+    def invalidate(self) -> None:
+        """Forget which wallpapers were warmed, e.g. after warmer inputs changed."""
+        with self._lock:
+            self._warmed.clear()
+
+    def cancel(self) -> None:
+        """Drop scheduled and queued work (the current file still finishes)."""
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+        with self._lock:
+            self._pending.clear()
+
+    def _start(self, paths: list[str]) -> bool:
+        self._timer_id = None
+        pending = [path for path in paths if not self.is_warm(path)]
+
+        with self._lock:
+            self._pending = pending
+            if not pending or (self._worker and self._worker.is_alive()):
+                return False
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+        return False
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._worker = None
+                    return
+                path = self._pending.pop(0)
+
+            self._warm(path)
+
+    def _warm(self, path: str) -> None:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+
+        for warmer in self._warmers:
+            try:
+                warmer(path)
+            except Exception as e:
+                print(f"Failed to prefetch {path}: {e}")
+
+        with self._lock:
+            self._warmed[path] = mtime
@@ -1,32 +1,58 @@
-import os
-import math
-from pathlib import Path
+from collections import deque
 from typing import Optional, Callable
-from gi.repository import GLib
+from gi.repository import GLib, Gdk
 from PIL import Image
+from .frame_stats import FrameStats
+from .shader_registry import get_shader_registry
+from .transitions import TransitionEngine, load_frame
 
 
-SHADERS_DIR = os.path.join(os.path.dirname(__file__), "shaders")
+# Timer interval when no widget frame clock is available (~60 FPS)
+FRAME_INTERVAL_MS = 16
+
+# Number of finished transitions whose frame statistics are kept
+FRAME_STATS_HISTORY = 20
+
+
+def frame_to_texture(frame) -> Gdk.Texture:
+    """Wrap a rendered RGB frame as a texture for a Gtk.Picture."""
+    height, width = frame.shape[:2]
+    return Gdk.MemoryTexture.new(
+        width,
+        height,
+        Gdk.MemoryFormat.R8G8B8,
+        GLib.Bytes.new(frame.tobytes()),
+        frame.strides[0],
+    )
 
 
 class TransitionRenderer:
     """Handles wallpaper transitions with GLSL shaders.
 
     This class manages the transition between two wallpapers using
-    fragment shaders for visual effects.
+    fragment shaders for visual effects. Without a GL context, frames are
+    composited on the CPU by a TransitionEngine and streamed to the
+    ``on_frame`` callback as in-memory RGB buffers.
     """
 
     def __init__(self):
-        self._current_image: Optional[Image.Image] = None
-        self._next_image: Optional[Image.Image] = None
+        self._engine: Optional[TransitionEngine] = None
         self._transition_progress: float = 0.0
         self._transition_duration: float = 1.0
         self._shader_name: str = "fade"
         self._animation_timer: Optional[int] = None
+        self._tick_widget = None
+        self._start_time: Optional[int] = None
+        self._last_frame_time: Optional[int] = None
         self._on_complete: Optional[Callable] = None
+        self._on_frame: Optional[Callable] = None
+        self._frame_stats: Optional[FrameStats] = None
+        self._stats_history: deque[FrameStats] = deque(maxlen=FRAME_STATS_HISTORY)
 
     def load_shader(self, shader_name: str) -> Optional[str]:
-        """Load a GLSL shader file.
+        """Get the source of a GLSL shader.
+
+        Shaders are read and validated once by the shader registry.
 
         Args:
             shader_name: Name of the shader (without .glsl extension)
@@ -34,18 +60,11 @@ class TransitionRenderer:
         Returns:
             Shader source code or None if not found
         """
-        shader_path = os.path.join(SHADERS_DIR, f"{shader_name}.glsl")
-
-        if not os.path.exists(shader_path):
-            print(f"Shader not found: {shader_path}")
-            return None
-
-        try:
-            with open(shader_path, "r") as f:
-                return f.read()
-        except IOError as e:
-            print(f"Failed to load shader {shader_name}: {e}")
+        shader = get_shader_registry().get(shader_name)
+        if shader is None:
+            print(f"Shader not found: {shader_name}")
             return None
+        return shader.source
 
     def start_transition(
         self,
@@ -53,7 +72,10 @@ class TransitionRenderer:
         next_path: str,
         shader: str = "fade",
         duration: float = 1.0,
-        on_complete: Optional[Callable] = None
+        on_complete: Optional[Callable] = None,
+        on_frame: Optional[Callable] = None,
+        size: Optional[tuple[int, int]] = None,
+        widget=None,
     ) -> bool:
         """Start a transition between two wallpapers.
 
@@ -63,6 +85,11 @@ class TransitionRenderer:
             shader: Shader name to use for transition
             duration: Transition duration in seconds
             on_complete: Callback to call when transition completes
+            on_frame: Callback receiving each rendered frame, a (height, width, 3)
+                uint8 array that is reused between frames
+            size: Output size as (width, height), defaults to the next wallpaper's size
+            widget: Widget whose frame clock drives the animation; a ~60 FPS
+                timer is used when omitted
 
         Returns:
             True if transition was started successfully
@@ -70,10 +97,14 @@ class TransitionRenderer:
         # Stop any existing transition
         self.stop_transition()
 
-        # Load images
+        # Decode and scale both wallpapers once for the whole transition
         try:
-            self._current_image = Image.open(current_path)
-            self._next_image = Image.open(next_path)
+            if size is None:
+                with Image.open(next_path) as img:
+                    size = img.size
+            self._engine = TransitionEngine(
+                load_frame(current_path, size), load_frame(next_path, size)
+            )
         except Exception as e:
             print(f"Failed to load images for transition: {e}")
             return False
@@ -82,70 +113,100 @@ class TransitionRenderer:
         self._transition_duration = duration
         self._transition_progress = 0.0
         self._on_complete = on_complete
-
-        # Start animation timer (60 FPS)
-        self._animation_timer = GLib.timeout_add(
-            16,  # ~60 FPS
-            self._on_animation_tick
-        )
+        self._on_frame = on_frame
+        self._start_time = None
+        self._last_frame_time = None
+        self._frame_stats = FrameStats(shader, 1000.0 / 60)
+
+        # Progress is derived from the monotonic clock on every tick, so a
+        # busy main loop drops frames instead of stretching the transition
+        if widget is not None:
+            self._tick_widget = widget
+            self._animation_timer = widget.add_tick_callback(self._on_frame_clock_tick)
+        else:
+            self._animation_timer = GLib.timeout_add(
+                FRAME_INTERVAL_MS, self._on_timer_tick
+            )
 
         return True
 
     def stop_transition(self) -> None:
         """Stop the current transition."""
         if self._animation_timer is not None:
-            GLib.source_remove(self._animation_timer)
+            if self._tick_widget is not None:
+                self._tick_widget.remove_tick_callback(self._animation_timer)
+            else:
+                GLib.source_remove(self._animation_timer)
             self._animation_timer = None
+        self._tick_widget = None
 
-        self._current_image = None
-        self._next_image = None
+        if self._frame_stats is not None and self._frame_stats.frames:
+            self._stats_history.append(self._frame_stats)
+        self._frame_stats = None
+
+        self._engine = None
+        self._on_frame = None
         self._transition_progress = 0.0
 
-    def _on_animation_tick(self) -> bool:
-        """Handle animation frame update."""
-        # Update progress
-        frame_time = 0.016  # ~16ms at 60 FPS
-        self._transition_progress += frame_time / self._transition_duration
+    def get_frame_stats(self) -> list[FrameStats]:
+        """Get frame-time statistics of recent transitions, oldest first."""
+        return list(self._stats_history)
 
-        if self._transition_progress >= 1.0:
-            # Transition complete
-            self._transition_progress = 1.0
-            self._render_frame()
+    def _on_timer_tick(self) -> bool:
+        """Handle a timer tick, using GLib's monotonic clock."""
+        return self._on_animation_tick(GLib.get_monotonic_time())
 
-            if self._on_complete:
-                self._on_complete()
+    def _on_frame_clock_tick(self, widget, frame_clock) -> bool:
+        """Handle a GdkFrameClock tick, using the frame's presentation time."""
+        return self._on_animation_tick(frame_clock.get_frame_time())
 
-            self.stop_transition()
-            return False  # Stop timer
+    def _on_animation_tick(self, now: int) -> bool:
+        """Handle animation frame update.
+
+        Args:
+            now: Monotonic time in microseconds
+        """
+        # The clock starts at the first tick, so decoding in start_transition
+        # does not eat into the animation
+        if self._start_time is None:
+            self._start_time = now
+        elif self._frame_stats is not None:
+            self._frame_stats.record((now - self._last_frame_time) / 1000.0)
+        self._last_frame_time = now
+
+        elapsed = (now - self._start_time) / 1_000_000
+        if self._transition_duration > 0:
+            self._transition_progress = min(elapsed / self._transition_duration, 1.0)
+        else:
+            self._transition_progress = 1.0
 
         # Render current frame
         self._render_frame()
 
+        if self._transition_progress >= 1.0:
+            # Transition complete
+            on_complete = self._on_complete
+            self._animation_timer = None  # returning False removes the source
+            self.stop_transition()
+
+            if on_complete:
+                on_complete()
+
+            return False  # Stop timer
+
         return True  # Continue timer
 
     def _render_frame(self) -> None:
-        """Render a single frame of the transition.
-
-        This is a simplified version - in a full implementation,
-        this would render to an OpenGL texture using the shader.
-        For now, we'll use PIL for software rendering of basic effects.
-        """
-        if not self._current_image or not self._next_image:
+        """Render a single frame of the transition and hand it to on_frame."""
+        if not self._engine:
             return
 
         # Apply easing function to progress
         progress = self._ease_in_out_cubic(self._transition_progress)
+        frame = self._engine.render(self._shader_name, progress)
 
-        # For this simplified version, we'll just do a basic blend
-        # A full implementation would use OpenGL and GLSL shaders
-        if self._shader_name == "fade":
-            self._render_fade(progress)
-        # Additional shaders would be implemented here
-
-    def _render_fade(self, progress: float) -> None:
-        """Software implementation of fade transition."""
-        # This is a placeholder - actual rendering would happen via OpenGL
-        pass
+        if self._on_frame:
+            self._on_frame(frame)
 
     @staticmethod
     def _ease_in_out_cubic(t: float) -> float:
@@ -156,16 +217,13 @@ class TransitionRenderer:
             return 1 - pow(-2 * t + 2, 3) / 2
 
     @staticmethod
-    def get_available_shaders() -> list[str]:
-        """Get list of available shader names."""
-        if not os.path.exists(SHADERS_DIR):
-            return []
+    def get_available_shaders(backend: Optional[str] = None) -> list[str]:
+        """Get list of available shader names.
 
-        shaders = []
-        for file in Path(SHADERS_DIR).glob("*.glsl"):
-            shaders.append(file.stem)
-
-        return sorted(shaders)
+        Args:
+            backend: Only list shaders this backend can render ("gl", "cpu", "swww")
+        """
+        return get_shader_registry().names(backend)
 
 
 # Utility function for direct image transitions without GPU
@@ -176,9 +234,10 @@ def create_transition_image(
     output_path: str,
     transition_type: str = "fade"
 ) -> bool:
-    """Create a transition frame between two images using CPU rendering.
+    """Render a single transition frame to a file using CPU rendering.
 
-    This is a fallback for systems without OpenGL support.
+    Useful for previews; running transitions stream frames through
+    TransitionRenderer instead of writing them to disk.
 
     Args:
         current_path: Path to current wallpaper
@@ -191,57 +250,11 @@ def create_transition_image(
         True if successful
     """
     try:
-        current = Image.open(current_path)
-        next_img = Image.open(next_path)
-
-        # Ensure same size
-        if current.size != next_img.size:
-            next_img = next_img.resize(current.size, Image.Resampling.LANCZOS)
-
-        # Ensure same mode
-        if current.mode != next_img.mode:
-            next_img = next_img.convert(current.mode)
-
-        # Apply transition
-        if transition_type == "fade":
-            # Simple alpha blend
-            result = Image.blend(current, next_img, progress)
-
-        elif transition_type == "slide":
-            # Horizontal slide
-            width, height = current.size
-            offset = int(width * progress)
-
-            result = Image.new(current.mode, current.size)
-            result.paste(current, (-offset, 0))
-            result.paste(next_img, (width - offset, 0))
-
-        elif transition_type == "zoom":
-            # Zoom effect
-            scale = 1.0 + progress * 0.2  # Zoom out by 20%
-
-            # Zoom out current image
-            new_size = (int(current.size[0] * scale), int(current.size[1] * scale))
-            current_scaled = current.resize(new_size, Image.Resampling.LANCZOS)
-
-            # Center crop
-            left = (new_size[0] - current.size[0]) // 2
-            top = (new_size[1] - current.size[1]) // 2
-            current_cropped = current_scaled.crop((
-                left, top,
-                left + current.size[0],
-                top + current.size[1]
-            ))
-
-            # Blend with next image
-            result = Image.blend(current_cropped, next_img, progress)
-
-        else:
-            # Default to fade
-            result = Image.blend(current, next_img, progress)
-
-        # Save result
-        result.save(output_path, quality=95)
+        with Image.open(current_path) as img:
+            size = img.size
+        engine = TransitionEngine.from_files(current_path, next_path, size)
+        frame = engine.render(transition_type, progress)
+        Image.fromarray(frame).save(output_path)
         return True
 
     except Exception as e:
@@ -0,0 +1,158 @@
+import os
+from fnmatch import fnmatch
+from typing import Callable, Iterable, Iterator, Optional
+
+
+# Supported image extensions
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".gif", ".tiff", ".tif"}
+
+# Number of files collected before a batch is handed to the caller
+SCAN_BATCH_SIZE = 256
+
+
+def is_image_file(path: str) -> bool:
+    """Check whether a path has a supported image extension."""
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+
+
+class WallpaperSources:
+    """Set of wallpaper root folders with recursion and glob filters.
+
+    Patterns are matched with ``fnmatch`` against both the file name and
+    the path relative to its root, so ``*.png`` and ``nature/*`` both work.
+    Exclude patterns also prune whole directories during recursive scans.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[str],
+        recursive: bool = False,
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+    ):
+        self.roots: list[str] = []
+        for root in roots:
+            root = os.path.abspath(os.path.expanduser(root))
+            if root not in self.roots:
+                self.roots.append(root)
+
+        self.recursive = recursive
+        self.include = [pattern for pattern in include if pattern]
+        self.exclude = [pattern for pattern in exclude if pattern]
+
+    def root_for(self, path: str) -> Optional[str]:
+        """Get the root folder that contains a path."""
+        for root in self.roots:
+            if path == root or path.startswith(root + os.sep):
+                return root
+        return None
+
+    def _matches(self, path: str, patterns: list[str]) -> bool:
+        root = self.root_for(path)
+        relative = os.path.relpath(path, root) if root else path
+        name = os.path.basename(path)
+        return any(
+            fnmatch(name, pattern) or fnmatch(relative, pattern)
+            for pattern in patterns
+        )
+
+    def accepts_file(self, path: str) -> bool:
+        """Check whether a file belongs in the wallpaper queue."""
+        if not is_image_file(path) or self.root_for(path) is None:
+            return False
+        if not self.recursive and os.path.dirname(path) not in self.roots:
+            return False
+        if self.exclude and self._matches(path, self.exclude):
+            return False
+        if self.include and not self._matches(path, self.include):
+            return False
+        return True
+
+    def accepts_directory(self, path: str) -> bool:
+        """Check whether a directory should be scanned and monitored."""
+        if path in self.roots:
+            return True
+        if not self.recursive or self.root_for(path) is None:
+            return False
+        return not (self.exclude and self._matches(path, self.exclude))
+
+
+class ScanBatch:
+    """Files and directories discovered by one step of a scan."""
+
+    __slots__ = ("files", "directories")
+
+    def __init__(self):
+        self.files: list[str] = []
+        self.directories: list[str] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.files or self.directories)
+
+
+def scan_sources(
+    sources: WallpaperSources,
+    start: Optional[Iterable[str]] = None,
+    batch_size: int = SCAN_BATCH_SIZE,
+    is_cancelled: Callable[[], bool] = lambda: False,
+) -> Iterator[ScanBatch]:
+    """Walk wallpaper sources with ``os.scandir`` and yield results in batches.
+
+    ``scandir`` exposes the entry type from the directory listing, so
+    regular files are classified without an extra ``stat`` call. Symlinked
+    directories are followed, with visited inodes tracked to avoid loops.
+
+    Args:
+        sources: Roots and filters to scan
+        start: Directories to scan instead of all roots (e.g. a new subfolder)
+        batch_size: Number of files per yielded batch
+        is_cancelled: Polled between directories to abort a stale scan
+
+    Yields:
+        Batches of accepted image files and scanned directories
+    """
+    stack = [path for path in (start or sources.roots) if os.path.isdir(path)]
+    visited: set[tuple[int, int]] = set()
+    batch = ScanBatch()
+
+    while stack:
+        if is_cancelled():
+            return
+
+        directory = stack.pop()
+        try:
+            stat = os.stat(directory)
+        except OSError:
+            continue
+        key = (stat.st_dev, stat.st_ino)
+        if key in visited:
+            continue
+        visited.add(key)
+
+        batch.directories.append(directory)
+        subdirectories = []
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            if sources.accepts_file(entry.path):
+                                batch.files.append(entry.path)
+                                if len(batch.files) >= batch_size:
+                                    yield batch
+                                    batch = ScanBatch()
+                        elif sources.recursive and entry.is_dir():
+                            if sources.accepts_directory(entry.path):
+                                subdirectories.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f"Error reading folder {directory}: {e}")
+            continue
+
+        # Reverse so directories are visited in listing order
+        stack.extend(reversed(subdirectories))
+
+    if batch:
+        yield batch
@@ -1,29 +1,24 @@
 import os
-import random
-import asyncio
-from pathlib import Path
-from typing import Optional
-from gi.repository import GLib, Gio, GObject
+import threading
+from typing import Iterable, Optional
+from gi.repository import GLib, Gio, GObject, Gdk
 from ignis.base_service import BaseService
 from ignis.services.wallpaper import WallpaperService
 from ignis.options import options
-from ignis import utils
 from user_options import user_options
-from .cache import WallpaperCache
+from .cache import VARIANT_DIR, WallpaperCache
+from .wallpaper_queue import WallpaperQueue
+from .scanner import ScanBatch, WallpaperSources, scan_sources
+from .prefetch import WallpaperPrefetcher, warm_page_cache
+from .shader_registry import ShaderInfo, get_shader_registry
+from .backends import SwwwBackend, WallpaperRequest
+from .variants import WallpaperVariants
 
+# Delay used to coalesce bursts of folder events into one queue update (ms)
+FOLDER_EVENT_DEBOUNCE = 300
 
-# Supported image extensions
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".gif", ".tiff", ".tif"}
-
-# Map shader names to swww transition types
-SHADER_TO_SWWW = {
-    "fade": "fade",
-    "slide": "left",
-    "zoom": "grow",
-    "pixelate": "fade",  # swww doesn't have pixelate, use fade
-    "swirl": "wave",
-    "wipe": "wipe",
-}
+# Backend that renders transitions (see shader_registry.BACKENDS)
+TRANSITION_BACKEND = "swww"
 
 
 class WallpaperSlideshowService(BaseService):
@@ -38,18 +33,48 @@ class WallpaperSlideshowService(BaseService):
     def __init__(self):
         super().__init__()
 
-        self._cache = WallpaperCache()
+        self._cache = WallpaperCache(user_options.wallpaper_slideshow.history_size)
+        user_options.wallpaper_slideshow.connect_option(
+            "history_size",
+            lambda: self._cache.set_history_size(
+                user_options.wallpaper_slideshow.history_size
+            ),
+        )
         self._wallpaper_service = WallpaperService.get_default()
 
+        # Wallpaper backend; without swww the wallpaper is set directly
+        self._backend: Optional[SwwwBackend] = None
+        if SwwwBackend.is_available():
+            self._backend = SwwwBackend()
+        else:
+            print("swww not found, setting wallpapers without transitions")
+
         # Slideshow state
-        self._folder_path: Optional[str] = None
-        self._wallpaper_queue: list[str] = []
-        self._current_index: int = 0
+        self._sources: Optional[WallpaperSources] = None
+        self._shuffle: bool = True
+        self._queue = WallpaperQueue()
         self._is_playing: bool = False
         self._timer_id: Optional[int] = None
 
-        # Folder monitoring
-        self._folder_monitor: Optional[Gio.FileMonitor] = None
+        # Cache warming for upcoming wallpapers (created on first use)
+        self._prefetcher: Optional[WallpaperPrefetcher] = None
+
+        # Background scanning
+        self._scan_generation: int = 0
+        self._is_scanning: bool = False
+
+        # Folder monitoring (one monitor per scanned directory)
+        self._folder_monitors: dict[str, Gio.FileMonitor] = {}
+        self._pending_changes: dict[str, bool] = {}
+        self._pending_flush_id: Optional[int] = None
+
+        # Wallpapers pre-scaled to each monitor (output name -> physical size)
+        self._variants = WallpaperVariants(VARIANT_DIR)
+        self._outputs: dict[str, tuple[int, int]] = {}
+        self._watch_monitors()
+        user_options.wallpaper_slideshow.connect_option(
+            "fit_mode", self._on_variant_inputs_changed
+        )
 
     # Properties
     @GObject.Property
@@ -65,25 +90,24 @@ class WallpaperSlideshowService(BaseService):
     @GObject.Property
     def queue_length(self) -> int:
         """Get the number of wallpapers in the queue."""
-        return len(self._wallpaper_queue)
+        return len(self._queue)
 
     @GObject.Property
     def current_index(self) -> int:
         """Get the current position in the queue."""
-        return self._current_index
+        return self._queue.index
 
     @GObject.Property
     def next_wallpaper_preview(self) -> str:
         """Get the next wallpaper in queue without switching to it."""
-        if not self._wallpaper_queue:
-            return ""
-        next_index = (self._current_index + 1) % len(self._wallpaper_queue)
-        return self._wallpaper_queue[next_index]
+        return self._queue.peek() or ""
 
     # Public methods
     def set_folder(self, folder_path: str, shuffle: bool = True) -> bool:
         """Set the folder to monitor for wallpapers.
 
+        Extra folders, recursion and glob filters are taken from user options.
+
         Args:
             folder_path: Path to the folder containing wallpapers
             shuffle: Whether to shuffle the wallpaper queue
@@ -95,9 +119,52 @@ class WallpaperSlideshowService(BaseService):
             print(f"Invalid folder path: {folder_path}")
             return False
 
-        self._folder_path = folder_path
-        self._load_wallpapers_from_folder(shuffle)
-        self._setup_folder_monitor()
+        opts = user_options.wallpaper_slideshow
+        return self.set_sources(
+            [folder_path, *opts.extra_folders],
+            shuffle=shuffle,
+            recursive=opts.recursive,
+            include=opts.include_patterns,
+            exclude=opts.exclude_patterns,
+        )
+
+    def set_sources(
+        self,
+        folders: Iterable[str],
+        shuffle: bool = True,
+        recursive: bool = False,
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+    ) -> bool:
+        """Set one or more folders to scan and monitor for wallpapers.
+
+        Folders are scanned in a background thread and wallpapers are added
+        to the queue in batches as they are discovered.
+
+        Args:
+            folders: Root folders containing wallpapers
+            shuffle: Whether to shuffle the wallpaper queue
+            recursive: Whether to include subfolders
+            include: Glob patterns a wallpaper must match (empty = all)
+            exclude: Glob patterns for files and subfolders to skip
+
+        Returns:
+            True if at least one folder was valid
+        """
+        roots = []
+        for folder in folders:
+            if os.path.isdir(os.path.expanduser(folder)):
+                roots.append(folder)
+            else:
+                print(f"Invalid folder path: {folder}")
+
+        if not roots:
+            return False
+
+        self._sources = WallpaperSources(roots, recursive, include, exclude)
+        self._shuffle = shuffle
+        self._remove_folder_monitors()
+        self._start_scan()
 
         return True
 
@@ -116,14 +183,14 @@ class WallpaperSlideshowService(BaseService):
             return False
 
         # Set wallpaper using swww with transition
-        self._set_wallpaper_with_swww(wallpaper_path)
+        self._apply_wallpaper(wallpaper_path)
 
         # Update cache
         self._cache.set_current_wallpaper(wallpaper_path)
         self._cache.add_to_history(wallpaper_path)
 
-        # Generate thumbnail asynchronously
-        GLib.idle_add(lambda: self._cache.generate_thumbnail(wallpaper_path))
+        # Generate thumbnail asynchronously (a no-op if it was prefetched)
+        GLib.idle_add(self._generate_thumbnail, wallpaper_path)
 
         # Emit signal
         self.emit("wallpaper-changed", wallpaper_path)
@@ -133,16 +200,17 @@ class WallpaperSlideshowService(BaseService):
         if update_material:
             self._update_material_colors(wallpaper_path)
 
+        # Prepare the next wallpapers while the slideshow is idle
+        self._schedule_prefetch()
+
         return True
 
     def next_wallpaper(self) -> bool:
         """Switch to the next wallpaper in the queue."""
-        if not self._wallpaper_queue:
+        wallpaper = self._queue.advance()
+        if wallpaper is None:
             return False
 
-        self._current_index = (self._current_index + 1) % len(self._wallpaper_queue)
-        wallpaper = self._wallpaper_queue[self._current_index]
-
         return self.set_wallpaper(wallpaper)
 
     def previous_wallpaper(self) -> bool:
@@ -154,10 +222,9 @@ class WallpaperSlideshowService(BaseService):
         previous = self._cache.get_previous_wallpaper(current)
         if not previous:
             # If no previous in history, go back in queue
-            if not self._wallpaper_queue:
+            previous = self._queue.advance(-1)
+            if previous is None:
                 return False
-            self._current_index = (self._current_index - 1) % len(self._wallpaper_queue)
-            previous = self._wallpaper_queue[self._current_index]
 
         return self.set_wallpaper(previous)
 
@@ -170,7 +237,7 @@ class WallpaperSlideshowService(BaseService):
         if self._is_playing:
             self.pause_slideshow()
 
-        if not self._wallpaper_queue:
+        if not self._queue and not self._is_scanning:
             print("No wallpapers in queue")
             return
 
@@ -203,138 +270,233 @@ class WallpaperSlideshowService(BaseService):
 
     def shuffle_queue(self) -> None:
         """Shuffle the wallpaper queue."""
-        if self._wallpaper_queue:
-            # Remember current wallpaper
-            current = None
-            if 0 <= self._current_index < len(self._wallpaper_queue):
-                current = self._wallpaper_queue[self._current_index]
-
-            # Shuffle
-            random.shuffle(self._wallpaper_queue)
-
-            # Find new index of current wallpaper
-            if current and current in self._wallpaper_queue:
-                self._current_index = self._wallpaper_queue.index(current)
-            else:
-                self._current_index = 0
+        if self._queue:
+            self._queue.shuffle()
+            self._schedule_prefetch()
 
             self.emit("queue-updated")
             self.notify("queue-length")
 
     def get_queue(self) -> list[str]:
         """Get a copy of the current wallpaper queue."""
-        return self._wallpaper_queue.copy()
+        return self._queue.to_list()
 
     def get_history(self) -> list[str]:
         """Get the wallpaper history."""
         return self._cache.get_history()
 
+    def get_transition_effects(self) -> list[ShaderInfo]:
+        """Get the transition effects the active backend can render."""
+        registry = get_shader_registry()
+        return [registry.get(name) for name in registry.names(TRANSITION_BACKEND)]
+
     def reload_folder(self, shuffle: bool = False) -> None:
-        """Reload wallpapers from the current folder."""
-        if self._folder_path:
-            self._load_wallpapers_from_folder(shuffle)
+        """Rescan all wallpaper folders."""
+        if self._sources:
+            self._cancel_pending_changes()
+            self._shuffle = shuffle
+            self._start_scan()
 
     # Private methods
-    def _set_wallpaper_with_swww(self, wallpaper_path: str) -> None:
-        """Set wallpaper using swww with transition effects.
+    def _apply_wallpaper(self, wallpaper_path: str) -> None:
+        """Hand a wallpaper to the backend with the configured transition.
 
         Args:
             wallpaper_path: Path to the wallpaper image
         """
-        # Get transition settings from user options
-        transition_shader = user_options.wallpaper_slideshow.transition_shader
-        transition_type = SHADER_TO_SWWW.get(transition_shader, "fade")
+        if self._backend is None:
+            options.wallpaper.set_wallpaper_path(wallpaper_path)
+            return
 
-        # Duration is fixed at 1 second for now (transition_duration removed from UI)
-        duration = 1.0
+        # Get transition settings from user options; the swww equivalent of
+        # each effect is declared in its shader header
+        registry = get_shader_registry()
+        effect = registry.resolve(
+            user_options.wallpaper_slideshow.transition_shader, TRANSITION_BACKEND
+        )
+        shader = registry.get(effect)
 
-        # Build swww command
-        cmd = [
-            "swww", "img",
+        # Duration is fixed at 1 second for now (transition_duration removed from UI)
+        request = WallpaperRequest(
             wallpaper_path,
-            "--transition-type", transition_type,
-            "--transition-duration", str(duration),
-            "--transition-fps", "60",
-        ]
+            transition_type=shader.swww_type if shader else "fade",
+            transition_args=shader.swww_args if shader else [],
+            duration=1.0,
+            outputs=self._get_output_images(wallpaper_path),
+        )
 
-        # Add angle for wipe/wave transitions
-        if transition_type in ["wipe", "wave"]:
-            cmd.extend(["--transition-angle", "45"])
+        # Requests made while a change is in flight are coalesced
+        self._backend.submit(request, self._on_wallpaper_applied)
 
-        # Execute swww command asynchronously
-        asyncio.create_task(self._exec_swww(cmd, wallpaper_path))
+    def _on_wallpaper_applied(self, request: WallpaperRequest, success: bool) -> None:
+        """Update options once the backend has set (or failed to set) a wallpaper."""
+        options.wallpaper.set_wallpaper_path(request.path)
 
-    async def _exec_swww(self, cmd: list[str], wallpaper_path: str) -> None:
-        """Execute swww command asynchronously.
+    def _get_output_images(self, wallpaper_path: str) -> dict[str, str]:
+        """Get the pre-scaled variant of a wallpaper for each output.
 
-        Args:
-            cmd: Command to execute
-            wallpaper_path: Wallpaper path (for updating options after)
+        Outputs without a variant yet get the original file. Returns an
+        empty dict when no variant exists, so the backend sets the original
+        on all outputs at once.
         """
-        try:
-            await utils.exec_sh_async(" ".join(cmd))
-            # Update options after swww sets the wallpaper
-            options.wallpaper.set_wallpaper_path(wallpaper_path)
-        except Exception as e:
-            print(f"Failed to set wallpaper with swww: {e}")
-            # Fallback to direct setting
-            options.wallpaper.set_wallpaper_path(wallpaper_path)
-
-    def _load_wallpapers_from_folder(self, shuffle: bool = True) -> None:
-        """Load all wallpapers from the monitored folder."""
-        if not self._folder_path:
+        fit_mode = user_options.wallpaper_slideshow.fit_mode
+        variants = {
+            output: self._variants.get(wallpaper_path, size, fit_mode)
+            for output, size in self._outputs.items()
+        }
+        if not any(variants.values()):
+            return {}
+        return {output: variant or wallpaper_path for output, variant in variants.items()}
+
+    def _watch_monitors(self) -> None:
+        """Track connected monitors and their physical resolution."""
+        display = Gdk.Display.get_default()
+        if display is None:
             return
 
-        wallpapers = []
+        monitors = display.get_monitors()
+        monitors.connect("items-changed", lambda *args: self._refresh_outputs(monitors))
+        self._refresh_outputs(monitors)
+
+    def _refresh_outputs(self, monitors: Gio.ListModel) -> None:
+        outputs = {}
+        for i in range(monitors.get_n_items()):
+            monitor = monitors.get_item(i)
+            connector = monitor.get_connector()
+            if not connector:
+                continue
+
+            geometry = monitor.get_geometry()
+            # Fractional scale where available (GTK 4.14+)
+            scale = monitor.get_scale() if hasattr(monitor, "get_scale") else monitor.get_scale_factor()
+            outputs[connector] = (round(geometry.width * scale), round(geometry.height * scale))
+
+        if outputs != self._outputs:
+            self._outputs = outputs
+            self._on_variant_inputs_changed()
+
+    def _on_variant_inputs_changed(self) -> None:
+        """Re-warm upcoming variants after monitors or the fit mode changed."""
+        if self._prefetcher is not None:
+            self._prefetcher.invalidate()
+        self._schedule_prefetch()
+
+    def _warm_variants(self, wallpaper_path: str) -> None:
+        """Pre-scale a wallpaper for every connected monitor."""
+        sizes = list(self._outputs.values())
+        if sizes:
+            self._variants.ensure(
+                wallpaper_path, sizes, user_options.wallpaper_slideshow.fit_mode
+            )
 
-        try:
-            for file_path in Path(self._folder_path).iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in IMAGE_EXTENSIONS:
-                    wallpapers.append(str(file_path.absolute()))
-        except OSError as e:
-            print(f"Error reading folder {self._folder_path}: {e}")
-            return
+    def _start_scan(self, start: Optional[list[str]] = None) -> None:
+        """Scan wallpaper sources in a worker thread.
 
-        if not wallpapers:
-            print(f"No wallpapers found in {self._folder_path}")
+        A full scan (no ``start``) replaces the queue with its first batch and
+        supersedes any scan still running. Partial scans of new subfolders
+        only add to the queue.
+        """
+        if not self._sources:
             return
 
-        # Sort for consistent order before shuffling
-        wallpapers.sort()
-
-        if shuffle:
-            random.shuffle(wallpapers)
+        if start is None:
+            self._scan_generation += 1
+            self._is_scanning = True
+
+        generation = self._scan_generation
+        sources = self._sources
+
+        def worker() -> None:
+            reset = start is None
+            found = 0
+            for batch in scan_sources(
+                sources,
+                start,
+                is_cancelled=lambda: generation != self._scan_generation,
+            ):
+                found += len(batch.files)
+                GLib.idle_add(self._on_scan_batch, generation, batch, reset)
+                reset = False
+            GLib.idle_add(self._on_scan_finished, generation, start is None, found)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_scan_batch(self, generation: int, batch: ScanBatch, reset: bool) -> bool:
+        """Merge a batch of scan results into the queue (main thread)."""
+        if generation != self._scan_generation:
+            return False
 
-        self._wallpaper_queue = wallpapers
-        self._current_index = 0
+        for directory in batch.directories:
+            self._monitor_directory(directory)
 
-        print(f"Loaded {len(wallpapers)} wallpapers from {self._folder_path}")
+        if reset:
+            self._queue.reset(batch.files, self._shuffle)
+        elif not self._queue.apply_changes(added=batch.files):
+            return False
 
         self.emit("queue-updated")
         self.notify("queue-length")
         self.notify("current-index")
+        return False
+
+    def _on_scan_finished(self, generation: int, full: bool, found: int) -> bool:
+        """Finish a scan (main thread)."""
+        if generation != self._scan_generation or not full:
+            return False
 
-    def _setup_folder_monitor(self) -> None:
-        """Set up file monitoring for the wallpaper folder."""
-        # Remove existing monitor
-        if self._folder_monitor:
-            self._folder_monitor.cancel()
-            self._folder_monitor = None
+        self._is_scanning = False
+        roots = len(self._sources.roots) if self._sources else 0
 
-        if not self._folder_path:
+        if found == 0:
+            print(f"No wallpapers found in {roots} folder(s)")
+            if self._queue:
+                self._queue.reset([])
+                self.emit("queue-updated")
+                self.notify("queue-length")
+                self.notify("current-index")
+        else:
+            print(f"Loaded {len(self._queue)} wallpapers from {roots} folder(s)")
+            self._schedule_prefetch()
+
+        return False
+
+    def _monitor_directory(self, path: str) -> None:
+        """Start monitoring a single directory for changes."""
+        if path in self._folder_monitors:
             return
 
         try:
-            folder = Gio.File.new_for_path(self._folder_path)
-            self._folder_monitor = folder.monitor_directory(
-                Gio.FileMonitorFlags.NONE,
+            monitor = Gio.File.new_for_path(path).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES,
                 None
             )
-            self._folder_monitor.connect("changed", self._on_folder_changed)
+        except GLib.Error as e:
+            print(f"Failed to monitor folder {path}: {e}")
+            return
 
-            print(f"Monitoring folder: {self._folder_path}")
-        except Exception as e:
-            print(f"Failed to monitor folder {self._folder_path}: {e}")
+        monitor.connect("changed", self._on_folder_changed)
+        self._folder_monitors[path] = monitor
+
+    def _remove_folder_monitors(self) -> None:
+        """Cancel all folder monitors and pending events."""
+        for monitor in self._folder_monitors.values():
+            monitor.cancel()
+        self._folder_monitors.clear()
+        self._cancel_pending_changes()
+
+    def _forget_directory(self, path: str) -> list[str]:
+        """Stop monitoring a removed directory tree.
+
+        Returns:
+            Queue entries that lived inside the directory
+        """
+        prefix = path + os.sep
+        for directory in [
+            d for d in self._folder_monitors if d == path or d.startswith(prefix)
+        ]:
+            self._folder_monitors.pop(directory).cancel()
+
+        return [entry for entry in self._queue.to_list() if entry.startswith(prefix)]
 
     def _on_folder_changed(
         self,
@@ -343,22 +505,128 @@ class WallpaperSlideshowService(BaseService):
         other_file: Optional[Gio.File],
         event_type: Gio.FileMonitorEvent
     ) -> None:
-        """Handle folder change events."""
-        # Only reload on created/deleted events
+        """Record folder change events as pending queue deltas."""
         if event_type in (
             Gio.FileMonitorEvent.CREATED,
-            Gio.FileMonitorEvent.DELETED,
             Gio.FileMonitorEvent.MOVED_IN,
+        ):
+            self._queue_change(file.get_path(), True)
+        elif event_type in (
+            Gio.FileMonitorEvent.DELETED,
             Gio.FileMonitorEvent.MOVED_OUT,
         ):
-            # Debounce reloads
-            GLib.idle_add(lambda: self._load_wallpapers_from_folder(shuffle=False))
+            self._queue_change(file.get_path(), False)
+        elif event_type == Gio.FileMonitorEvent.RENAMED:
+            self._queue_change(file.get_path(), False)
+            if other_file:
+                self._queue_change(other_file.get_path(), True)
+        else:
+            return
+
+        # Debounce: restart the timer so a burst results in a single update
+        if self._pending_flush_id is not None:
+            GLib.source_remove(self._pending_flush_id)
+        self._pending_flush_id = GLib.timeout_add(
+            FOLDER_EVENT_DEBOUNCE, self._flush_pending_changes
+        )
+
+    def _queue_change(self, path: Optional[str], exists: bool) -> None:
+        """Remember the latest known state of a path until the next flush."""
+        if path:
+            self._pending_changes[path] = exists
+
+    def _cancel_pending_changes(self) -> None:
+        """Drop pending folder events and their flush timer."""
+        if self._pending_flush_id is not None:
+            GLib.source_remove(self._pending_flush_id)
+            self._pending_flush_id = None
+        self._pending_changes.clear()
+
+    def _flush_pending_changes(self) -> bool:
+        """Apply the accumulated folder events to the queue."""
+        self._pending_flush_id = None
+        changes, self._pending_changes = self._pending_changes, {}
+
+        if not self._sources:
+            return False
+
+        added = []
+        removed = []
+        new_directories = []
+        for path, exists in changes.items():
+            # Re-check the path: it may have been created and deleted again
+            # within the debounce window
+            if exists and os.path.isdir(path):
+                if self._sources.accepts_directory(path):
+                    new_directories.append(path)
+            elif exists and os.path.isfile(path):
+                if self._sources.accepts_file(path):
+                    added.append(path)
+            elif path in self._folder_monitors:
+                removed.extend(self._forget_directory(path))
+            else:
+                removed.append(path)
+
+        if new_directories:
+            self._start_scan(new_directories)
+
+        previous_index = self._queue.index
+        if self._queue.apply_changes(added, removed):
+            self.emit("queue-updated")
+            self.notify("queue-length")
+            if self._queue.index != previous_index:
+                self.notify("current-index")
+
+        return False  # Don't repeat timer
 
     def _on_timer_tick(self) -> bool:
         """Handle slideshow timer tick."""
         self.next_wallpaper()
         return True  # Continue timer
 
+    def _generate_thumbnail(self, wallpaper_path: str) -> bool:
+        """Generate a thumbnail from an idle callback."""
+        self._cache.generate_thumbnail(wallpaper_path)
+        return False  # Don't repeat
+
+    def _schedule_prefetch(self) -> None:
+        """Warm caches for the next queue entries during the idle interval.
+
+        Thumbnails, Material palettes and the file contents of the upcoming
+        wallpapers are prepared in the background so the next switch does
+        not run matugen or hit a cold disk.
+        """
+        count = min(user_options.wallpaper_slideshow.prefetch_count, len(self._queue))
+        if count <= 0:
+            return
+
+        if self._prefetcher is None:
+            self._prefetcher = WallpaperPrefetcher(self._create_prefetch_warmers())
+
+        upcoming = [self._queue.peek(offset) for offset in range(1, count + 1)]
+
+        # Variants follow the queue: keep the current, upcoming and previous
+        # wallpapers, drop everything else
+        current = self.current_wallpaper
+        previous = self._cache.get_previous_wallpaper(current) if current else None
+        self._variants.retain(
+            [path for path in [current, *upcoming, previous] if path]
+        )
+
+        self._prefetcher.schedule(upcoming)
+
+    def _create_prefetch_warmers(self) -> list:
+        """Build the list of warm-up steps run for each upcoming wallpaper."""
+        warmers = [warm_page_cache, self._cache.generate_thumbnail, self._warm_variants]
+
+        try:
+            from services.material import MaterialService
+            warmers.append(MaterialService.get_default().prefetch_colors)
+        except ImportError:
+            print("MaterialService not available")
+
+        return warmers
+
     def _update_material_colors(self, wallpaper_path: str) -> None:
         """Trigger Material You color generation for a wallpaper."""
         try:
@@ -0,0 +1,214 @@
+import os
+import re
+import threading
+from typing import Iterable, Optional
+
+
+SHADERS_DIR = os.path.join(os.path.dirname(__file__), "shaders")
+
+# Backends a transition can be rendered with:
+#   gl   - the GLSL shader itself
+#   cpu  - the NumPy kernel of the same name (see transitions.py)
+#   swww - a native swww transition (declared with @swww)
+BACKENDS = ("gl", "cpu", "swww")
+
+# Uniforms every transition shader must declare
+REQUIRED_UNIFORMS = {
+    "currentTexture": "sampler2D",
+    "nextTexture": "sampler2D",
+    "progress": "float",
+}
+
+_METADATA_RE = re.compile(r"^\s*//\s*@(\w+)\s*(.*?)\s*$", re.MULTILINE)
+_UNIFORM_RE = re.compile(r"^\s*uniform\s+(\w+)\s+(\w+)\s*;", re.MULTILINE)
+_MAIN_RE = re.compile(r"\bvoid\s+main\s*\(")
+
+
+class ShaderInfo:
+    """A validated transition shader and its metadata.
+
+    Metadata is declared in comment lines of the shader header::
+
+        // @label Pixelate
+        // @backends gl cpu
+        // @swww wipe --transition-angle 45
+
+    ``@swww`` names the equivalent swww transition type, optionally followed
+    by extra ``swww img`` arguments; it is required for the swww backend.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source: str,
+        uniforms: dict[str, str],
+        backends: frozenset[str],
+        label: Optional[str] = None,
+        swww: Optional[list[str]] = None,
+    ):
+        self.name = name
+        self.source = source
+        self.uniforms = uniforms
+        self.backends = backends
+        self.label = label or name.capitalize()
+        self.swww = swww or []
+
+    @property
+    def swww_type(self) -> Optional[str]:
+        """The swww ``--transition-type`` for this effect."""
+        return self.swww[0] if self.swww else None
+
+    @property
+    def swww_args(self) -> list[str]:
+        """Extra ``swww img`` arguments for this effect."""
+        return self.swww[1:]
+
+    def supports(self, backend: str) -> bool:
+        """Check whether the effect can be rendered with a backend."""
+        return backend in self.backends
+
+
+def parse_shader(name: str, source: str, cpu_kernels: Optional[Iterable[str]] = None) -> ShaderInfo:
+    """Parse and validate a shader source.
+
+    Args:
+        name: Shader name (file name without .glsl)
+        source: GLSL source code
+        cpu_kernels: Names of available CPU kernels; when given, a declared
+            cpu backend without a matching kernel is dropped
+
+    Raises:
+        ValueError: If the shader is not a usable transition shader
+    """
+    source = source.replace("\r\n", "\n")
+    if not source.lstrip().startswith("#version"):
+        raise ValueError("missing #version directive")
+    if not _MAIN_RE.search(source):
+        raise ValueError("missing main()")
+
+    uniforms = {uniform: kind for kind, uniform in _UNIFORM_RE.findall(source)}
+    for uniform, kind in REQUIRED_UNIFORMS.items():
+        if uniforms.get(uniform) != kind:
+            raise ValueError(f"missing uniform {kind} {uniform}")
+
+    metadata = {key: value for key, value in _METADATA_RE.findall(source)}
+    swww = metadata.get("swww", "").split()
+
+    backends = set(metadata.get("backends", "gl").split())
+    unknown = backends.difference(BACKENDS)
+    if unknown:
+        raise ValueError(f"unknown backends: {', '.join(sorted(unknown))}")
+
+    if swww:
+        backends.add("swww")
+    elif "swww" in backends:
+        raise ValueError("swww backend declared without @swww transition")
+
+    if cpu_kernels is not None and name not in cpu_kernels:
+        backends.discard("cpu")
+
+    return ShaderInfo(
+        name=name,
+        source=source,
+        uniforms=uniforms,
+        backends=frozenset(backends),
+        label=metadata.get("label"),
+        swww=swww,
+    )
+
+
+class ShaderRegistry:
+    """Transition shaders loaded once from a directory.
+
+    Shaders are read, validated and parsed on first access; invalid files
+    are reported and skipped. Call ``reload()`` to pick up edits.
+    """
+
+    def __init__(self, directory: str = SHADERS_DIR, cpu_kernels: Optional[Iterable[str]] = None):
+        self._directory = directory
+        self._cpu_kernels = set(cpu_kernels) if cpu_kernels is not None else None
+        self._shaders: Optional[dict[str, ShaderInfo]] = None
+        self._lock = threading.Lock()
+        # (name, backend) pairs already reported by resolve()
+        self._warned: set[tuple[str, str]] = set()
+
+    def set_cpu_kernels(self, cpu_kernels: Iterable[str]) -> None:
+        """Declare which effects have a CPU kernel and reload."""
+        self._cpu_kernels = set(cpu_kernels)
+        self.reload()
+
+    def reload(self) -> None:
+        """Forget loaded shaders; they are read again on next access."""
+        with self._lock:
+            self._shaders = None
+            self._warned.clear()
+
+    def get(self, name: str) -> Optional[ShaderInfo]:
+        """Get a shader by name."""
+        return self._load().get(name)
+
+    def names(self, backend: Optional[str] = None) -> list[str]:
+        """Get sorted shader names, optionally only those a backend supports."""
+        return sorted(
+            name
+            for name, shader in self._load().items()
+            if backend is None or shader.supports(backend)
+        )
+
+    def resolve(self, name: str, backend: str, fallback: str = "fade") -> str:
+        """Get ``name`` if the backend supports it, else ``fallback``.
+
+        Runs on every wallpaper change, so each unsupported (name, backend)
+        pair is reported only once.
+        """
+        shader = self.get(name)
+        if shader is not None and shader.supports(backend):
+            return name
+        if (name, backend) not in self._warned:
+            self._warned.add((name, backend))
+            print(f"Transition '{name}' is not supported by {backend}, using '{fallback}'")
+        return fallback
+
+    def _load(self) -> dict[str, ShaderInfo]:
+        with self._lock:
+            if self._shaders is None:
+                self._shaders = self._read_directory()
+            return self._shaders
+
+    def _read_directory(self) -> dict[str, ShaderInfo]:
+        shaders: dict[str, ShaderInfo] = {}
+        try:
+            entries = sorted(os.listdir(self._directory))
+        except OSError as e:
+            print(f"Failed to list shaders in {self._directory}: {e}")
+            return shaders
+
+        for entry in entries:
+            name, ext = os.path.splitext(entry)
+            if ext != ".glsl":
+                continue
+            path = os.path.join(self._directory, entry)
+            try:
+                with open(path, "r") as f:
+                    shaders[name] = parse_shader(name, f.read(), self._cpu_kernels)
+            except (OSError, ValueError) as e:
+                print(f"Skipping shader {path}: {e}")
+
+        return shaders
+
+
+_registry: Optional[ShaderRegistry] = None
+
+
+def get_shader_registry() -> ShaderRegistry:
+    """Get the shared registry for the bundled shaders."""
+    global _registry
+    if _registry is None:
+        # The CPU backend needs NumPy and Pillow
+        try:
+            from .transitions import KERNELS
+            cpu_kernels = KERNELS.keys()
+        except ImportError:
+            cpu_kernels = ()
+        _registry = ShaderRegistry(cpu_kernels=cpu_kernels)
+    return _registry
@@ -2,6 +2,10 @@
 
 // Simple cross-fade transition
 // Blends linearly between two textures
+//
+// @label Fade
+// @backends gl cpu
+// @swww fade
 
 uniform sampler2D currentTexture;
 uniform sampler2D nextTexture;
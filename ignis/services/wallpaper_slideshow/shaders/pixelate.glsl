@@ -2,21 +2,25 @@
 
 // Pixelate transition
 // Gradually increases pixel size then decreases while transitioning
+//
+// @label Pixelate
+// @backends gl cpu
 
 uniform sampler2D currentTexture;
 uniform sampler2D nextTexture;
 uniform float progress;  // 0.0 to 1.0
+uniform vec2 resolution;  // output size in pixels
 
 in vec2 texCoord;
 out vec4 fragColor;
 
 void main() {
-    // Calculate pixelation amount (peaks at middle of transition)
+    // Block size in pixels (peaks at middle of transition, 1px at the ends)
     float pixelation = sin(progress * 3.14159) * 50.0;
     pixelation = max(pixelation, 1.0);
 
     // Pixelate coordinates
-    vec2 pixelSize = vec2(1.0 / pixelation, 1.0 / pixelation);
+    vec2 pixelSize = vec2(pixelation) / resolution;
     vec2 pixelatedCoord = floor(texCoord / pixelSize) * pixelSize;
 
     // Sample textures with pixelated coordinates
@@ -2,6 +2,10 @@
 
 // Horizontal slide transition
 // Current image slides left while next image slides in from right
+//
+// @label Slide
+// @backends gl cpu
+// @swww left
 
 uniform sampler2D currentTexture;
 uniform sampler2D nextTexture;
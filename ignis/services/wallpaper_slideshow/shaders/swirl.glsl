@@ -2,6 +2,9 @@
 
 // Swirl/twist transition
 // Creates a swirling distortion effect
+//
+// @label Swirl
+// @backends gl cpu
 
 uniform sampler2D currentTexture;
 uniform sampler2D nextTexture;
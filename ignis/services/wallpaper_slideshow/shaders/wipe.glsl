@@ -2,6 +2,10 @@
 
 // Wipe transition
 // A diagonal wipe from top-left to bottom-right
+//
+// @label Wipe
+// @backends gl cpu
+// @swww wipe --transition-angle 45
 
 uniform sampler2D currentTexture;
 uniform sampler2D nextTexture;
@@ -15,9 +19,10 @@ void main() {
     // Wipe progresses from top-left (0,0) to bottom-right (1,1)
     float wipePosition = (texCoord.x + texCoord.y) / 2.0;
 
-    // Soft edge for smoother transition
+    // Soft edge for smoother transition, fully off-screen at both ends
     float edgeWidth = 0.1;
-    float alpha = smoothstep(progress - edgeWidth, progress + edgeWidth, wipePosition);
+    float edge = progress * (1.0 + 2.0 * edgeWidth) - edgeWidth;
+    float alpha = smoothstep(edge - edgeWidth, edge + edgeWidth, wipePosition);
 
     // Sample textures
     vec4 current = texture(currentTexture, texCoord);
@@ -2,6 +2,10 @@
 
 // Zoom transition
 // Current image zooms out while fading to next image
+//
+// @label Zoom
+// @backends gl cpu
+// @swww grow
 
 uniform sampler2D currentTexture;
 uniform sampler2D nextTexture;
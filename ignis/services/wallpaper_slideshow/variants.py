@@ -0,0 +1,161 @@
+import os
+import hashlib
+import threading
+from typing import Iterable, Optional
+from PIL import Image, ImageOps
+
+
+# How wallpapers are scaled to a monitor (see user_options fit_mode)
+FIT_MODES = ("fill", "stretch", "center", "fit", "tile")
+
+# Canvas colour around "center" and "fit" wallpapers
+BACKGROUND_COLOR = (0, 0, 0)
+
+# PNG zlib level for variants; stored blocks decode at memcpy speed
+VARIANT_COMPRESS_LEVEL = 0
+
+
+def render_variant(image: Image.Image, size: tuple[int, int], fit_mode: str) -> Image.Image:
+    """Scale an RGB image to exactly ``size`` (width, height) using a fit mode.
+
+    Args:
+        image: Source image
+        size: Monitor size in physical pixels
+        fit_mode: One of FIT_MODES; unknown modes behave like "fill"
+    """
+    if fit_mode == "stretch":
+        return image.resize(size, Image.Resampling.LANCZOS)
+
+    if fit_mode == "fit":
+        contained = ImageOps.contain(image, size, Image.Resampling.LANCZOS)
+        canvas = Image.new("RGB", size, BACKGROUND_COLOR)
+        canvas.paste(contained, ((size[0] - contained.width) // 2, (size[1] - contained.height) // 2))
+        return canvas
+
+    if fit_mode == "center":
+        canvas = Image.new("RGB", size, BACKGROUND_COLOR)
+        canvas.paste(image, ((size[0] - image.width) // 2, (size[1] - image.height) // 2))
+        return canvas
+
+    if fit_mode == "tile":
+        canvas = Image.new("RGB", size)
+        for top in range(0, size[1], image.height):
+            for left in range(0, size[0], image.width):
+                canvas.paste(image, (left, top))
+        return canvas
+
+    return ImageOps.fit(image, size, Image.Resampling.LANCZOS)
+
+
+class WallpaperVariants:
+    """On-disk cache of wallpapers pre-scaled to each monitor's resolution.
+
+    A variant is the wallpaper rendered at a monitor size with a fit mode
+    and stored as an uncompressed PNG, so the wallpaper daemon can display
+    it without decoding the original or rescaling it per output.
+
+    File names start with a key derived from the source path and mtime, so
+    ``retain`` can drop variants of wallpapers that left the upcoming part
+    of the slideshow queue (or changed on disk) without an index file.
+    """
+
+    def __init__(self, directory: str, max_sources: int = 8):
+        self._directory = directory
+        self._max_sources = max(1, max_sources)
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _source_key(path: str) -> Optional[str]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        digest = hashlib.md5(os.path.abspath(path).encode()).hexdigest()[:16]
+        return f"{digest}-{mtime:x}"
+
+    def variant_path(self, path: str, size: tuple[int, int], fit_mode: str) -> Optional[str]:
+        """Get where the variant of a wallpaper is stored (it may not exist yet)."""
+        key = self._source_key(path)
+        if key is None:
+            return None
+        return os.path.join(self._directory, f"{key}-{size[0]}x{size[1]}-{fit_mode}.png")
+
+    def get(self, path: str, size: tuple[int, int], fit_mode: str) -> Optional[str]:
+        """Get an existing variant without creating it."""
+        variant = self.variant_path(path, size, fit_mode)
+        if variant and os.path.exists(variant):
+            return variant
+        return None
+
+    def ensure(self, path: str, sizes: Iterable[tuple[int, int]], fit_mode: str) -> dict[tuple[int, int], str]:
+        """Create missing variants of a wallpaper, decoding it at most once.
+
+        Returns:
+            Variant paths keyed by size; sizes that failed are left out
+        """
+        variants: dict[tuple[int, int], str] = {}
+        missing: dict[tuple[int, int], str] = {}
+        for size in dict.fromkeys(sizes):
+            variant = self.variant_path(path, size, fit_mode)
+            if variant is None:
+                return {}
+            if os.path.exists(variant):
+                variants[size] = variant
+            else:
+                missing[size] = variant
+
+        if not missing:
+            return variants
+
+        try:
+            with Image.open(path) as img:
+                # Decode JPEGs at a reduced scale when all targets are smaller
+                if fit_mode not in ("center", "tile"):
+                    img.draft("RGB", max(missing, key=lambda size: size[0] * size[1]))
+                image = img.convert("RGB")
+        except Exception as e:
+            print(f"Failed to load wallpaper for scaling: {e}")
+            return variants
+
+        for size, variant in missing.items():
+            tmp_file = f"{variant}.tmp"
+            try:
+                render_variant(image, size, fit_mode).save(
+                    tmp_file, "PNG", compress_level=VARIANT_COMPRESS_LEVEL
+                )
+                os.replace(tmp_file, variant)
+                variants[size] = variant
+            except Exception as e:
+                print(f"Failed to save wallpaper variant: {e}")
+
+        return variants
+
+    def retain(self, paths: Iterable[str]) -> None:
+        """Keep variants of the first ``max_sources`` wallpapers, delete the rest.
+
+        ``paths`` should follow the slideshow queue order starting from the
+        current wallpaper, so wallpapers shown soonest are kept.
+        """
+        keep = set()
+        for path in paths:
+            key = self._source_key(path)
+            if key is not None:
+                keep.add(key)
+            if len(keep) >= self._max_sources:
+                break
+
+        with self._lock:
+            try:
+                entries = os.listdir(self._directory)
+            except OSError:
+                return
+
+            for entry in entries:
+                # Variants still being written are replaced into place later
+                if entry.endswith(".tmp") or entry.rsplit("-", 2)[0] in keep:
+                    continue
+                try:
+                    os.remove(os.path.join(self._directory, entry))
+                except OSError:
+                    pass
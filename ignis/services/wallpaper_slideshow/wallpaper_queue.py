@@ -0,0 +1,150 @@
+import random
+from bisect import bisect_left
+from heapq import merge
+from typing import Iterable, Optional
+
+
+class WallpaperQueue:
+    """Ordered wallpaper queue that tracks the current position.
+
+    Folder changes are applied as deltas so that the wallpaper currently
+    on screen keeps its place instead of the queue restarting at index 0.
+    """
+
+    def __init__(self):
+        self._items: list[str] = []
+        self._members: set[str] = set()
+        self._index: int = 0
+        self._sorted: bool = True
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._members
+
+    def __getitem__(self, index: int) -> str:
+        return self._items[index]
+
+    @property
+    def index(self) -> int:
+        """Current position in the queue."""
+        return self._index
+
+    @index.setter
+    def index(self, value: int) -> None:
+        self._index = value % len(self._items) if self._items else 0
+
+    @property
+    def current(self) -> Optional[str]:
+        """Wallpaper at the current position, if any."""
+        if not self._items:
+            return None
+        return self._items[self._index]
+
+    def peek(self, offset: int = 1) -> Optional[str]:
+        """Get the wallpaper ``offset`` entries after the current one."""
+        if not self._items:
+            return None
+        return self._items[(self._index + offset) % len(self._items)]
+
+    def advance(self, step: int = 1) -> Optional[str]:
+        """Move the current position by ``step`` and return the new entry."""
+        if not self._items:
+            return None
+        self._index = (self._index + step) % len(self._items)
+        return self._items[self._index]
+
+    def to_list(self) -> list[str]:
+        """Get a copy of the queue contents."""
+        return self._items.copy()
+
+    def reset(self, paths: Iterable[str], shuffle: bool = False) -> None:
+        """Replace the queue contents and rewind to the first entry."""
+        items = sorted(set(paths))
+        if shuffle:
+            random.shuffle(items)
+
+        self._items = items
+        self._members = set(items)
+        self._index = 0
+        self._sorted = not shuffle
+
+    def shuffle(self) -> None:
+        """Shuffle the queue, keeping the current wallpaper selected."""
+        current = self.current
+        random.shuffle(self._items)
+        self._sorted = False
+        self._index = self._items.index(current) if current is not None else 0
+
+    def apply_changes(
+        self, added: Iterable[str] = (), removed: Iterable[str] = ()
+    ) -> bool:
+        """Apply a batch of additions and removals.
+
+        Removals are applied in a single pass. New entries are merged in
+        sorted position for an ordered queue, or at a random position after
+        the current entry for a shuffled one, so they come up during the
+        current cycle.
+
+        Returns:
+            True if the queue contents changed
+        """
+        removed_set = {path for path in removed if path in self._members}
+        new_paths = sorted(
+            {path for path in added if path not in self._members} - removed_set
+        )
+
+        if not removed_set and not new_paths:
+            return False
+
+        current = self.current
+        removed_current: Optional[str] = None
+
+        if removed_set:
+            before_current = sum(
+                1 for path in self._items[: self._index] if path in removed_set
+            )
+            self._items = [path for path in self._items if path not in removed_set]
+            self._members -= removed_set
+            self._index -= before_current
+
+            # If the current entry itself disappeared, the index now points
+            # at the entry that followed it; it is moved back one below, so
+            # the next advance() lands on that successor instead of skipping it
+            if current in removed_set:
+                removed_current, current = current, None
+
+        if self._sorted:
+            # Merge in one pass so large streamed batches stay linear
+            self._items = list(merge(self._items, new_paths))
+        elif new_paths:
+            # Scatter new entries over random slots after the current entry,
+            # keeping the existing order of the remaining queue intact
+            first = min(self._index + 1, len(self._items))
+            tail = self._items[first:]
+            total = len(tail) + len(new_paths)
+            slots = set(random.sample(range(total), len(new_paths)))
+            random.shuffle(new_paths)
+            new_iter = iter(new_paths)
+            tail_iter = iter(tail)
+            self._items[first:] = [
+                next(new_iter) if slot in slots else next(tail_iter)
+                for slot in range(total)
+            ]
+        self._members.update(new_paths)
+
+        if not self._items:
+            self._index = 0
+        elif current is not None and self._sorted:
+            # Sorted inserts may land before the current entry
+            self._index = bisect_left(self._items, current)
+        elif removed_current is not None and self._sorted:
+            # Re-anchor just before where the removed entry would sort
+            self._index = (bisect_left(self._items, removed_current) - 1) % len(self._items)
+        elif removed_current is not None:
+            self._index = (self._index - 1) % len(self._items)
+        else:
+            self._index %= len(self._items)
+
+        return True
@@ -0,0 +1,171 @@
+"""
+Lightweight tracing with levels, per-module toggles and a ring buffer.
+
+Records are kept in memory and formatted only when dumped, so tracing on
+hot paths (e.g. module imports) does no I/O. Records at or above the echo
+level (WARNING by default) are also printed to stderr.
+
+Levels can be set per module with the IGNIS_TRACE environment variable,
+e.g. ``IGNIS_TRACE=dock=debug,launcher=off,*=info``, or at runtime over
+IPC once ``register_commands()`` was called:
+
+    ignis run-command trace-dump [module] [level]
+    ignis run-command trace-level <module|*> <level>
+"""
+import os
+import sys
+import time
+from collections import deque
+from typing import Optional
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR, "off": OFF}
+_LEVEL_LABELS = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+# Records kept for dumping; older ones are dropped
+RING_SIZE = 2000
+
+# (timestamp, level, module, message, args)
+_records: deque = deque(maxlen=RING_SIZE)
+_default_level = DEBUG
+_echo_level = WARNING
+_loggers: dict[str, "Logger"] = {}
+_module_levels: dict[str, int] = {}
+
+
+def parse_level(name: str) -> int:
+    """Get a level by name (debug, info, warning, error, off)."""
+    try:
+        return LEVEL_NAMES[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown trace level: {name}") from None
+
+
+class Logger:
+    """Records messages of one module.
+
+    Messages use %-style arguments, which are only formatted when the
+    record is dumped or echoed.
+    """
+
+    __slots__ = ("module", "level")
+
+    def __init__(self, module: str, level: int):
+        self.module = module
+        self.level = level
+
+    def log(self, level: int, message: str, *args) -> None:
+        if level < self.level:
+            return
+        _records.append((time.time(), level, self.module, message, args))
+        if level >= _echo_level:
+            print(_format(_records[-1]), file=sys.stderr)
+
+    def debug(self, message: str, *args) -> None:
+        self.log(DEBUG, message, *args)
+
+    def info(self, message: str, *args) -> None:
+        self.log(INFO, message, *args)
+
+    def warning(self, message: str, *args) -> None:
+        self.log(WARNING, message, *args)
+
+    def error(self, message: str, *args) -> None:
+        self.log(ERROR, message, *args)
+
+
+def get_logger(module: str) -> Logger:
+    """Get the logger of a module, creating it on first use."""
+    logger = _loggers.get(module)
+    if logger is None:
+        logger = Logger(module, _module_levels.get(module, _default_level))
+        _loggers[module] = logger
+    return logger
+
+
+def set_level(module: str, level: int) -> None:
+    """Set the minimum level recorded for a module ("*" for all modules)."""
+    global _default_level
+    if module == "*":
+        _default_level = level
+        _module_levels.clear()
+        for logger in _loggers.values():
+            logger.level = level
+        return
+
+    _module_levels[module] = level
+    if module in _loggers:
+        _loggers[module].level = level
+
+
+def set_echo_level(level: int) -> None:
+    """Set the minimum level also printed to stderr."""
+    global _echo_level
+    _echo_level = level
+
+
+def _format(record: tuple) -> str:
+    timestamp, level, module, message, args = record
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            message = f"{message} {args}"
+    clock = time.strftime("%H:%M:%S", time.localtime(timestamp))
+    return f"{clock}.{int(timestamp * 1000) % 1000:03d} {_LEVEL_LABELS.get(level, level)} [{module}] {message}"
+
+
+def dump(module: Optional[str] = None, level: int = DEBUG) -> str:
+    """Format buffered records, oldest first, optionally filtered."""
+    return "\n".join(
+        _format(record)
+        for record in list(_records)
+        if record[1] >= level and (module is None or record[2] == module)
+    )
+
+
+def clear() -> None:
+    """Drop all buffered records."""
+    _records.clear()
+
+
+def _load_env() -> None:
+    spec = os.environ.get("IGNIS_TRACE", "")
+    for item in spec.split(","):
+        module, _, name = item.strip().partition("=")
+        if not name:
+            continue
+        try:
+            set_level(module, parse_level(name))
+        except ValueError as e:
+            print(e, file=sys.stderr)
+
+
+def _dump_command(*args: str) -> str:
+    module = args[0] if args and args[0] != "*" else None
+    level = parse_level(args[1]) if len(args) > 1 else DEBUG
+    return dump(module, level)
+
+
+def _level_command(*args: str) -> str:
+    if len(args) != 2:
+        return "Usage: trace-level <module|*> <debug|info|warning|error|off>"
+    set_level(args[0], parse_level(args[1]))
+    return f"{args[0]}: {args[1]}"
+
+
+def register_commands() -> None:
+    """Expose trace-dump and trace-level to the IPC client."""
+    from ignis.command_manager import CommandManager
+
+    command_manager = CommandManager.get_default()
+    command_manager.add_command("trace-dump", _dump_command)
+    command_manager.add_command("trace-level", _level_command)
+
+
+_load_env()
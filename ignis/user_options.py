@@ -1,11 +1,97 @@
 import os
 import json
+import atexit
+import threading
+from typing import Optional
+from gi.repository import GLib  # type: ignore
 from ignis.options_manager import OptionsGroup, OptionsManager
 from ignis import DATA_DIR, CACHE_DIR  # type: ignore
 
 USER_OPTIONS_FILE = f"{DATA_DIR}/user_options.json"
 OLD_USER_OPTIONS_FILE = f"{CACHE_DIR}/user_options.json"
 
+# Delay used to coalesce bursts of option changes into one write (ms)
+SAVE_DEBOUNCE = 500
+
+
+class _OptionsWriter:
+    """Writes option snapshots atomically off the main loop.
+
+    Saves are debounced, so dragging a slider or toggling several options
+    produces one write. Snapshots are numbered and a snapshot older than
+    the last one written is dropped, so a slow write can never overwrite
+    newer options.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: Optional[tuple[int, str, dict]] = None
+        self._writing = False
+        self._sequence = 0
+        self._written = 0
+        self._timer_id: Optional[int] = None
+        self._file = ""
+        self._get_snapshot = None
+
+    def schedule(self, file: str, get_snapshot) -> None:
+        """Write ``get_snapshot()`` to ``file`` after the debounce delay."""
+        self._file = file
+        self._get_snapshot = get_snapshot
+        if self._timer_id is None:
+            self._timer_id = GLib.timeout_add(SAVE_DEBOUNCE, self._on_timeout)
+
+    def _snapshot(self) -> tuple[int, str, dict]:
+        # Taken on the main loop, where options are modified
+        self._sequence += 1
+        return self._sequence, self._file, self._get_snapshot()
+
+    def _on_timeout(self) -> bool:
+        self._timer_id = None
+        with self._lock:
+            self._pending = self._snapshot()
+            if self._writing:
+                return False
+            self._writing = True
+        threading.Thread(target=self._drain, daemon=True).start()
+        return False
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if self._pending is None:
+                    self._writing = False
+                    return
+                snapshot = self._pending
+                self._pending = None
+            self._write(*snapshot)
+
+    def _write(self, sequence: int, file: str, data: dict) -> None:
+        with self._write_lock:
+            if sequence <= self._written:
+                return
+            tmp_file = f"{file}.tmp"
+            try:
+                with open(tmp_file, "w") as fp:
+                    json.dump(data, fp, indent=4)
+                os.replace(tmp_file, file)
+            except IOError as e:
+                print(f"Failed to save user options: {e}")
+            self._written = sequence
+
+    def flush(self) -> None:
+        """Write unsaved options now, e.g. on exit."""
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+        elif not self._writing:
+            return
+        self._write(*self._snapshot())
+
+
+_writer = _OptionsWriter()
+atexit.register(_writer.flush)
+
 
 # FIXME: remove someday
 def _migrate_old_options_file() -> None:
@@ -85,9 +171,11 @@ class UserOptions(OptionsManager):
         Bug fix: OptionsManager.get_modified_options() only returns explicitly set values,
         causing default values to be lost on save/load cycles. Using to_dict() ensures
         all options are persisted.
+
+        Saves are debounced and written atomically in a background thread;
+        a pending save is flushed on exit.
         """
-        with open(file, "w") as fp:
-            json.dump(self.to_dict(), fp, indent=4)
+        _writer.schedule(file, self.to_dict)
 
     class User(OptionsGroup):
         avatar: str = f"/var/lib/AccountsService/icons/{os.getenv('USER')}"
@@ -131,15 +219,21 @@ class UserOptions(OptionsManager):
 
     class WallpaperSlideshow(OptionsGroup):
         folder_path: str = os.path.expanduser("~/Pictures")
+        extra_folders: list[str] = []  # Additional folders scanned with folder_path
+        recursive: bool = False  # Include subfolders
+        include_patterns: list[str] = []  # Glob patterns, e.g. "*.png" or "nature/*"
+        exclude_patterns: list[str] = []  # Glob patterns for files/subfolders to skip
         single_image_path: str = ""
         use_folder: bool = False  # Use single wallpaper by default
         interval_value: int = 30
         interval_unit: str = "minutes"  # "minutes", "hours", "days"
         fit_mode: str = "fill"  # "fill", "stretch", "center", "fit", "tile"
-        transition_shader: str = "fade"  # "fade", "slide", "zoom", "pixelate", "swirl", "wipe"
+        transition_shader: str = "fade"  # Name of a shader in services/wallpaper_slideshow/shaders
         transition_duration: float = 1.0  # seconds
         slideshow_enabled: bool = False  # Disabled by default
         shuffle_enabled: bool = True
+        prefetch_count: int = 2  # Upcoming wallpapers prepared in the background
+        history_size: int = 100  # Wallpapers remembered for "previous"
 
     class Bar(OptionsGroup):
         # Position and Layout (Phase 2)
@@ -170,6 +264,10 @@ class UserOptions(OptionsManager):
         hide_delay: int = 500  # Delay before hiding dock (ms)
         reveal_size: int = 1  # Trigger zone size at edge (pixels)
 
+        # Launch history
+        order_by_usage: bool = False  # Most used pinned apps first
+        suggested_apps: int = 0  # Most used unpinned apps shown after pinned ones
+
         pinned_apps: list[str] = [
             "firefox",
             "kitty",
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared application index.
+Loads index.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import importlib.util
+
+INDEX_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "app_index", "index.py",
+)
+
+spec = importlib.util.spec_from_file_location("app_index", INDEX_FILE)
+app_index = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(app_index)
+AppIndex = app_index.AppIndex
+
+APPS = [
+    ("firefox.desktop", "Firefox", "firefox"),
+    ("org.gnome.Nautilus.desktop", "Files", "org.gnome.Nautilus"),
+    ("code.desktop", "Visual Studio Code", "Code"),
+    ("kitty.desktop", "kitty", ""),
+    ("firefox-esr.desktop", "Firefox", "firefox-esr"),
+]
+
+
+def build_index():
+    index = AppIndex()
+    for app_id, name, wm_class in APPS:
+        index.add(app_id, app_id, name, wm_class)
+    return index
+
+
+def test_find():
+    """Pinned ids resolve by desktop id, id without suffix or name."""
+    print("Testing lookups...")
+
+    index = build_index()
+    assert len(index) == len(APPS)
+    assert index.get("kitty.desktop") == "kitty.desktop"
+    assert index.get("kitty") is None
+    print("  ✅ Exact desktop id")
+
+    assert index.find("kitty") == "kitty.desktop"
+    assert index.find("org.gnome.nautilus") == "org.gnome.Nautilus.desktop"
+    assert index.find("Visual Studio Code") == "code.desktop"
+    assert index.find("files") == "org.gnome.Nautilus.desktop"
+    assert index.find("missing") is None
+    print("  ✅ Case-insensitive id and name")
+
+    assert index.find("firefox") == "firefox.desktop"
+    print("  ✅ First application wins on collisions")
+    print()
+
+
+def test_wm_class():
+    """Window classes resolve through StartupWMClass, id and short id."""
+    print("Testing window classes...")
+
+    index = build_index()
+    assert index.find_by_wm_class("code") == "code.desktop"
+    assert index.find_by_wm_class("firefox-esr") == "firefox-esr.desktop"
+    assert index.find_by_wm_class("kitty") == "kitty.desktop"
+    assert index.find_by_wm_class("nautilus") == "org.gnome.Nautilus.desktop"
+    assert index.find_by_wm_class("") is None
+    assert index.find_by_wm_class("unknown") is None
+    print("  ✅ Window classes matched")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_find()
+        test_wm_class()
+        print("✅ All app index tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
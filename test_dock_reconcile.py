@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for keyed dock item reconciliation.
+Loads reconcile.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import random
+import importlib.util
+
+RECONCILE_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "modules", "dock", "reconcile.py",
+)
+
+spec = importlib.util.spec_from_file_location("reconcile", RECONCILE_FILE)
+reconcile = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(reconcile)
+diff_keys = reconcile.diff_keys
+
+
+def apply_operations(current, operations):
+    """Apply operations the way the dock applies them to its box."""
+    items = list(current)
+    for operation in operations:
+        if operation[0] == "remove":
+            items.remove(operation[1])
+            continue
+        if operation[0] == "move":
+            items.remove(operation[1])
+        after = operation[2]
+        items.insert(0 if after is None else items.index(after) + 1, operation[1])
+    return items
+
+
+def test_minimal_operations():
+    """Common dock edits touch only the changed items."""
+    print("Testing minimal operations...")
+
+    docked = ["firefox", "kitty", "files", "code"]
+    assert diff_keys(docked, docked) == []
+    print("  ✅ Unchanged dock produces no operations")
+
+    assert diff_keys(docked, docked + ["gimp"]) == [("insert", "gimp", "code")]
+    assert diff_keys(docked, ["firefox", "files", "code"]) == [("remove", "kitty")]
+    assert diff_keys(docked, ["code", "firefox", "kitty", "files"]) == [("move", "code", None)]
+    print("  ✅ Pin, unpin and reorder are single operations")
+    print()
+
+
+def test_random_edits():
+    """Any edit produces the desired order."""
+    print("Testing random edits...")
+
+    rng = random.Random(7)
+    keys = [f"app{i}" for i in range(12)]
+    for _ in range(2000):
+        current = rng.sample(keys, rng.randint(0, 10))
+        desired = rng.sample(keys, rng.randint(0, 10))
+        assert apply_operations(current, diff_keys(current, desired)) == desired, (current, desired)
+    print("  ✅ 2000 random edits reconciled")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_minimal_operations()
+        test_random_edits()
+        print("✅ All dock reconcile tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for the launch history frecency store.
+Loads frecency.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import json
+import importlib.util
+
+FRECENCY_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "launch_history", "frecency.py",
+)
+
+spec = importlib.util.spec_from_file_location("frecency", FRECENCY_FILE)
+frecency = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(frecency)
+FrecencyStore = frecency.FrecencyStore
+
+DAY = 24 * 60 * 60
+
+
+def test_decay():
+    """Scores halve every half-life, counts never decay."""
+    print("Testing decay...")
+
+    store = FrecencyStore(half_life=DAY)
+    store.record("firefox.desktop", now=0)
+    store.record("firefox.desktop", now=0)
+    assert store.count("firefox.desktop") == 2
+    assert store.score("firefox.desktop", now=0) == 2.0
+    assert abs(store.score("firefox.desktop", now=DAY) - 1.0) < 1e-9
+    print("  ✅ Score halves after one half-life")
+
+    store.record("firefox.desktop", now=DAY)
+    assert abs(store.score("firefox.desktop", now=DAY) - 2.0) < 1e-9
+    assert store.count("firefox.desktop") == 3
+    assert store.score("unknown.desktop") == 0.0
+    print("  ✅ Launches add to the decayed score")
+    print()
+
+
+def test_ranking():
+    """Recent launches beat old bursts; rank keeps ties in order."""
+    print("Testing ranking...")
+
+    store = FrecencyStore(half_life=DAY)
+    for _ in range(8):
+        store.record("old.desktop", now=0)
+    for _ in range(3):
+        store.record("recent.desktop", now=4 * DAY)
+    store.record("once.desktop", now=4 * DAY)
+
+    now = 4 * DAY
+    assert store.top(2, now=now) == ["recent.desktop", "once.desktop"]
+    assert store.rank(["a", "old.desktop", "b", "recent.desktop"], now=now) == [
+        "recent.desktop", "old.desktop", "a", "b",
+    ]
+    print("  ✅ Most used first, unknown keys keep their order")
+
+    assert store.boost("recent.desktop", now=now) > store.boost("once.desktop", now=now) > 0
+    assert store.boost("a", now=now) == 0.0
+    print("  ✅ Boost grows with usage")
+    print()
+
+
+def test_serialization():
+    """Round trips through JSON and drops the least used entries."""
+    print("Testing serialization...")
+
+    store = FrecencyStore(half_life=DAY, max_entries=2)
+    store.record("a", now=0)
+    store.record("b", now=0)
+    store.record("b", now=0)
+    store.record("c", now=0)
+    store.record("c", now=0)
+    store.record("c", now=0)
+
+    data = json.loads(json.dumps(store.to_dict(now=0)))
+    assert set(data["entries"]) == {"b", "c"}
+    print("  ✅ Least used entries dropped")
+
+    loaded = FrecencyStore(half_life=DAY)
+    loaded.load(data)
+    assert loaded.count("c") == 3
+    assert loaded.score("b", now=DAY) == store.score("b", now=DAY)
+    print("  ✅ Counts and scores restored")
+
+    weekly = FrecencyStore(half_life=7 * DAY)
+    weekly.load(data)
+    assert weekly.count("c") == 3
+    assert weekly.score("c", now=0) == 0.0
+    print("  ✅ Scores saved with another half-life reset")
+
+    loaded.load({"entries": {"ok": [1, 1.0, 0], "bad": "x", "short": [1]}})
+    assert len(loaded) == 1 and "ok" in loaded
+    loaded.load([])
+    assert len(loaded) == 0
+    print("  ✅ Malformed data skipped")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_decay()
+        test_ranking()
+        test_serialization()
+        print("✅ All launch history tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
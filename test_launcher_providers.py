@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test script for the launcher search pipeline and providers.
+Loads providers.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+import importlib.util
+
+PROVIDERS_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "modules", "launcher", "providers.py",
+)
+
+spec = importlib.util.spec_from_file_location("providers", PROVIDERS_FILE)
+providers = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(providers)
+
+
+class StaticProvider(providers.SearchProvider):
+    """Provider answering after a fixed delay."""
+
+    def __init__(self, name, delay, budget_ms=50):
+        self.name = name
+        self.budget_ms = budget_ms
+        self.delay = delay
+        self.queries = []
+
+    async def search(self, query):
+        self.queries.append(query)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return [providers.SearchResult(self.name, f"{self.name}:{query}")]
+
+
+def test_abstract_provider():
+    """Providers must implement search."""
+    print("Testing provider base class...")
+
+    class Incomplete(providers.SearchProvider):
+        name = "incomplete"
+
+    try:
+        Incomplete()
+        assert False, "missing search() should fail at construction"
+    except TypeError:
+        pass
+    print("  ✅ Missing search() fails at construction")
+    print()
+
+
+def test_calculator():
+    """Arithmetic is evaluated without eval()."""
+    print("Testing calculator...")
+
+    evaluate = providers.evaluate_expression
+    assert evaluate("2+2") == 4
+    assert evaluate("(1 + 2) * 3 ^ 2") == 27
+    assert evaluate("sqrt(16) / 8") == 0.5
+    assert abs(evaluate("2*pi") - 6.283185307) < 1e-6
+    print("  ✅ Operators, functions and constants")
+
+    for expression in ["2+", "firefox", "__import__('os')", "1/0", "9**9**9", "gnome-tweaks"]:
+        assert evaluate(expression) is None, expression
+    print("  ✅ Invalid and unsafe input rejected")
+
+    for expression in ["(-8)^0.5", "(-1)**0.5", "abs((-1)**0.5)", "2 * (-2)^(1/3)"]:
+        assert evaluate(expression) is None, expression
+    print("  ✅ Complex results rejected")
+
+    start = time.perf_counter()
+    for expression in ["((10**1000)**1000)**1000", "(10**300)*(10**300)", "2**1100", "(9**150)**3"]:
+        assert evaluate(expression) is None, expression
+    assert time.perf_counter() - start < 0.1
+    assert evaluate("10**300") == 10**300
+    assert evaluate("0.5**2000") == 0.0
+    print("  ✅ Huge results refused before they are computed")
+
+    results = asyncio.run(providers.CalculatorProvider().search("7 * 6"))
+    assert results[0].title == "= 42" and results[0].payload == "42"
+    assert asyncio.run(providers.CalculatorProvider().search("42")) == []
+    print("  ✅ Bare numbers are not calculations")
+    print()
+
+
+def test_files():
+    """Recent files are read from XBEL, newest first."""
+    print("Testing recent files...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for name in ["Report draft.pdf", "report-final.pdf", "photo.png"]:
+            path = os.path.join(directory, name)
+            open(path, "w").close()
+            paths.append(path)
+
+        xbel = os.path.join(directory, "recently-used.xbel")
+        with open(xbel, "w") as f:
+            f.write(
+                '<?xml version="1.0"?>\n'
+                '<xbel version="1.0" xmlns:mime="http://www.freedesktop.org/standards/shared-mime-info">\n'
+                f'<bookmark href="file://{paths[0].replace(" ", "%20")}" modified="2024-01-01T10:00:00Z">'
+                '<info><metadata><mime:mime-type type="application/pdf"/></metadata></info></bookmark>\n'
+                f'<bookmark href="file://{paths[1]}" modified="2024-03-01T10:00:00Z">'
+                '<info><metadata><mime:mime-type type="application/pdf"/></metadata></info></bookmark>\n'
+                f'<bookmark href="file://{paths[2]}" modified="2024-02-01T10:00:00Z">'
+                '<info><metadata><mime:mime-type type="image/png"/></metadata></info></bookmark>\n'
+                '<bookmark href="file:///missing/report.txt" modified="2024-04-01T10:00:00Z"/>\n'
+                '<bookmark href="https://example.com/report" modified="2024-04-01T10:00:00Z"/>\n'
+                '</xbel>\n'
+            )
+
+        provider = providers.FilesProvider(xbel)
+        results = asyncio.run(provider.search("report"))
+        assert [r.payload for r in results] == [paths[1], paths[0]], [r.payload for r in results]
+        print("  ✅ Newest first, missing and remote files skipped")
+
+        results = asyncio.run(provider.search("photo"))
+        assert results[0].icon == "image-x-generic"
+        assert asyncio.run(provider.search("report draft"))[0].payload == paths[0]
+        print("  ✅ All terms matched against the file name")
+    print()
+
+
+def test_wallpapers():
+    """Wallpaper results use thumbnails, never the full-size image."""
+    print("Testing wallpapers...")
+
+    history = ["/walls/forest.jpg", "/walls/Forest night.png", "/walls/city.jpg"]
+    thumbnails = {"/walls/forest.jpg": "/cache/forest.jpg"}
+    provider = providers.WallpapersProvider(lambda: history, thumbnails.get)
+
+    results = asyncio.run(provider.search("forest"))
+    assert [r.payload for r in results] == history[:2]
+    assert [r.icon for r in results] == ["/cache/forest.jpg", "image-x-generic-symbolic"]
+    print("  ✅ Thumbnail or icon name as the row icon")
+    print()
+
+
+def test_pipeline():
+    """Queries are debounced, superseded and merged per provider."""
+    print("Testing search pipeline...")
+
+    async def run():
+        delivered = []
+        fast = StaticProvider("fast", 0)
+        slow = StaticProvider("slow", 0.05, budget_ms=200)
+        stuck = StaticProvider("stuck", 1.0, budget_ms=20)
+        pipeline = providers.SearchPipeline(
+            [fast, slow, stuck],
+            lambda query, provider, results: delivered.append(
+                (query, provider.name, [r.title for r in results], time.perf_counter())
+            ),
+            debounce_ms=10,
+        )
+
+        # A burst of keystrokes searches only the last query
+        for query in ["f", "fi", "fir"]:
+            pipeline.submit(query)
+        await asyncio.sleep(0.3)
+        return fast, delivered
+
+    fast, delivered = asyncio.run(run())
+    assert fast.queries == ["fir"], fast.queries
+    assert {query for query, *_ in delivered} == {"fir"}
+    print("  ✅ Superseded keystrokes never searched")
+
+    order = [name for _, name, _, _ in delivered]
+    assert order == ["fast", "stuck", "slow"], order
+    assert delivered[0][2] == ["fast:fir"]
+    assert delivered[1][2] == []
+    print("  ✅ Fast results first, provider over budget answers empty")
+
+    async def cancelled():
+        delivered = []
+        pipeline = providers.SearchPipeline(
+            [StaticProvider("slow", 0.05)],
+            lambda query, provider, results: delivered.append(query),
+            debounce_ms=0,
+        )
+        pipeline.submit("a")
+        await asyncio.sleep(0.01)
+        pipeline.submit("ab")
+        await asyncio.sleep(0.1)
+        pipeline.submit("abc")
+        pipeline.cancel()
+        await asyncio.sleep(0.1)
+        return delivered
+
+    assert asyncio.run(cancelled()) == ["ab"]
+    print("  ✅ Running queries cancelled by newer ones")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_abstract_provider()
+        test_calculator()
+        test_files()
+        test_wallpapers()
+        test_pipeline()
+        print("✅ All launcher provider tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
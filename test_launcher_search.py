@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test and benchmark script for the launcher search index.
+Loads search_index.py directly so GTK/Ignis are not required.
+
+Run directly to print per-keystroke latency over 2,000 synthetic entries.
+"""
+
+import sys
+import os
+import time
+import random
+import importlib.util
+
+SEARCH_INDEX_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "modules", "launcher", "search_index.py",
+)
+
+spec = importlib.util.spec_from_file_location("search_index", SEARCH_INDEX_FILE)
+search_index = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(search_index)
+SearchIndex = search_index.SearchIndex
+
+BENCHMARK_ENTRIES = 2000
+BENCHMARK_QUERIES = ["firefox", "text editor", "vlc", "sett", "qzx"]
+
+
+def build_sample_index(boost=None):
+    index = SearchIndex(boost)
+    entries = [
+        ("firefox.desktop", "Firefox", "Web Browser", ["internet", "www"], "firefox %u"),
+        ("org.gnome.TextEditor.desktop", "Text Editor", "Text Editor", ["notepad", "txt"], "gnome-text-editor"),
+        ("code.desktop", "Visual Studio Code", "Text Editor", ["vscode", "ide"], "code --unity-launch"),
+        ("org.gnome.Settings.desktop", "Settings", "", ["preferences", "control"], "gnome-control-center"),
+        ("kitty.desktop", "kitty", "Terminal emulator", ["shell", "prompt"], "kitty"),
+        ("firefox-esr.desktop", "Firefox ESR", "Web Browser", [], "firefox-esr"),
+    ]
+    for desktop_id, name, generic, keywords, exec in entries:
+        index.add(desktop_id, name, name, generic, keywords, exec, desktop_id)
+    return index
+
+
+def test_ranking():
+    """Match tiers rank exact and prefix matches above fuzzy ones."""
+    print("Testing ranking...")
+
+    index = build_sample_index()
+    assert index.search("firefox")[:2] == ["Firefox", "Firefox ESR"]
+    print("  ✅ Exact name first, shorter names break ties")
+
+    assert index.search("editor")[0] == "Text Editor"
+    assert "Visual Studio Code" in index.search("editor")
+    print("  ✅ Generic name matches")
+
+    assert index.search("vscode") == ["Visual Studio Code"]
+    assert index.search("control") == ["Settings"]
+    print("  ✅ Keywords and exec matched")
+
+    assert index.search("stng") == ["Settings"]
+    assert index.search("vsc")[0] == "Visual Studio Code"
+    print("  ✅ Fuzzy in-order matching on the name")
+
+    assert index.search("text vis") == ["Visual Studio Code"]
+    assert index.search("qzx") == []
+    assert index.search("   ") == []
+    print("  ✅ All terms must match")
+    print()
+
+
+def test_incremental_and_boost():
+    """Extending a query narrows the previous matches; boosts reorder."""
+    print("Testing incremental refinement and boosts...")
+
+    index = build_sample_index()
+    for prefix in ["f", "fi", "fir", "fire"]:
+        results = index.search(prefix)
+    assert results[:2] == ["Firefox", "Firefox ESR"]
+
+    # Backspacing or replacing the query falls back to a full search
+    assert "kitty" in index.search("k")
+    assert index.search("fire")[:2] == ["Firefox", "Firefox ESR"]
+    print("  ✅ Narrowing and full searches agree")
+
+    index.set_boost(lambda key: 2.0 if key == "firefox-esr.desktop" else 0.0)
+    assert index.search("fire")[0] == "Firefox ESR"
+    assert index.search("fire", limit=1) == ["Firefox ESR"]
+    print("  ✅ Boost hook reorders results")
+    print()
+
+
+def build_synthetic_index(count):
+    rng = random.Random(42)
+    syllables = ["fi", "re", "fox", "ed", "it", "or", "vl", "c", "set", "tings",
+                 "term", "in", "al", "chro", "me", "pho", "to", "mu", "sic", "view"]
+    words = ["browser", "editor", "player", "viewer", "terminal", "manager", "tool", "client"]
+
+    index = SearchIndex(lambda key: 0.1)
+    for i in range(count):
+        name = "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize()
+        generic = f"{rng.choice(words).capitalize()} {rng.choice(words)}"
+        keywords = rng.sample(words, 3)
+        desktop_id = f"org.example.{name}{i}.desktop"
+        index.add(desktop_id, name, name, generic, keywords, name.lower(), desktop_id)
+    index.add("firefox.desktop", "Firefox", "Firefox", "Web Browser", ["internet"], "firefox %u", "firefox.desktop")
+    return index
+
+
+def test_benchmark_index():
+    """2,000 entries answer every keystroke of a typed query."""
+    print("Testing synthetic index...")
+
+    index = build_synthetic_index(BENCHMARK_ENTRIES)
+    typed = "firefox"
+    for i in range(1, len(typed) + 1):
+        results = index.search(typed[:i], limit=5)
+    assert results[0] == "Firefox", results
+    print(f"  ✅ {len(index)} entries indexed, typed query found")
+    print()
+
+
+def benchmark():
+    """Print indexing time and per-keystroke latency."""
+    start = time.perf_counter()
+    index = build_synthetic_index(BENCHMARK_ENTRIES)
+    print(f"Indexed {len(index)} entries in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for query in BENCHMARK_QUERIES:
+        incremental = []
+        for i in range(1, len(query) + 1):
+            start = time.perf_counter()
+            index.search(query[:i], limit=5)
+            incremental.append((time.perf_counter() - start) * 1000)
+
+        cold = []
+        for i in range(1, len(query) + 1):
+            index._last_query = None  # force a full search
+            start = time.perf_counter()
+            index.search(query[:i], limit=5)
+            cold.append((time.perf_counter() - start) * 1000)
+
+        print(
+            f"  {query!r:<14} incremental max {max(incremental):6.2f} ms, "
+            f"avg {sum(incremental) / len(incremental):6.2f} ms | "
+            f"cold max {max(cold):6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    try:
+        test_ranking()
+        test_incremental_and_boost()
+        test_benchmark_index()
+        print("✅ All launcher search tests passed!")
+        print()
+        benchmark()
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for the media art color cache.
+Loads media_colors.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import importlib.util
+
+# media_colors imports json_cache from the config directory
+sys.path.append(os.path.join(os.path.dirname(__file__), "ignis"))
+
+MEDIA_COLORS_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "modules", "control_center", "widgets", "media_colors.py",
+)
+
+spec = importlib.util.spec_from_file_location("media_colors", MEDIA_COLORS_FILE)
+media_colors = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(media_colors)
+ArtColorCache = media_colors.ArtColorCache
+
+
+class CountingExtractor:
+    """Stands in for matugen, counting how often it runs."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, path):
+        self.calls.append(path)
+        with open(path, "rb") as f:
+            return {"primary": f"#{f.read().hex()[:6]}"}
+
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def test_content_key():
+    """The same cover under different URLs is extracted once."""
+    print("Testing content keyed cache...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        extract = CountingExtractor()
+        cache = ArtColorCache(extract, os.path.join(directory, "colors"))
+        first = write(os.path.join(directory, "track1.png"), b"\xab\xcd\xef")
+        second = write(os.path.join(directory, "track2.png"), b"\xab\xcd\xef")
+
+        assert cache.get(first) == {"primary": "#abcdef"}
+        assert cache.get(second) == {"primary": "#abcdef"}
+        assert extract.calls == [first]
+        print("  ✅ Identical art shares colors")
+
+        colors = cache.get(first)
+        colors["art_url"] = first
+        assert "art_url" not in cache.get(first)
+        print("  ✅ Callers get copies")
+
+        write(first, b"\x12\x34\x56")
+        os.utime(first, ns=(1, 1))
+        assert cache.get(first) == {"primary": "#123456"}
+        assert len(extract.calls) == 2
+        print("  ✅ Changed files re-extracted")
+
+        assert cache.get(first, "scheme-vibrant") == {"primary": "#123456"}
+        assert len(extract.calls) == 3
+        assert len(os.listdir(os.path.join(directory, "colors"))) == 3
+        print("  ✅ Each scheme type cached separately")
+
+        try:
+            cache.get(os.path.join(directory, "missing.png"))
+            assert False, "missing art should raise"
+        except OSError:
+            pass
+    print()
+
+
+def test_disk_cache():
+    """Colors survive restarts and memory eviction through the disk cache."""
+    print("Testing disk cache...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache_dir = os.path.join(directory, "colors")
+        art = [write(os.path.join(directory, f"{i}.png"), bytes([i])) for i in range(3)]
+
+        extract = CountingExtractor()
+        cache = ArtColorCache(extract, cache_dir, memory_size=1)
+        for path in art:
+            cache.get(path)
+        assert len(os.listdir(cache_dir)) == 3
+
+        cache.get(art[0])
+        restarted = ArtColorCache(extract, cache_dir)
+        restarted.get(art[1])
+        assert len(extract.calls) == 3
+        print("  ✅ Evicted and restarted lookups read JSON instead of extracting")
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(restarted.get(art[2]))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [{"primary": "#02"}] * 8
+        print("  ✅ Safe to use from worker threads")
+
+        pruned = ArtColorCache(extract, cache_dir, disk_size=2)
+        os.utime(os.path.join(cache_dir, os.listdir(cache_dir)[0]), (0, 0))
+        oldest = min(os.listdir(cache_dir), key=lambda name: os.path.getmtime(os.path.join(cache_dir, name)))
+        pruned.get(write(os.path.join(directory, "new.png"), b"new"))
+        assert len(os.listdir(cache_dir)) == 2 and oldest not in os.listdir(cache_dir)
+        print("  ✅ Least recently used files pruned")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_content_key()
+        test_disk_cache()
+        print("✅ All media color tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
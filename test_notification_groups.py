@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for notification grouping and retention.
+Loads groups.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import importlib.util
+
+GROUPS_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "notification_store", "groups.py",
+)
+
+spec = importlib.util.spec_from_file_location("groups", GROUPS_FILE)
+groups = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(groups)
+GroupStore = groups.GroupStore
+
+
+def test_grouping():
+    """Bursts from one thread collapse into one group, newest on top."""
+    print("Testing grouping...")
+
+    store = GroupStore()
+    store.add("m1", "Chat", "Alice")
+    store.add("mail", "Mail", "Invoice")
+    store.add("m2", "Chat", "Alice")
+    store.add("b1", "Chat", "Bob")
+    store.add("m3", "Chat", "Alice")
+
+    assert store.groups() == [("Chat", "Alice"), ("Chat", "Bob"), ("Mail", "Invoice")]
+    assert store.group(("Chat", "Alice")) == ["m3", "m2", "m1"]
+    assert len(store) == 5 and store.app_count("Chat") == 4
+    assert store.add("m3", "Chat", "Alice") == [] and len(store) == 5
+    print("  ✅ Grouped by app and thread, most recent group first")
+
+    assert store.remove("b1") == ("Chat", "Bob")
+    assert store.remove("b1") is None
+    assert ("Chat", "Bob") not in store.groups()
+    assert store.remove("m3") == ("Chat", "Alice")
+    assert store.group(("Chat", "Alice")) == ["m2", "m1"]
+    assert len(store) == 3 and "m3" not in store
+    print("  ✅ Empty groups dropped, count kept in sync")
+    print()
+
+
+def test_retention():
+    """Per-app and global caps evict the oldest notifications."""
+    print("Testing retention...")
+
+    store = GroupStore(max_per_app=3, max_total=5)
+    for i in range(3):
+        assert store.add(f"chat{i}", "Chat", "Alice") == []
+    assert store.add("chat3", "Chat", "Bob") == [("chat0", ("Chat", "Alice"))]
+    assert store.app_count("Chat") == 3
+    print("  ✅ Oldest notification of the app evicted")
+
+    store.add("mail0", "Mail", "a")
+    store.add("mail1", "Mail", "b")
+    assert store.add("mail2", "Mail", "c") == [("chat1", ("Chat", "Alice"))]
+    assert len(store) == 5
+    assert store.group(("Chat", "Alice")) == ["chat2"]
+    print("  ✅ Oldest notification overall evicted")
+
+    store.clear()
+    assert len(store) == 0 and store.groups() == []
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_grouping()
+        test_retention()
+        print("✅ All notification group tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
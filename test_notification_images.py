@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for the notification image LRU.
+Loads image_lru.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import importlib.util
+
+LRU_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "modules", "shared_widgets", "image_lru.py",
+)
+
+spec = importlib.util.spec_from_file_location("image_lru", LRU_FILE)
+image_lru = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(image_lru)
+
+
+def test_budget():
+    """Least recently used images are evicted to stay under the budget."""
+    print("Testing memory budget...")
+
+    cache = image_lru.ImageLRU(100)
+    assert cache.put("a", "A", 40) == []
+    assert cache.put("b", "B", 40) == []
+    assert cache.get("a") == "A"
+    assert cache.put("c", "C", 40) == ["b"]
+    assert "b" not in cache and cache.size == 80
+    print("  ✅ Least recently used evicted first")
+
+    assert cache.put("huge", "H", 101) == []
+    assert "huge" not in cache and cache.size == 80
+    assert cache.put("a", "A2", 10) == []
+    assert cache.get("a") == "A2" and cache.size == 50
+    assert cache.pop("c") == "C" and cache.size == 10
+    assert cache.get("missing") is None
+    print("  ✅ Oversized values skipped, replacements resized")
+    print()
+
+
+def test_scaled_size():
+    """Images are downscaled to fit or cover the display size, never upscaled."""
+    print("Testing scaled size...")
+
+    scaled_size = image_lru.scaled_size
+    assert scaled_size(3840, 2160, 548, 308, cover=True) == (548, 308)
+    assert scaled_size(1000, 2000, 100, 100, cover=True) == (100, 200)
+    assert scaled_size(1000, 2000, 100, 100) == (50, 100)
+    assert scaled_size(64, 64, 96, 96) == (64, 64)
+    assert scaled_size(10000, 1, 96, 96) == (96, 1)
+    print("  ✅ Fit, cover and small images")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_budget()
+        test_scaled_size()
+        print("✅ All notification image tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for the notification popup queue.
+Loads queue.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import importlib.util
+
+QUEUE_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "popup_scheduler", "queue.py",
+)
+
+spec = importlib.util.spec_from_file_location("popup_queue", QUEUE_FILE)
+popup_queue = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(popup_queue)
+PopupQueue = popup_queue.PopupQueue
+
+
+def actions(operations):
+    return [(action, entry.items[:]) for action, entry in operations]
+
+
+def test_queueing():
+    """At most max_visible popups; the rest are shown in order."""
+    print("Testing queueing...")
+
+    queue = PopupQueue(max_visible=2, burst_threshold=100)
+    assert actions(queue.push("a", "A", now=0)) == [("show", ["a"])]
+    assert actions(queue.push("b", "B", now=1)) == [("show", ["b"])]
+    assert queue.push("c", "C", now=2) == []
+    assert queue.push("d", "D", now=3) == []
+    assert len(queue.visible) == 2 and len(queue.queued) == 2
+    print("  ✅ Extra popups queued")
+
+    assert actions(queue.dismiss("a")) == [("hide", []), ("show", ["c"])]
+    assert queue.dismiss("d") == []
+    assert queue.queued == []
+    assert actions(queue.dismiss("b")) == [("hide", [])]
+    assert queue.dismiss("b") == []
+    print("  ✅ Dismissals promote queued popups, stale ones dropped")
+    print()
+
+
+def test_coalescing():
+    """Identical summaries share one popup."""
+    print("Testing coalescing...")
+
+    queue = PopupQueue(max_visible=1, burst_threshold=100)
+    queue.push("build1", ("CI", "Build failed"), now=0)
+    assert actions(queue.push("build2", ("CI", "Build failed"), now=1)) == [
+        ("update", ["build1", "build2"])
+    ]
+    queue.push("mail", ("Mail", "Hi"), now=2)
+    assert queue.push("mail2", ("Mail", "Hi"), now=3) == []
+    assert queue.queued[0].count == 2
+    print("  ✅ Visible and queued entries coalesced")
+
+    assert actions(queue.dismiss("build1")) == [("update", ["build2"])]
+    assert actions(queue.dismiss("build2")) == [("hide", []), ("show", ["mail", "mail2"])]
+    print("  ✅ Popup stays until its last notification is dismissed")
+    print()
+
+
+def test_burst_digest():
+    """A burst folds the queue and later notifications into one digest."""
+    print("Testing burst digest...")
+
+    queue = PopupQueue(max_visible=2, burst_threshold=3, burst_window=1.0)
+    for i in range(3):
+        queue.push(f"n{i}", f"k{i}", now=i * 0.1)
+    assert queue.queued[0].items == ["n2"]
+
+    operations = queue.push("n3", "k3", now=0.4)
+    assert operations == []
+    digest = queue.queued[0]
+    assert digest.digest and digest.items == ["n2", "n3"]
+    print("  ✅ Burst starts a digest holding the queued popups")
+
+    for i in range(4, 50):
+        queue.push(f"n{i}", f"k{i}", now=0.5)
+    assert len(queue.queued) == 1 and digest.count == 48
+    assert queue.entry_of("n30") is digest
+    print("  ✅ Burst notifications counted, not queued")
+
+    ops = actions(queue.dismiss("n0"))
+    assert ops[0] == ("hide", []) and ops[1][0] == "show" and len(ops[1][1]) == 48
+    for i in range(2, 50):
+        queue.dismiss(f"n{i}")
+    assert [e.items for e in queue.visible] == [["n1"]]
+
+    assert actions(queue.push("later", "k", now=10)) == [("show", ["later"])]
+    print("  ✅ Digest ends when dismissed")
+
+    queue = PopupQueue(max_visible=1, burst_threshold=2, burst_window=1.0)
+    for i in range(3):
+        queue.push(f"m{i}", f"k{i}", now=0)
+    for i in range(3, 40):
+        queue.push(f"m{i}", f"k{i}", now=0.1)
+    digest = queue.queued[0]
+    queue.push("solo", "solo", now=5)
+
+    ops = actions(queue.dismiss("m0"))
+    assert ops[0] == ("hide", []) and ops[1][0] == "show"
+    assert queue.visible[0] is digest
+    ops = queue.discard(digest)
+    assert [action for action, _ in ops] == ["hide"]
+    assert all(queue.dismiss(f"m{i}") == [] for i in range(40))
+    assert queue.visible == [] and queue.queued == []
+    print("  ✅ Closing a digest hides it once, later dismissals are no-ops")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_queueing()
+        test_coalescing()
+        test_burst_digest()
+        print("✅ All popup scheduler tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
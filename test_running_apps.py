@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for running application tracking.
+Loads tracker.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import importlib.util
+
+TRACKER_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "running_apps", "tracker.py",
+)
+
+spec = importlib.util.spec_from_file_location("tracker", TRACKER_FILE)
+tracker = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(tracker)
+RunningTracker = tracker.RunningTracker
+
+CLASSES = {"firefox": "firefox.desktop", "kitty": "kitty.desktop"}
+
+
+def test_running_state():
+    """Only the first open and last close change an app's state."""
+    print("Testing running state...")
+
+    resolved = []
+
+    def resolve(wm_class):
+        resolved.append(wm_class)
+        return CLASSES.get(wm_class)
+
+    running = RunningTracker(resolve)
+    assert running.add_window("0x1", "firefox") == "firefox.desktop"
+    assert running.add_window("0x2", "firefox") is None
+    assert running.add_window("0x2", "firefox") is None
+    assert running.add_window("0x3", "unknown") is None
+    assert running.add_window("0x4", "unknown") is None
+    assert resolved == ["firefox", "unknown"]
+    print("  ✅ Window classes resolved once")
+
+    assert running.is_running("firefox.desktop")
+    assert running.running_apps() == ["firefox.desktop"]
+    assert running.remove_window("0x1") is None
+    assert running.remove_window("0x3") is None
+    assert running.remove_window("0x2") == "firefox.desktop"
+    assert not running.is_running("firefox.desktop")
+    assert running.remove_window("0x9") is None
+    print("  ✅ State changes reported per app")
+    print()
+
+
+def test_focus_and_reresolve():
+    """Windows are kept in focus order and survive re-resolution."""
+    print("Testing focus order...")
+
+    classes = dict(CLASSES)
+    running = RunningTracker(classes.get)
+    for address in ["0x1", "0x2", "0x3"]:
+        running.add_window(address, "kitty")
+    running.add_window("0x4", "code")
+
+    running.focus_window("0x3")
+    assert running.windows("kitty.desktop") == ["0x3", "0x1", "0x2"]
+    running.focus_window("0x4")
+    assert running.app_for_window("0x4") is None
+    print("  ✅ Most recently focused first")
+
+    classes["code"] = "code.desktop"
+    assert running.reresolve() == {"code.desktop"}
+    assert running.is_running("code.desktop")
+    assert len(running.windows("kitty.desktop")) == 3
+    print("  ✅ Newly installed apps picked up")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_running_state()
+        test_focus_and_reresolve()
+        print("✅ All running app tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the transition shader registry.
+Loads shader_registry.py directly so GTK/Ignis are not required.
+"""
+
+import io
+import sys
+import os
+import contextlib
+import tempfile
+import importlib.util
+
+REGISTRY_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "wallpaper_slideshow", "shader_registry.py",
+)
+
+spec = importlib.util.spec_from_file_location("shader_registry", REGISTRY_FILE)
+shader_registry = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(shader_registry)
+
+VALID_SHADER = """#version 330 core
+// @label Test
+// @backends gl cpu
+uniform sampler2D currentTexture;
+uniform sampler2D nextTexture;
+uniform float progress;
+uniform vec2 resolution;
+void main() {}
+"""
+
+
+def test_bundled_shaders():
+    """All bundled shaders load with metadata."""
+    print("Testing bundled shaders...")
+
+    registry = shader_registry.ShaderRegistry()
+    names = registry.names()
+    assert names == ["fade", "pixelate", "slide", "swirl", "wipe", "zoom"], names
+    print(f"  ✅ {len(names)} shaders loaded")
+
+    assert registry.names("swww") == ["fade", "slide", "wipe", "zoom"]
+    assert registry.get("pixelate").swww_type is None
+    assert registry.get("wipe").swww_type == "wipe"
+    assert registry.get("wipe").swww_args == ["--transition-angle", "45"]
+    print("  ✅ swww equivalents declared, none for pixelate/swirl")
+
+    assert registry.get("pixelate").uniforms["resolution"] == "vec2"
+    assert registry.get("fade").label == "Fade"
+    assert registry.get("missing") is None
+    print("  ✅ Uniforms and labels parsed")
+
+    registry = shader_registry.ShaderRegistry(cpu_kernels=["fade"])
+    assert registry.names("cpu") == ["fade"]
+    assert registry.resolve("swirl", "cpu") == "fade"
+    assert registry.resolve("fade", "cpu") == "fade"
+    print("  ✅ CPU backend limited to available kernels")
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for _ in range(5):
+            assert registry.resolve("pixelate", "cpu") == "fade"
+    assert output.getvalue().count("'pixelate'") == 1
+    print("  ✅ Unsupported transitions reported once")
+    print()
+
+
+def test_validation():
+    """Broken shaders are skipped instead of failing the whole registry."""
+    print("Testing validation...")
+
+    info = shader_registry.parse_shader("test", VALID_SHADER)
+    assert info.backends == {"gl", "cpu"} and info.label == "Test"
+    print("  ✅ Valid shader parsed")
+
+    broken = {
+        "no_version": VALID_SHADER.replace("#version 330 core\n", ""),
+        "no_progress": VALID_SHADER.replace("uniform float progress;", ""),
+        "no_main": VALID_SHADER.replace("void main() {}", ""),
+        "bad_backend": VALID_SHADER.replace("gl cpu", "gl vulkan"),
+        "swww_without_type": VALID_SHADER.replace("gl cpu", "gl swww"),
+    }
+    for name, source in broken.items():
+        try:
+            shader_registry.parse_shader(name, source)
+            assert False, f"{name} accepted"
+        except ValueError:
+            pass
+    print(f"  ✅ {len(broken)} invalid shaders rejected")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, source in [("good", VALID_SHADER), *broken.items()]:
+            with open(os.path.join(directory, f"{name}.glsl"), "w") as f:
+                f.write(source)
+        registry = shader_registry.ShaderRegistry(directory)
+        assert registry.names() == ["good"]
+
+        # Loaded once; new files only appear after reload()
+        with open(os.path.join(directory, "later.glsl"), "w") as f:
+            f.write(VALID_SHADER)
+        assert registry.names() == ["good"]
+        registry.reload()
+        assert registry.names() == ["good", "later"]
+    print("  ✅ Directory loaded once, invalid files skipped")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_bundled_shaders()
+        test_validation()
+        print("✅ All shader registry tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
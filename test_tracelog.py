@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the trace log ring buffer.
+Loads tracelog.py directly so GTK/Ignis are not required.
+"""
+
+import io
+import sys
+import os
+import contextlib
+import importlib.util
+
+TRACELOG_FILE = os.path.join(os.path.dirname(__file__), "ignis", "tracelog.py")
+
+spec = importlib.util.spec_from_file_location("tracelog", TRACELOG_FILE)
+tracelog = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(tracelog)
+
+
+def test_levels():
+    """Records below a module's level are dropped; only warnings are echoed."""
+    print("Testing levels...")
+
+    tracelog.clear()
+    tracelog.set_level("*", tracelog.DEBUG)
+    dock = tracelog.get_logger("dock")
+    bar = tracelog.get_logger("bar")
+    assert tracelog.get_logger("dock") is dock
+
+    stderr = io.StringIO()
+    with contextlib.redirect_stderr(stderr):
+        dock.debug("Imported %s", "widgets")
+        bar.info("Created")
+        dock.warning("Pinned app %s missing", "foo.desktop")
+    assert stderr.getvalue().count("\n") == 1
+    assert "WARNING [dock] Pinned app foo.desktop missing" in stderr.getvalue()
+    print("  ✅ Only warnings and errors printed")
+
+    tracelog.set_level("dock", tracelog.OFF)
+    dock.error("hidden")
+    tracelog.set_level("bar", tracelog.WARNING)
+    bar.info("hidden")
+    assert "hidden" not in tracelog.dump()
+    assert tracelog.get_logger("later").level == tracelog.DEBUG
+    print("  ✅ Per-module toggles")
+
+    tracelog.set_level("*", tracelog.INFO)
+    assert dock.level == bar.level == tracelog.INFO
+    tracelog.set_level("*", tracelog.DEBUG)
+    print("  ✅ Wildcard resets every module")
+    print()
+
+
+def test_dump():
+    """Dumps are filtered, formatted lazily and bounded by the ring size."""
+    print("Testing dump...")
+
+    tracelog.clear()
+    log = tracelog.get_logger("launcher")
+    log.debug("query %r", "fire")
+    log.info("bad format %d", "x")
+    tracelog.get_logger("osd").info("shown")
+
+    lines = tracelog.dump().splitlines()
+    assert len(lines) == 3
+    assert lines[0].endswith("DEBUG [launcher] query 'fire'")
+    assert "bad format %d ('x',)" in lines[1]
+    assert tracelog.dump("osd").endswith("[osd] shown")
+    assert tracelog.dump(level=tracelog.INFO).count("\n") == 1
+    print("  ✅ Filtered by module and level")
+
+    assert tracelog._dump_command("launcher", "info").endswith("('x',)")
+    assert tracelog._level_command("osd", "off") == "osd: off"
+    assert tracelog.get_logger("osd").level == tracelog.OFF
+    print("  ✅ IPC commands")
+
+    for i in range(tracelog.RING_SIZE + 10):
+        log.debug("%d", i)
+    lines = tracelog.dump().splitlines()
+    assert len(lines) == tracelog.RING_SIZE
+    assert lines[-1].endswith(str(tracelog.RING_SIZE + 9))
+    print("  ✅ Oldest records dropped")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_levels()
+        test_dump()
+        print("✅ All trace log tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test and benchmark script for the CPU wallpaper transition engine.
+Loads transitions.py and frame_stats.py directly so GTK/Ignis are not required.
+
+Run directly to print frames per second for every effect at 1080p and 4K.
+"""
+
+import sys
+import os
+import time
+import importlib.util
+
+try:
+    import numpy as np
+    import PIL  # noqa: F401
+except ImportError:
+    np = None
+
+SERVICE_DIR = os.path.join(
+    os.path.dirname(__file__), "ignis", "services", "wallpaper_slideshow"
+)
+TRANSITIONS_FILE = os.path.join(SERVICE_DIR, "transitions.py")
+FRAME_STATS_FILE = os.path.join(SERVICE_DIR, "frame_stats.py")
+
+spec = importlib.util.spec_from_file_location("frame_stats", FRAME_STATS_FILE)
+frame_stats = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(frame_stats)
+
+transitions = None
+if np is not None:
+    spec = importlib.util.spec_from_file_location("transitions", TRANSITIONS_FILE)
+    transitions = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(transitions)
+
+RESOLUTIONS = {"1080p": (1920, 1080), "4K": (3840, 2160)}
+BENCHMARK_FRAMES = 30
+
+
+def solid(width, height, value):
+    return np.full((height, width, 3), value, dtype=np.uint8)
+
+
+def gradient(width, height):
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[..., 0] = x[np.newaxis, :]
+    frame[..., 1] = y[:, np.newaxis]
+    frame[..., 2] = 128
+    return frame
+
+
+def test_kernel_endpoints():
+    """Every effect starts on the current frame and ends on the next one."""
+    if transitions is None:
+        print("NumPy/Pillow not installed, skipping transition tests")
+        return
+    print("Testing effect endpoints...")
+
+    current, next_frame = gradient(64, 36), solid(64, 36, 200)
+    engine = transitions.TransitionEngine(current, next_frame)
+
+    for effect in transitions.KERNELS:
+        assert np.array_equal(engine.render(effect, 0.0), current), effect
+        assert np.array_equal(engine.render(effect, 1.0), next_frame), effect
+    print(f"  ✅ {len(transitions.KERNELS)} effects hit both endpoints")
+    print()
+
+
+def test_kernel_shapes():
+    """Spot-check effects against their shader definitions."""
+    if transitions is None:
+        print("NumPy/Pillow not installed, skipping transition tests")
+        return
+    print("Testing effect shapes...")
+
+    engine = transitions.TransitionEngine(solid(100, 10, 0), solid(100, 10, 255))
+
+    frame = engine.render("fade", 0.5)
+    assert np.all(frame == 127), frame[0, 0]
+    print("  ✅ Fade blends in fixed point")
+
+    frame = engine.render("slide", 0.25)
+    assert np.all(frame[:, :75] == 0) and np.all(frame[:, 75:] == 255)
+    print("  ✅ Slide reveals next frame from the right")
+
+    frame = engine.render("wipe", 0.5)
+    assert frame[0, 0, 0] == 255 and frame[-1, -1, 0] == 0
+    print("  ✅ Wipe moves from top-left to bottom-right")
+
+    frame = engine.render("unknown", 0.5)
+    assert np.all(frame == 127)
+    print("  ✅ Unknown effects fall back to fade")
+
+    engine = transitions.TransitionEngine(gradient(200, 100), gradient(200, 100))
+    frame = engine.render("pixelate", 0.5)
+    assert np.array_equal(frame[:50, :50], np.broadcast_to(frame[0, 0], (50, 50, 3)))
+    print("  ✅ Pixelate uses 50px blocks mid-way")
+
+    try:
+        transitions.TransitionEngine(solid(10, 10, 0), solid(20, 10, 0))
+        assert False, "mismatched sizes accepted"
+    except ValueError:
+        print("  ✅ Mismatched frame sizes rejected")
+    print()
+
+
+def test_frame_stats():
+    """Frame times land in histogram buckets and late frames count as dropped."""
+    print("Testing frame statistics...")
+
+    stats = frame_stats.FrameStats("fade", 1000.0 / 60)
+    assert stats.fps is None and stats.summary() == "fade: no frames"
+
+    for frame_time in [16.7, 16.6, 16.8, 50.0, 120.0]:
+        stats.record(frame_time)
+
+    histogram = stats.histogram()
+    assert histogram["<=16.7ms"] == 2
+    assert histogram["<=33.3ms"] == 1
+    assert histogram["<=50.0ms"] == 1
+    assert histogram[">100.0ms"] == 1
+    assert sum(histogram.values()) == stats.frames == 5
+    print("  ✅ Histogram buckets")
+
+    # 50ms skips two 60 FPS frames, 120ms skips six
+    assert stats.dropped == 8, stats.dropped
+    assert stats.worst == 120.0
+    assert abs(stats.average - 44.02) < 0.01
+    print("  ✅ Dropped frames, worst and average frame time")
+    print()
+
+
+def benchmark():
+    """Print frames per second for every effect at each resolution."""
+    for label, (width, height) in RESOLUTIONS.items():
+        engine = transitions.TransitionEngine(gradient(width, height), solid(width, height, 40))
+        print(f"{label} ({width}x{height}):")
+
+        for effect in transitions.KERNELS:
+            engine.render(effect, 0.5)  # build cached grids
+
+            start = time.perf_counter()
+            for i in range(BENCHMARK_FRAMES):
+                engine.render(effect, (i + 1) / (BENCHMARK_FRAMES + 1))
+            elapsed = time.perf_counter() - start
+
+            fps = BENCHMARK_FRAMES / elapsed
+            print(f"  {effect:<10} {fps:7.1f} fps  ({elapsed / BENCHMARK_FRAMES * 1000:6.1f} ms/frame)")
+        print()
+
+
+if __name__ == "__main__":
+    try:
+        test_kernel_endpoints()
+        test_kernel_shapes()
+        test_frame_stats()
+        print("✅ All transition tests passed!")
+        print()
+        if transitions is not None:
+            benchmark()
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
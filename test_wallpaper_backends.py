@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for wallpaper backends.
+Loads backends.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import asyncio
+import importlib.util
+
+BACKENDS_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "wallpaper_slideshow", "backends.py",
+)
+
+spec = importlib.util.spec_from_file_location("backends", BACKENDS_FILE)
+backends = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(backends)
+
+
+class RecordingBackend(backends.WallpaperBackend):
+    """Backend that records applied wallpapers instead of running swww."""
+
+    name = "recording"
+
+    def __init__(self):
+        super().__init__()
+        self.applied = []
+
+    async def apply(self, request):
+        await asyncio.sleep(0.01)
+        self.applied.append(request.path)
+        return request.path != "broken.png"
+
+
+def test_command_line():
+    """swww is executed without a shell, so paths are passed verbatim."""
+    print("Testing swww command line...")
+
+    backend = backends.SwwwBackend()
+    request = backends.WallpaperRequest(
+        "/home/me/My Pictures/$HOME;rm.png",
+        transition_type="wipe",
+        transition_args=["--transition-angle", "45"],
+    )
+    argv = backend.build_command(request)
+    assert argv[:2] == ["swww", "img"]
+    assert argv[-2:] == ["--", "/home/me/My Pictures/$HOME;rm.png"]
+    assert argv[argv.index("--transition-type") + 1] == "wipe"
+    assert "--transition-angle" in argv
+    print("  ✅ Path passed as a single argument")
+
+    request = backends.WallpaperRequest(
+        "/walls/a.png",
+        outputs={"DP-1": "/cache/a-4k.png", "DP-2": "/cache/a-4k.png", "HDMI-A-1": "/walls/a.png"},
+    )
+    commands = backend.build_commands(request)
+    assert len(commands) == 2
+    assert commands[0][-4:] == ["--outputs", "DP-1,DP-2", "--", "/cache/a-4k.png"]
+    assert commands[1][-4:] == ["--outputs", "HDMI-A-1", "--", "/walls/a.png"]
+    print("  ✅ One command per distinct output image")
+    print()
+
+
+def test_coalescing():
+    """Requests made while one is applied collapse to the latest."""
+    print("Testing request coalescing...")
+
+    async def run():
+        backend = RecordingBackend()
+        done = []
+        for name in ["a.png", "b.png", "c.png", "d.png"]:
+            backend.submit(
+                backends.WallpaperRequest(name),
+                lambda request, success: done.append((request.path, success)),
+            )
+            # let the first request start before the burst
+            if name == "a.png":
+                await asyncio.sleep(0)
+        while backend.busy:
+            await asyncio.sleep(0.005)
+        return backend, done
+
+    backend, done = asyncio.run(run())
+    assert backend.applied == ["a.png", "d.png"], backend.applied
+    assert done == [("a.png", True), ("d.png", True)], done
+    print("  ✅ In-flight request finished, only the latest one followed")
+
+    async def run_failure():
+        backend = RecordingBackend()
+        done = []
+        backend.submit(
+            backends.WallpaperRequest("broken.png"),
+            lambda request, success: done.append(success),
+        )
+        while backend.busy:
+            await asyncio.sleep(0.005)
+        return done
+
+    assert asyncio.run(run_failure()) == [False]
+    print("  ✅ Failures reported to the callback")
+
+    class Incomplete(backends.WallpaperBackend):
+        name = "incomplete"
+
+    try:
+        Incomplete()
+        assert False, "missing apply() should fail at construction"
+    except TypeError:
+        pass
+    print("  ✅ Missing apply() fails at construction")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_command_line()
+        test_coalescing()
+        print("✅ All wallpaper backend tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
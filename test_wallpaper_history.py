@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the wallpaper history structure.
+Loads history.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import importlib.util
+
+HISTORY_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "wallpaper_slideshow", "history.py",
+)
+
+spec = importlib.util.spec_from_file_location("history", HISTORY_FILE)
+history = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(history)
+WallpaperHistory = history.WallpaperHistory
+
+
+def test_move_to_front_and_neighbours():
+    """Pushing moves entries to the front and keeps them unique."""
+    print("Testing move-to-front...")
+
+    h = WallpaperHistory(10)
+    for path in ["a", "b", "c"]:
+        h.push(path)
+    assert h.to_list() == ["c", "b", "a"]
+
+    h.push("a")
+    assert h.to_list() == ["a", "c", "b"]
+    assert len(h) == 3
+    print("  ✅ Existing entry moved to front without duplicates")
+
+    assert h.older("a") == "c"
+    assert h.older("b") is None
+    assert h.newer("c") == "a"
+    assert h.older("missing") is None
+    print("  ✅ Neighbour lookups")
+
+    assert h.remove("c")
+    assert h.to_list() == ["a", "b"]
+    assert h.older("a") == "b"
+    print("  ✅ Removal relinks neighbours")
+    print()
+
+
+def test_capacity():
+    """Oldest entries are evicted and capacity can change at runtime."""
+    print("Testing capacity...")
+
+    h = WallpaperHistory(3, ["d", "c", "b", "a"])
+    assert h.to_list() == ["d", "c", "b"]
+    print("  ✅ Loaded history trimmed to capacity")
+
+    h.push("e")
+    assert h.to_list() == ["e", "d", "c"]
+    print("  ✅ Oldest entry evicted on push")
+
+    h.set_capacity(1)
+    assert h.to_list() == ["e"]
+    h.set_capacity(500)
+    for i in range(400):
+        h.push(str(i))
+    assert len(h) == 401
+    assert h.newest == "399"
+    print("  ✅ Capacity shrinks and grows beyond the default")
+
+    h.clear()
+    assert h.to_list() == [] and h.newest is None
+    h.push("x")
+    assert h.to_list() == ["x"]
+    print("  ✅ Clear resets the list")
+    print()
+
+
+def test_duplicate_entries_on_load():
+    """Duplicates in a persisted file keep their most recent position."""
+    print("Testing duplicate entries on load...")
+
+    h = WallpaperHistory(10, ["a", "b", "a", "c"])
+    assert h.to_list() == ["a", "b", "c"]
+    print("  ✅ Duplicates collapsed")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_move_to_front_and_neighbours()
+        test_capacity()
+        test_duplicate_entries_on_load()
+        print("✅ All wallpaper history tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
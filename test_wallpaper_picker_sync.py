@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental wallpaper picker model updates.
+Loads model_sync.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import random
+import importlib.util
+
+MODEL_SYNC_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "modules", "wallpaper_picker", "model_sync.py",
+)
+
+spec = importlib.util.spec_from_file_location("model_sync", MODEL_SYNC_FILE)
+model_sync = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(model_sync)
+model_splices = model_sync.model_splices
+
+
+def apply_splices(model, splices):
+    """Apply splices the way Gtk.StringList.splice does."""
+    items = list(model)
+    for position, n_removals, additions in splices:
+        items[position:position + n_removals] = additions
+    return items
+
+
+def test_scan_batches():
+    """Streamed scan batches splice in only the new paths."""
+    print("Testing scan batches...")
+
+    shown = [f"/walls/{i:04d}.png" for i in range(0, 1000, 2)]
+    assert model_splices(shown, shown) == []
+    print("  ✅ Unchanged queue produces no splices")
+
+    queue = sorted(shown + ["/walls/0001.png", "/walls/0003.png", "/walls/5000.png"])
+    splices = model_splices(shown, queue)
+    assert splices == [
+        (1, 0, ["/walls/0001.png"]),
+        (3, 0, ["/walls/0003.png"]),
+        (502, 0, ["/walls/5000.png"]),
+    ]
+    assert apply_splices(shown, splices) == queue
+    print("  ✅ Inserts touch only their own positions")
+
+    queue = [path for path in shown if path != "/walls/0010.png"]
+    assert model_splices(shown, queue) == [(5, 1, [])]
+    print("  ✅ A removal is a single splice")
+    print()
+
+
+def test_reorder_and_random_edits():
+    """Reordered queues need a full replace; other edits reconcile."""
+    print("Testing reorders and random edits...")
+
+    assert model_splices(["a", "b", "c"], ["c", "a", "b"]) is None
+    print("  ✅ Shuffled queue requests a full replace")
+
+    rng = random.Random(3)
+    paths = [f"/walls/{i}.png" for i in range(40)]
+    for _ in range(2000):
+        shown = sorted(rng.sample(paths, rng.randint(0, 30)))
+        queue = sorted(rng.sample(paths, rng.randint(0, 30)))
+        assert apply_splices(shown, model_splices(shown, queue)) == queue, (shown, queue)
+    print("  ✅ 2000 random sorted edits reconciled")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_scan_batches()
+        test_reorder_and_random_edits()
+        print("✅ All wallpaper picker sync tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
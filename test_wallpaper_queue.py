@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for the incremental wallpaper queue.
+Loads wallpaper_queue.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import importlib.util
+
+QUEUE_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "wallpaper_slideshow", "wallpaper_queue.py",
+)
+
+spec = importlib.util.spec_from_file_location("wallpaper_queue", QUEUE_FILE)
+wallpaper_queue = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(wallpaper_queue)
+WallpaperQueue = wallpaper_queue.WallpaperQueue
+
+
+def _paths(*names: str) -> list[str]:
+    return [f"/walls/{name}.png" for name in names]
+
+
+def test_sorted_deltas_keep_position():
+    """Additions and removals keep the current wallpaper selected."""
+    print("Testing sorted queue deltas...")
+
+    queue = WallpaperQueue()
+    queue.reset(_paths("b", "d", "f"))
+    queue.advance()
+    assert queue.current == "/walls/d.png"
+
+    # Insert before and after the current entry
+    assert queue.apply_changes(added=_paths("a", "e"))
+    assert queue.to_list() == _paths("a", "b", "d", "e", "f")
+    assert queue.current == "/walls/d.png"
+    print("  ✅ Inserts keep current wallpaper")
+
+    # Remove an entry before the current one
+    assert queue.apply_changes(removed=_paths("a"))
+    assert queue.current == "/walls/d.png"
+    print("  ✅ Removals before current shift the index")
+
+    # Remove the current entry: its successor comes up next
+    assert queue.apply_changes(removed=_paths("d"))
+    assert queue.peek() == "/walls/e.png"
+    assert queue.advance() == "/walls/e.png"
+    print("  ✅ Removing current makes its successor next")
+
+    # Unknown removals and duplicate additions are no-ops
+    assert not queue.apply_changes(added=_paths("b"), removed=_paths("zzz"))
+    print("  ✅ No-op batches report no change")
+    print()
+
+
+def test_remove_current_then_advance():
+    """The successor of a removed current entry is not skipped."""
+    print("Testing removal of the current entry...")
+
+    # Sorted: entries merged before the removed one must not shift it
+    queue = WallpaperQueue()
+    queue.reset(_paths("b", "d", "f"))
+    queue.advance()
+    assert queue.apply_changes(added=_paths("a", "c"), removed=_paths("d"))
+    assert queue.advance() == "/walls/f.png"
+    print("  ✅ Sorted queue advances to the successor")
+
+    # Removing the last entry wraps around to the first
+    queue.reset(_paths("a", "b", "c"))
+    queue.advance(2)
+    assert queue.apply_changes(removed=_paths("c"))
+    assert queue.advance() == "/walls/a.png"
+    print("  ✅ Removing the last entry wraps around")
+
+    # Shuffled: the entry that followed the removed one comes next
+    queue.reset(_paths(*"abcdefgh"), shuffle=True)
+    queue.advance(3)
+    order = queue.to_list()
+    assert queue.apply_changes(removed=[order[3]])
+    assert queue.advance() == order[4]
+    print("  ✅ Shuffled queue advances to the successor")
+    print()
+
+
+def test_shuffled_inserts_after_current():
+    """New files in a shuffled queue are scheduled after the current one."""
+    print("Testing shuffled queue inserts...")
+
+    queue = WallpaperQueue()
+    queue.reset(_paths(*"abcdefgh"), shuffle=True)
+    queue.advance(3)
+    current = queue.current
+
+    new = _paths(*(f"new{i}" for i in range(50)))
+    assert queue.apply_changes(added=new)
+    assert queue.current == current
+    assert queue.to_list().index(current) == queue.index
+    assert all(queue.to_list().index(path) > queue.index for path in new)
+    print("  ✅ All new entries land after the current entry")
+    print()
+
+
+def test_burst_and_empty():
+    """A large batch applies once and emptying the queue is safe."""
+    print("Testing burst batches...")
+
+    queue = WallpaperQueue()
+    queue.reset([])
+    burst = _paths(*(f"{i:03d}" for i in range(200)))
+    assert queue.apply_changes(added=burst)
+    assert len(queue) == 200
+    assert queue.index == 0
+
+    assert queue.apply_changes(removed=burst)
+    assert len(queue) == 0
+    assert queue.current is None
+    assert queue.advance() is None
+    print("  ✅ 200-file burst applied in one batch")
+    print("  ✅ Empty queue handled")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_sorted_deltas_keep_position()
+        test_remove_current_then_advance()
+        test_shuffled_inserts_after_current()
+        test_burst_and_empty()
+        print("✅ All wallpaper queue tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
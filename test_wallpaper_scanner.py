@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for the wallpaper folder scanner.
+Loads scanner.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import tempfile
+import importlib.util
+
+SCANNER_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "wallpaper_slideshow", "scanner.py",
+)
+
+spec = importlib.util.spec_from_file_location("scanner", SCANNER_FILE)
+scanner = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(scanner)
+
+
+def _make_tree(root: str) -> None:
+    files = [
+        "a.png",
+        "b.jpg",
+        "notes.txt",
+        "nature/forest.png",
+        "nature/deep/lake.webp",
+        "private/secret.png",
+        "other/c.PNG",
+    ]
+    for name in files:
+        path = os.path.join(root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+
+
+def _scan(sources, **kwargs) -> tuple[list[str], list[str]]:
+    files, directories = [], []
+    for batch in scanner.scan_sources(sources, **kwargs):
+        files.extend(batch.files)
+        directories.extend(batch.directories)
+    return sorted(files), sorted(directories)
+
+
+def _relative(root: str, paths: list[str]) -> list[str]:
+    return sorted(os.path.relpath(path, root) for path in paths)
+
+
+def test_flat_and_recursive():
+    """Flat scans stay in the root, recursive scans walk subfolders."""
+    print("Testing flat and recursive scans...")
+
+    with tempfile.TemporaryDirectory() as root:
+        _make_tree(root)
+
+        files, directories = _scan(scanner.WallpaperSources([root]))
+        assert _relative(root, files) == ["a.png", "b.jpg"]
+        assert directories == [root]
+        print("  ✅ Flat scan only lists root images")
+
+        files, directories = _scan(scanner.WallpaperSources([root], recursive=True))
+        assert _relative(root, files) == [
+            "a.png",
+            "b.jpg",
+            "nature/deep/lake.webp",
+            "nature/forest.png",
+            "other/c.PNG",
+            "private/secret.png",
+        ]
+        assert len(directories) == 5
+        print("  ✅ Recursive scan lists all images and directories")
+    print()
+
+
+def test_filters():
+    """Include patterns filter files, exclude patterns prune folders."""
+    print("Testing include/exclude globs...")
+
+    with tempfile.TemporaryDirectory() as root:
+        _make_tree(root)
+
+        sources = scanner.WallpaperSources(
+            [root], recursive=True, include=["*.png"], exclude=["private"]
+        )
+        files, directories = _scan(sources)
+        assert _relative(root, files) == ["a.png", "nature/forest.png"]
+        assert os.path.join(root, "private") not in directories
+        print("  ✅ Include/exclude patterns applied")
+
+        sources = scanner.WallpaperSources([root], recursive=True, include=["nature/*"])
+        files, _ = _scan(sources)
+        assert _relative(root, files) == ["nature/deep/lake.webp", "nature/forest.png"]
+        assert sources.accepts_file(os.path.join(root, "nature", "new.png"))
+        assert not sources.accepts_file(os.path.join(root, "new.png"))
+        print("  ✅ Relative path patterns match")
+    print()
+
+
+def test_batches_and_roots():
+    """Results stream in batches, overlapping roots and loops are handled."""
+    print("Testing batching and multiple roots...")
+
+    with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+        for i in range(25):
+            open(os.path.join(first, f"{i:02d}.png"), "w").close()
+        open(os.path.join(second, "x.png"), "w").close()
+        os.symlink(first, os.path.join(first, "loop"))
+
+        sources = scanner.WallpaperSources([first, second, first], recursive=True)
+        assert len(sources.roots) == 2
+
+        batches = list(scanner.scan_sources(sources, batch_size=10))
+        assert len(batches) >= 3
+        files = [path for batch in batches for path in batch.files]
+        assert len(files) == 26
+        print(f"  ✅ 26 files streamed in {len(batches)} batches without looping")
+
+        cancelled = list(scanner.scan_sources(sources, is_cancelled=lambda: True))
+        assert cancelled == []
+        print("  ✅ Cancelled scan yields nothing")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_flat_and_recursive()
+        test_filters()
+        test_batches_and_roots()
+        print("✅ All wallpaper scanner tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
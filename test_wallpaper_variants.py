@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for per-monitor wallpaper variants.
+Loads variants.py directly so GTK/Ignis are not required.
+"""
+
+import sys
+import os
+import tempfile
+import importlib.util
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+VARIANTS_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "ignis", "services", "wallpaper_slideshow", "variants.py",
+)
+
+variants = None
+if Image is not None:
+    spec = importlib.util.spec_from_file_location("variants", VARIANTS_FILE)
+    variants = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(variants)
+
+
+def test_fit_modes():
+    """Every fit mode produces exactly the monitor size."""
+    if variants is None:
+        print("Pillow not installed, skipping variant tests")
+        return
+    print("Testing fit modes...")
+
+    image = Image.new("RGB", (400, 100), (255, 0, 0))
+    for fit_mode in variants.FIT_MODES:
+        result = variants.render_variant(image, (200, 200), fit_mode)
+        assert result.size == (200, 200), (fit_mode, result.size)
+    print(f"  ✅ {len(variants.FIT_MODES)} modes render at monitor size")
+
+    fitted = variants.render_variant(image, (200, 200), "fit")
+    assert fitted.getpixel((100, 0)) == variants.BACKGROUND_COLOR
+    assert fitted.getpixel((100, 100)) == (255, 0, 0)
+    filled = variants.render_variant(image, (200, 200), "fill")
+    assert filled.getpixel((100, 0)) == (255, 0, 0)
+    print("  ✅ Fit letterboxes, fill covers")
+    print()
+
+
+def test_cache_and_eviction():
+    """Variants are created once per size and evicted by queue order."""
+    if variants is None:
+        print("Pillow not installed, skipping variant tests")
+        return
+    print("Testing variant cache...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        sources = []
+        for i in range(4):
+            path = os.path.join(directory, f"wall {i}.png")
+            Image.new("RGB", (64, 48), (i * 60, 0, 0)).save(path)
+            sources.append(path)
+
+        cache = variants.WallpaperVariants(os.path.join(directory, "variants"), max_sources=2)
+        sizes = [(32, 32), (16, 9), (32, 32)]
+
+        created = cache.ensure(sources[0], sizes, "fill")
+        assert set(created) == {(32, 32), (16, 9)}
+        for size, path in created.items():
+            with Image.open(path) as img:
+                assert img.size == size
+        assert cache.get(sources[0], (16, 9), "fill") == created[(16, 9)]
+        assert cache.get(sources[0], (16, 9), "fit") is None
+        print("  ✅ One variant per distinct size")
+
+        mtime = os.path.getmtime(created[(32, 32)])
+        assert cache.ensure(sources[0], sizes, "fill") == created
+        assert os.path.getmtime(created[(32, 32)]) == mtime
+        print("  ✅ Existing variants reused")
+
+        for path in sources[1:]:
+            cache.ensure(path, sizes, "fill")
+        cache.retain([sources[2], sources[3], sources[0]])
+        kept = [path for path in sources if cache.get(path, (32, 32), "fill")]
+        assert kept == [sources[2], sources[3]], kept
+        print("  ✅ Only the first wallpapers in queue order kept")
+
+        os.utime(sources[2], ns=(0, 0))
+        assert cache.get(sources[2], (32, 32), "fill") is None
+        print("  ✅ Changed source invalidates its variants")
+    print()
+
+
+if __name__ == "__main__":
+    try:
+        test_fit_modes()
+        test_cache_and_eviction()
+        print("✅ All wallpaper variant tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)